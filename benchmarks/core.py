@@ -0,0 +1,229 @@
+"""Benchmarks for the game core and AI hot paths.
+
+Each benchmark is timed on a calibrated number of operations, several
+times over, and the best run is kept (microseconds per operation). Rounds
+are interleaved across benchmarks so a burst of background load does not
+land on just one of them. Results can be written to JSON and compared with
+a stored baseline; a benchmark that got slower than the baseline by more
+than --threshold fails the run. Comparisons are made relative to a plain
+Python reference loop timed in the same run, which cancels out a machine
+that is uniformly faster or slower than the one that wrote the baseline.
+
+    python benchmarks/core.py --output results.json
+    python benchmarks/core.py --baseline benchmarks/baseline.json --threshold 0.25
+    python benchmarks/core.py --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from game.ai import AI  # noqa: E402
+from game.board import Board  # noqa: E402
+from game.simulation import EXPERT_SAMPLES, play_game, random_board  # noqa: E402
+
+SEED = 20251019
+CELLS = [(r, c) for r in range(10) for c in range(10)]
+REFERENCE = "reference.loop"
+
+
+# each benchmark takes (n, rng), does its own untimed setup and returns the
+# seconds spent on n operations
+def bench_reference(n, rng):
+    # interpreter speed yardstick: dict and tuple work similar to the game's
+    cells = {cell: i for i, cell in enumerate(CELLS)}
+    started = time.perf_counter()
+    total = 0
+    for i in range(n):
+        total += cells[CELLS[i % 100]]
+    return time.perf_counter() - started
+
+
+def bench_receive_shot(n, rng):
+    boards = [random_board(rng) for _ in range(n // len(CELLS) + 1)]
+    order = CELLS[:]
+    rng.shuffle(order)
+    shots = [(board, cell) for board in boards for cell in order][:n]
+    started = time.perf_counter()
+    for board, cell in shots:
+        board.receive_shot(cell)
+    return time.perf_counter() - started
+
+
+def bench_is_valid_guess(n, rng):
+    board = random_board(rng)
+    for cell in rng.sample(CELLS, 50):
+        board.receive_shot(cell)
+    cells = (CELLS * (n // len(CELLS) + 1))[:n]
+    started = time.perf_counter()
+    for row, col in cells:
+        board.is_valid_guess(row, col)
+    return time.perf_counter() - started
+
+
+def bench_place_ships_randomly(n, rng):
+    boards = [Board(rng=rng) for _ in range(n)]
+    started = time.perf_counter()
+    for board in boards:
+        try:
+            board.place_ships_randomly()
+        except RuntimeError:
+            pass
+    return time.perf_counter() - started
+
+
+def _bench_make_guess(difficulty, **options):
+    def bench(n, rng):
+        # only make_guess is timed; firing the shot and recording it is not
+        spent = 0.0
+        done = 0
+        while done < n:
+            board = random_board(rng)
+            ai = AI(board, difficulty=difficulty, rng=rng, **options)
+            while done < n and not board.all_ships_sunk():
+                started = time.perf_counter()
+                guess = ai.make_guess()
+                spent += time.perf_counter() - started
+                result, _ = board.receive_shot(guess)
+                ai.record_result(guess, result)
+                done += 1
+        return spent
+    return bench
+
+
+def _bench_game(difficulties):
+    def bench(n, rng):
+        seeds = [rng.randrange(1 << 30) for _ in range(n)]
+        started = time.perf_counter()
+        for seed in seeds:
+            play_game(seed, difficulties)
+        return time.perf_counter() - started
+    return bench
+
+
+BENCHMARKS = {
+    REFERENCE: bench_reference,
+    "board.receive_shot": bench_receive_shot,
+    "board.is_valid_guess": bench_is_valid_guess,
+    "board.place_ships_randomly": bench_place_ships_randomly,
+    "ai.make_guess[Easy]": _bench_make_guess("Easy"),
+    "ai.make_guess[Medium]": _bench_make_guess("Medium"),
+    "ai.make_guess[Hard]": _bench_make_guess("Hard"),
+    # a fixed sample count instead of the clock, so the work per move is repeatable
+    "ai.make_guess[Expert]": _bench_make_guess("Expert", budget_ms=None, samples=EXPERT_SAMPLES),
+    "ai.make_guess[Adaptive]": _bench_make_guess("Adaptive", strength=0.5),
+    "game[Easy-vs-Hard]": _bench_game(("Easy", "Hard")),
+    "game[Hard-vs-Hard]": _bench_game(("Hard", "Hard")),
+}
+
+# seconds per timed run for benchmarks whose single operation is slow, so a
+# run still averages over enough moves to be stable
+MIN_TIME = {
+    "ai.make_guess[Expert]": 2.0,
+    "ai.make_guess[Adaptive]": 1.0,
+}
+
+
+def calibrate(bench, min_time=0.1, seed=SEED):
+    """Operations needed for one run to take at least `min_time`, and that run's time."""
+    n = 1
+    while True:
+        elapsed = bench(n, random.Random(seed))
+        if elapsed >= min_time or n >= 1 << 24:
+            return n, elapsed
+        n *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+
+def run(names=None, repeat=5, min_time=0.1):
+    selected = [name for name in BENCHMARKS if not names or name in names or name == REFERENCE]
+    sizes = {}
+    best = {}
+    for name in selected:
+        sizes[name], best[name] = calibrate(BENCHMARKS[name], max(min_time, MIN_TIME.get(name, 0)))
+    for i in range(1, repeat):
+        for name in selected:
+            best[name] = min(best[name], BENCHMARKS[name](sizes[name], random.Random(SEED + i)))
+    results = {name: {"us_per_op": best[name] / sizes[name] * 1e6, "ops": sizes[name]} for name in selected}
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": results,
+    }
+
+
+def ratios(report, baseline):
+    """Current / baseline time per benchmark, scaled by the reference loop when both have it."""
+    old_results = baseline.get("benchmarks", {})
+    scale = 1.0
+    if REFERENCE in report["benchmarks"] and REFERENCE in old_results:
+        scale = old_results[REFERENCE]["us_per_op"] / report["benchmarks"][REFERENCE]["us_per_op"]
+    out = {}
+    for name, result in report["benchmarks"].items():
+        old = old_results.get(name)
+        if old and name != REFERENCE:
+            out[name] = result["us_per_op"] / old["us_per_op"] * scale
+    return out
+
+
+def compare(report, baseline, threshold):
+    """Benchmarks that regressed: [(name, baseline_us, current_us, normalized ratio)]."""
+    regressions = []
+    old_results = baseline.get("benchmarks", {})
+    for name, ratio in ratios(report, baseline).items():
+        old = old_results[name]
+        result = report["benchmarks"][name]
+        if ratio > 1.0 + threshold:
+            regressions.append((name, old["us_per_op"], result["us_per_op"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Battleship game core")
+    parser.add_argument("names", nargs="*", help="only run these benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per timed run (at least MIN_TIME for slow benchmarks)")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write results as the new baseline")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error("unknown benchmark(s): " + ", ".join(unknown))
+    report = run(args.names, args.repeat, args.min_time)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+
+    relative = ratios(report, baseline) if baseline is not None else {}
+    for name, result in report["benchmarks"].items():
+        line = f"{name:28s} {result['us_per_op']:12.2f} us/op"
+        if name in relative:
+            line += f"   {relative[name]:6.2f}x baseline"
+        print(line)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as fh:
+                json.dump(report, fh, indent=2)
+                fh.write("\n")
+
+    if baseline is not None:
+        regressions = compare(report, baseline, args.threshold)
+        for name, old, new, ratio in regressions:
+            print(f"REGRESSION {name}: {old:.2f} -> {new:.2f} us/op ({ratio:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Replay a recorded game script against the real UI and report input-to-paint latency.
+
+Record a script by playing normally:
+
+    python src/main.py --record game.json --seed 7
+
+then replay it under a display (an Xvfb server is started when none is set):
+
+    python benchmarks/replay.py game.json --seed 7 --output latency.json
+
+Each click or key press is generated on the widget it was recorded on and
+timed until the redraw it caused has been flushed. Use the same --seed as
+the recording so the AI places and fires the same way. --speed 0 replays as
+fast as the app goes idle instead of on the recorded schedule. Exits
+non-zero when any target's p95 exceeds --max-p95-ms.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from soak import virtual_display  # noqa: E402
+
+
+def run(path, speed, seed):
+    import tkinter as tk
+    import main as entry
+    from game.habits import HabitStore
+    from gui import playback
+
+    events = playback.load(path)
+    random.seed(seed)
+    root = tk.Tk()
+    root.title("Battleship")
+    # an empty in-memory habit store, as main.py --record uses
+    entry.StartWindow(root, HabitStore(path=None))
+    root.update()
+    player = playback.Player(root, speed=speed)
+    try:
+        player.play(events)
+    finally:
+        try:
+            root.destroy()
+        except tk.TclError:
+            pass    # the script clicked Exit
+    return {"script": path, "actions": player.results, "summary": player.summary()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded Battleship session and time each action")
+    parser.add_argument("script", help="JSON script written by main.py --record")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed (0: as fast as possible)")
+    parser.add_argument("--seed", type=int, default=0, help="seed used when the script was recorded")
+    parser.add_argument("--xvfb", action="store_true", help="start Xvfb even if $DISPLAY is set")
+    parser.add_argument("--output", help="write per-action latencies as JSON")
+    parser.add_argument("--max-p95-ms", type=float, help="fail when a target's p95 latency exceeds this")
+    args = parser.parse_args(argv)
+
+    with virtual_display(force=args.xvfb):
+        report = run(args.script, args.speed, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+    failed = False
+    for role, stats in report["summary"].items():
+        flag = ""
+        if args.max_p95_ms is not None and stats["p95"] > args.max_p95_ms:
+            flag = "  SLOW"
+            failed = True
+        print(f"{role:14s} n={stats['count']:4d}  p50 {stats['p50']:7.2f} ms  "
+              f"p95 {stats['p95']:7.2f} ms  max {stats['max']:7.2f} ms{flag}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""Long-session soak test for the desktop game.
+
+Drives the real App through placement -> play -> reset cycles under a
+display (an Xvfb server is started when none is set), with animations and
+timed pauses switched off. Every few cycles it records canvas item counts,
+Tk images, pending `after` callbacks, open Toplevels, RSS and tracemalloc's
+traced memory, then reports the growth per cycle (least-squares slope after
+warm-up) and the allocation sites that grew the most.
+
+    python benchmarks/soak.py --cycles 2000 --every 50 --output soak.json
+
+Every --modal-every cycles the start modal is opened and closed (alternately
+applied and dismissed) to cover the Toplevel path. Exits non-zero when a
+count grows faster than --max-items-per-cycle or memory faster than
+--max-kib-per-cycle.
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+STEP_TIMEOUT = 30.0    # seconds a single wait may take before the soak gives up
+
+
+@contextlib.contextmanager
+def virtual_display(force=False):
+    """Use $DISPLAY, or start Xvfb on a free display number for the duration."""
+    if os.environ.get("DISPLAY") and not force:
+        yield os.environ["DISPLAY"]
+        return
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise SystemExit("no $DISPLAY and Xvfb is not installed")
+    number = next(n for n in range(99, 200) if not os.path.exists(f"/tmp/.X11-unix/X{n}"))
+    proc = subprocess.Popen([xvfb, f":{number}", "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10.0
+        while not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            if proc.poll() is not None or time.monotonic() > deadline:
+                raise SystemExit("Xvfb did not start")
+            time.sleep(0.05)
+        old = os.environ.get("DISPLAY")
+        os.environ["DISPLAY"] = f":{number}"
+        try:
+            yield os.environ["DISPLAY"]
+        finally:
+            if old is None:
+                os.environ.pop("DISPLAY", None)
+            else:
+                os.environ["DISPLAY"] = old
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def slope(xs, ys):
+    """Least-squares growth of ys per unit of xs."""
+    n = len(xs)
+    if n < 2:
+        return 0.0
+    mx = sum(xs) / n
+    my = sum(ys) / n
+    var = sum((x - mx) ** 2 for x in xs)
+    if not var:
+        return 0.0
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+
+
+class Soak:
+    def __init__(self, root, app, rng):
+        self.root = root
+        self.app = app
+        self.rng = rng
+        self.samples = []
+        self._heartbeat()
+
+    def _heartbeat(self):
+        # keeps dooneevent() from sleeping forever if a wait condition is never met
+        self.root.after(50, self._heartbeat)
+
+    def wait(self, condition, what):
+        deadline = time.monotonic() + STEP_TIMEOUT
+        while not condition():
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"timed out waiting for {what}")
+            self.root.tk.dooneevent()
+
+    def place_fleet(self):
+        app = self.app
+        for index, (name, size, _) in enumerate(app.ship_specs):
+            app.select_ship(index)
+            row, col, orientation = self.rng.choice(sorted(app.player_board.legal_placements(size)))
+            app.placement_orientation = orientation
+            app.player_board_click(row, col)
+        self.wait(lambda: app.ai_board.ships, "the game to start")
+
+    def play(self):
+        app = self.app
+        while app._game_over_id is None:
+            cells = [(r, c) for r in range(10) for c in range(10) if app.ai_board.is_valid_guess(r, c)]
+            app.ai_board_click(*self.rng.choice(cells))
+            self.wait(lambda: not app.ai_turn_pending, "the AI turn")
+        self.wait(lambda: app._game_over_id is None and app.placement_phase, "the reset")
+
+    def modal(self, apply):
+        from tkinter import Toplevel
+        app = self.app
+        app.open_start_modal()
+        modal = [w for w in self.root.winfo_children() if isinstance(w, Toplevel)][-1]
+        self.root.update_idletasks()
+        if apply:
+            canvas = modal.winfo_children()[0]
+            canvas.event_generate("<Button-1>", x=190, y=60)     # next language
+            canvas.event_generate("<Button-1>", x=200, y=200)    # start
+        else:
+            self.root.tk.call(modal.protocol("WM_DELETE_WINDOW"))
+        self.root.update()
+
+    def sample(self, cycle):
+        from tkinter import Toplevel
+        app = self.app
+        traced, _ = tracemalloc.get_traced_memory()
+        self.samples.append({
+            "cycle": cycle,
+            "player_canvas_items": len(app.player_canvas.canvas.find_all()),
+            "ai_canvas_items": len(app.ai_canvas.canvas.find_all()),
+            "peg_entries": len(app.player_canvas._peg_items) + len(app.ai_canvas._peg_items),
+            "ship_entries": len(app.player_canvas._ship_items) + len(app.ai_canvas._ship_items),
+            "tk_images": len(self.root.tk.splitlist(self.root.tk.call("image", "names"))),
+            "pending_afters": len(self.root.tk.splitlist(self.root.tk.call("after", "info"))),
+            "toplevels": sum(isinstance(w, Toplevel) for w in self.root.winfo_children()),
+            "traced_bytes": traced,
+            "rss_bytes": rss_bytes(),
+        })
+
+
+def growth(samples, warmup):
+    steady = [s for s in samples if s["cycle"] >= warmup] or samples
+    xs = [s["cycle"] for s in steady]
+    return {key: slope(xs, [s[key] for s in steady]) for key in steady[0]
+            if key != "cycle" and steady[0][key] is not None}
+
+
+def run(cycles, every, modal_every, seed, difficulty, warmup):
+    import tkinter as tk
+    from game.habits import HabitStore
+    from gui import app as app_module
+    from gui.animation import Animator
+
+    # no pauses that only exist for a human watching
+    app_module.AI_STREAK_DELAY_MS = 0
+    app_module.AI_REPLY_DELAY_MS = 0
+    app_module.START_DELAY_MS = 0
+    app_module.GAME_OVER_DELAY_MS = 0
+
+    root = tk.Tk()
+    # synthetic fleets stay out of the user's saved placement habits
+    app = app_module.App(root, difficulty=difficulty, habits=HabitStore(path=None))
+    app.toasts.duration_ms = 1
+    Animator.for_widget(root).set_instant(True)
+    soak = Soak(root, app, random.Random(seed))
+
+    tracemalloc.start(10)
+    started = time.perf_counter()
+    before = None
+    for cycle in range(1, cycles + 1):
+        soak.place_fleet()
+        soak.play()
+        if modal_every and cycle % modal_every == 0:
+            soak.modal(apply=(cycle // modal_every) % 2 == 0)
+        if cycle == warmup:
+            before = tracemalloc.take_snapshot()
+        if cycle % every == 0 or cycle == cycles:
+            soak.sample(cycle)
+    after = tracemalloc.take_snapshot()
+    elapsed = time.perf_counter() - started
+    root.destroy()
+
+    top = []
+    if before is not None:
+        for stat in after.compare_to(before, "lineno")[:10]:
+            frame = stat.traceback[0]
+            top.append({"where": f"{frame.filename}:{frame.lineno}", "size_diff": stat.size_diff,
+                        "count_diff": stat.count_diff})
+    tracemalloc.stop()
+    return {
+        "cycles": cycles,
+        "seconds": elapsed,
+        "warmup": warmup,
+        "samples": soak.samples,
+        "growth_per_cycle": growth(soak.samples, warmup),
+        "top_allocations": top,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soak-test the Battleship desktop app")
+    parser.add_argument("--cycles", type=int, default=1000, help="placement -> play -> reset cycles")
+    parser.add_argument("--every", type=int, default=25, help="sample every N cycles")
+    parser.add_argument("--modal-every", type=int, default=10, help="open the start modal every N cycles (0: never)")
+    parser.add_argument("--warmup", type=int, default=50, help="cycles ignored when fitting growth")
+    parser.add_argument("--difficulty", default="Hard")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--xvfb", action="store_true", help="start Xvfb even if $DISPLAY is set")
+    parser.add_argument("--output", help="write the full report as JSON")
+    parser.add_argument("--max-items-per-cycle", type=float, default=0.01)
+    parser.add_argument("--max-kib-per-cycle", type=float, default=4.0)
+    args = parser.parse_args(argv)
+
+    with virtual_display(force=args.xvfb):
+        report = run(args.cycles, args.every, args.modal_every, args.seed, args.difficulty,
+                     min(args.warmup, args.cycles))
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+    print(f"{report['cycles']} cycles in {report['seconds']:.1f}s")
+    failed = False
+    for key, per_cycle in sorted(report["growth_per_cycle"].items()):
+        memory = key.endswith("_bytes")
+        value = per_cycle / 1024.0 if memory else per_cycle
+        limit = args.max_kib_per_cycle if memory else args.max_items_per_cycle
+        flag = "  GROWING" if value > limit else ""
+        failed = failed or bool(flag)
+        print(f"{key:22s} {value:+10.3f} {'KiB' if memory else 'items'}/cycle{flag}")
+    for entry in report["top_allocations"][:5]:
+        print(f"  {entry['size_diff'] / 1024.0:+9.1f} KiB  {entry['where']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
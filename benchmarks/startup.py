@@ -0,0 +1,143 @@
+"""Startup benchmark for the desktop game.
+
+Starts a fresh interpreter several times and measures how long `import main`
+takes and how long until the start window is first painted (needs a
+display; reported as skipped otherwise). It also checks that the game
+modules are not loaded before Start is clicked.
+
+    python benchmarks/startup.py --repeat 10
+    python benchmarks/startup.py --max-import-ms 150 --max-paint-ms 600
+
+Exits non-zero when a limit is exceeded or the game modules load early.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+
+# modules that must stay unloaded until Start is clicked
+LAZY_MODULES = ("gui.app", "game.ai", "gui.widgets")
+
+PROBE = r"""
+import json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+result = {
+    "import_ms": (imported - started) * 1000.0,
+    "modules": len(sys.modules),
+    "eager": [name for name in %(lazy)r if name in sys.modules],
+    "paint_ms": None,
+}
+try:
+    root = main.tk.Tk()
+except main.tk.TclError:
+    pass
+else:
+    win = main.StartWindow(root)
+    deadline = time.perf_counter() + 10.0
+    while not win.win.winfo_viewable() and time.perf_counter() < deadline:
+        root.update()
+    root.update_idletasks()
+    result["paint_ms"] = (time.perf_counter() - started) * 1000.0
+    root.destroy()
+print(json.dumps(result))
+"""
+
+
+def _env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def probe_once():
+    """Run one cold start in a child interpreter; returns its measurements."""
+    began = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", PROBE % {"lazy": LAZY_MODULES}], env=_env(),
+                         capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - began) * 1000.0
+    return result
+
+
+def slowest_imports(top=10):
+    """Cumulative import times (ms) of the slowest modules behind `import main`."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], env=_env(),
+                         capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1000.0, name.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def run(repeat):
+    samples = [probe_once() for _ in range(repeat)]
+
+    def summary(key):
+        values = [s[key] for s in samples if s[key] is not None]
+        if not values:
+            return None
+        return {"median": statistics.median(values), "min": min(values), "max": max(values)}
+
+    return {
+        "repeat": repeat,
+        "import_ms": summary("import_ms"),
+        "paint_ms": summary("paint_ms"),
+        "process_ms": summary("process_ms"),
+        "modules": samples[-1]["modules"],
+        "eager": sorted({name for s in samples for name in s["eager"]}),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure Battleship startup time")
+    parser.add_argument("--repeat", type=int, default=5, help="cold starts to sample")
+    parser.add_argument("--max-import-ms", type=float, help="fail if the median import time is higher")
+    parser.add_argument("--max-paint-ms", type=float, help="fail if the median time to first paint is higher")
+    parser.add_argument("--top", type=int, default=0, help="also list the N slowest imports")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat)
+    if args.top:
+        report["slowest_imports"] = slowest_imports(args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        imp, paint, proc = report["import_ms"], report["paint_ms"], report["process_ms"]
+        print(f"cold starts: {report['repeat']}  modules loaded: {report['modules']}")
+        print(f"import main      median {imp['median']:.1f} ms  (min {imp['min']:.1f}, max {imp['max']:.1f})")
+        if paint:
+            print(f"first paint      median {paint['median']:.1f} ms  (min {paint['min']:.1f}, max {paint['max']:.1f})")
+        else:
+            print("first paint      skipped (no display)")
+        print(f"whole process    median {proc['median']:.1f} ms")
+        for ms, name in report.get("slowest_imports", []):
+            print(f"  {ms:8.1f} ms  {name}")
+
+    failed = False
+    if report["eager"]:
+        print("loaded before Start: " + ", ".join(report["eager"]), file=sys.stderr)
+        failed = True
+    if args.max_import_ms is not None and report["import_ms"]["median"] > args.max_import_ms:
+        print(f"import time over {args.max_import_ms} ms", file=sys.stderr)
+        failed = True
+    if args.max_paint_ms is not None and report["paint_ms"] and report["paint_ms"]["median"] > args.max_paint_ms:
+        print(f"time to first paint over {args.max_paint_ms} ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,42 @@
+import random
+
+from game import montecarlo
+from game.board import SHIP_SPECS
+from game.probability import placement_probabilities
+
+
 class AI:
-    def __init__(self, target_board, difficulty="Medium"):
+    def __init__(self, target_board, difficulty="Medium", rng=None,
+                 budget_ms=montecarlo.BUDGET_MS, samples=None, workers=1, prior=None,
+                 strength=0.5):
         """
         target_board: Board instance representing opponent (player) board the AI will shoot at
-        difficulty: "Easy", "Medium", or "Hard"
+        difficulty: "Easy", "Medium", "Hard", "Expert" or "Adaptive"
+        rng: random.Random to draw from (seed it for repeatable games); defaults to the random module
+        budget_ms, samples, workers: Expert only -- time per move, an optional cap on
+          sampled fleets (set it and budget_ms=None for repeatable moves) and processes to sample in
+        prior: Hard and Expert only -- per-cell weights (r * size + c) for where the opponent
+          usually puts ships, as from game.habits.HabitStore.prior(); used while hunting
+        strength: Adaptive only -- chance (0..1) that a shot goes to the most likely cell
+          rather than a random one; game.calibration picks it for a target win rate
         """
         self.board = target_board
         self.difficulty = difficulty
+        self.rng = rng if rng is not None else random
+        self.budget_ms = budget_ms
+        self.samples = samples
+        self.workers = workers
+        if difficulty == "Expert" and budget_ms is None and samples is None:
+            raise ValueError("the Expert AI needs budget_ms or samples")
+        self.prior = prior
+        self.strength = strength
         self.previous_guesses = set()
         self.hit_positions = []
         self.sunk_ships = []
+        # full shot history, used by the Expert sampler
+        self.hits = set()
+        self.sunk_cells = set()
+        self.remaining = [size for _, size, _ in SHIP_SPECS]
 
     def make_guess(self):
         """Return a guess (row,col) according to difficulty and current hit info."""
@@ -29,6 +57,16 @@ class AI:
             self.previous_guesses.add(guess)
             return guess
 
+        if self.difficulty == "Adaptive":
+            guess = self._tuned_guess()
+            self.previous_guesses.add(guess)
+            return guess
+
+        if self.difficulty == "Expert":
+            guess = self._expert_guess()
+            self.previous_guesses.add(guess)
+            return guess
+
         # Hard difficulty: smarter guessing strategy
         # 1) If have known hits, pursue them (try to determine orientation and finish ship)
         # 2) Otherwise use parity / probability: prefer cells on a checkerboard to find ships faster
@@ -45,9 +83,8 @@ class AI:
             return guess
 
     def _random_guess(self):
-        import random
         while True:
-            guess = (random.randint(0, self.board.size - 1), random.randint(0, self.board.size - 1))
+            guess = (self.rng.randint(0, self.board.size - 1), self.rng.randint(0, self.board.size - 1))
             if guess not in self.previous_guesses:
                 return guess
 
@@ -96,7 +133,6 @@ class AI:
 
     def _parity_guess(self):
         # choose a random cell on parity grid (checkerboard) not previously guessed
-        import random
         candidates = []
         for r in range(self.board.size):
             for c in range(self.board.size):
@@ -104,9 +140,69 @@ class AI:
                     candidates.append((r, c))
         if not candidates:
             return self._random_guess()
-        return random.choice(candidates)
+        if self.prior is not None:
+            size = self.board.size
+            return self.rng.choices(candidates, [self.prior[r * size + c] for r, c in candidates])[0]
+        return self.rng.choice(candidates)
+
+    def _expert_guess(self):
+        # Monte Carlo: the unshot cell that the most sampled fleets put a ship on
+        size = self.board.size
+        misses = montecarlo.to_mask(self.previous_guesses - self.hits, size)
+        hits = montecarlo.to_mask(self.hits - self.sunk_cells, size)
+        sunk = montecarlo.to_mask(self.sunk_cells, size)
+        counts, _ = montecarlo.estimate(size, self.remaining, misses, hits, sunk, self.rng,
+                                        budget_ms=self.budget_ms, limit=self.samples, workers=self.workers)
+        if self.prior is not None and not hits:
+            # hunting: lean towards where this opponent usually hides ships
+            counts = [count * weight for count, weight in zip(counts, self.prior)]
+        best = None
+        best_count = 0
+        for number, count in enumerate(counts):
+            cell = divmod(number, size)
+            if count > best_count and cell not in self.previous_guesses:
+                best, best_count = cell, count
+        if best is None:
+            # nothing sampled in time (or an inconsistent history): fall back to parity
+            return self._parity_guess()
+        return best
+
+    def _tuned_guess(self):
+        # a `strength` share of density-guided shots, the rest at random
+        if self.rng.random() >= self.strength:
+            return self._random_guess()
+        grid = placement_probabilities(self.board.size, self.remaining, self.previous_guesses - self.hits,
+                                       self.hits - self.sunk_cells, self.sunk_cells)
+        best = max(value for row in grid for value in row)
+        if best <= 0:
+            return self._random_guess()
+        cells = [(r, c) for r, row in enumerate(grid) for c, value in enumerate(row)
+                 if value == best and (r, c) not in self.previous_guesses]
+        return self.rng.choice(cells) if cells else self._random_guess()
+
+    def _sunk_cluster(self, guess):
+        # ships never touch, so the sunk ship is exactly the hits connected to its last cell
+        cluster = {guess}
+        frontier = [guess]
+        while frontier:
+            r, c = frontier.pop()
+            for cell in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+                if cell in self.hits and cell not in cluster and cell not in self.sunk_cells:
+                    cluster.add(cell)
+                    frontier.append(cell)
+        return cluster
 
     def record_result(self, guess, result):
+        if result in ("hit", "sunk"):
+            self.hits.add(guess)
+        if result == "sunk":
+            cluster = self._sunk_cluster(guess)
+            self.sunk_cells |= cluster
+            if len(cluster) in self.remaining:
+                self.remaining.remove(len(cluster))
+            elif self.remaining:
+                self.remaining.remove(max(self.remaining))
+
         if result == "hit":
             # track hit for follow-up
             if guess not in self.hit_positions:
@@ -2,8 +2,20 @@ import random
 from types import SimpleNamespace
 from game.ship import Ship
 
+# standard fleet: (name, size, symbol)
+SHIP_SPECS = [
+    ("Carrier", 5, "C"),
+    ("Battleship", 4, "B"),
+    ("Cruiser", 3, "R"),
+    ("Submarine", 3, "S"),
+    ("Destroyer", 2, "D"),
+]
+
+
 class Board:
-    def __init__(self):
+    def __init__(self, rng=None):
+        # rng: random.Random used for random placement; defaults to the random module
+        self.rng = rng if rng is not None else random
         self.size = 10
         # grid stores symbol or ' ' for empty
         self.grid = [[' ' for _ in range(self.size)] for _ in range(self.size)]
@@ -107,31 +119,46 @@ class Board:
                             return False
         return True
 
+    def legal_placements(self, size):
+        """All (row, col, orientation) starts where a ship of `size` could go now.
+
+        Same rules as place_ship (in bounds, no overlap, no touching), but
+        the occupied neighbourhood is built once so the whole board costs a
+        single pass instead of one scan per start.
+        """
+        forbidden = set()
+        for r in range(self.size):
+            for c in range(self.size):
+                if self.grid[r][c] != ' ':
+                    for nr in range(r - 1, r + 2):
+                        for nc in range(c - 1, c + 2):
+                            forbidden.add((nr, nc))
+        legal = set()
+        for r in range(self.size):
+            for c in range(self.size):
+                if c + size <= self.size and not any((r, c + i) in forbidden for i in range(size)):
+                    legal.add((r, c, 'H'))
+                if r + size <= self.size and not any((r + i, c) in forbidden for i in range(size)):
+                    legal.add((r, c, 'V'))
+        return frozenset(legal)
+
     def place_ships_randomly(self):
         """
         Place the standard five ships randomly on the board ensuring ships do not touch.
         Uses Ship class instances.
         """
-        ship_specs = [
-            ("Carrier", 5, "C"),
-            ("Battleship", 4, "B"),
-            ("Cruiser", 3, "R"),
-            ("Submarine", 3, "S"),
-            ("Destroyer", 2, "D"),
-        ]
-
-        for name, size, symbol in ship_specs:
+        for name, size, symbol in SHIP_SPECS:
             placed = False
             attempts = 0
             while not placed and attempts < 2000:
                 attempts += 1
-                orientation = random.choice(['H', 'V'])
+                orientation = self.rng.choice(['H', 'V'])
                 if orientation == 'H':
-                    x = random.randrange(0, self.size)
-                    y = random.randrange(0, self.size - size + 1)
+                    x = self.rng.randrange(0, self.size)
+                    y = self.rng.randrange(0, self.size - size + 1)
                 else:
-                    x = random.randrange(0, self.size - size + 1)
-                    y = random.randrange(0, self.size)
+                    x = self.rng.randrange(0, self.size - size + 1)
+                    y = self.rng.randrange(0, self.size)
 
                 if not self._can_place_without_touching((x, y), orientation, size):
                     continue
@@ -0,0 +1,176 @@
+"""Calibrated strength for the Adaptive AI.
+
+The Adaptive AI fires a `strength` share of its shots at the most likely
+cell and the rest at random. How strong a given strength is can only be
+measured, so `calibrate` plays headless games offline and records, per
+strength on a grid, the distribution of turns the AI needs to sink a
+random fleet (a turn ends at a miss, so turns = misses + 1). The curve is
+saved to strength.json next to this module and loaded once by the game.
+
+At game start nothing is simulated. The player moves first, so they win
+when they need no more turns than the AI; with both turn distributions
+taken from the curve that chance is a short sum. The player's own skill
+is read off the same curve: every finished game is evidence (a win at t
+turns, or a loss after t turns without finishing) for how likely each
+grid strength is to be theirs, and the predicted win rate is averaged
+over that posterior. `choose_strength` then interpolates the AI strength
+that gives the target win rate.
+
+    PYTHONPATH=src python -m game.calibration --games 1000 --output src/game/strength.json
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+
+from game.ai import AI
+from game.board import SHIP_SPECS
+from game.simulation import hunt, random_board
+
+STRENGTHS = tuple(i / 10 for i in range(11))
+CURVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strength.json")
+CURVE_VERSION = 1
+MAX_TURNS = 100         # longest game a histogram keeps; longer ones count as this
+TARGET_WIN_RATE = 0.5
+HISTORY_GAMES = 20      # recent games the player's skill is judged on
+DEFAULT_STRENGTH = 0.5  # used without a curve
+
+
+def _fleet():
+    return [list(spec[:2]) for spec in SHIP_SPECS]
+
+
+def _calibrate_task(task):
+    # (strength, seeds) -> (turns histogram, total shots)
+    strength, seeds = task
+    histogram = [0] * (MAX_TURNS + 1)
+    shots = 0
+    for seed in seeds:
+        rng = random.Random(seed)
+        board = random_board(rng)
+        shots += hunt(AI(board, "Adaptive", rng=rng, strength=strength), board)
+        histogram[min(len(board.misses) + 1, MAX_TURNS)] += 1
+    return histogram, shots
+
+
+def calibrate(games, strengths=STRENGTHS, first_seed=0, workers=1):
+    """Play `games` games per strength; returns the curve as saved by save_curve."""
+    seeds = range(first_seed, first_seed + games)
+    tasks = [(strength, seeds) for strength in strengths]
+    if workers > 1:
+        import multiprocessing
+        with multiprocessing.Pool(workers) as pool:
+            done = pool.map(_calibrate_task, tasks)
+    else:
+        done = [_calibrate_task(task) for task in tasks]
+    return {"version": CURVE_VERSION, "fleet": _fleet(), "games": games,
+            "strengths": list(strengths),
+            "mean_shots": [round(shots / games, 2) for _, shots in done],
+            "turns": [histogram for histogram, _ in done]}
+
+
+def save_curve(curve, path=CURVE_PATH):
+    with open(path, "w") as fh:
+        json.dump(curve, fh, separators=(",", ":"))
+        fh.write("\n")
+    return path
+
+
+def load_curve(path=CURVE_PATH):
+    """The saved curve, or None when it is missing or was made for another fleet."""
+    try:
+        with open(path) as fh:
+            curve = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if curve.get("version") != CURVE_VERSION or curve.get("fleet") != _fleet():
+        return None
+    return curve
+
+
+def _distributions(curve):
+    # turn probabilities per strength, with half a game added to every
+    # turn count so no outcome is impossible
+    result = []
+    for histogram in curve["turns"]:
+        total = sum(histogram) + 0.5 * len(histogram)
+        result.append([(count + 0.5) / total for count in histogram])
+    return result
+
+
+def win_rate(player, ai):
+    """Chance the first mover, needing `player` turns (a distribution), beats `ai`."""
+    rate = 0.0
+    at_least = 1.0      # P(ai needs >= t turns)
+    for t, p in enumerate(player):
+        rate += p * at_least
+        at_least -= ai[t]
+    return rate
+
+
+def skill_posterior(curve, history):
+    """Weights over the curve's strengths for the player.
+
+    history: [(won, turns), ...] -- turns taken to win, or turns played in a loss.
+    """
+    distributions = _distributions(curve)
+    logs = []
+    for dist in distributions:
+        log = 0.0
+        for won, turns in history:
+            turns = min(turns, MAX_TURNS)
+            # a loss only says the player needed more turns than they got
+            chance = dist[turns] if won else sum(dist[turns + 1:])
+            log += math.log(max(chance, 1e-12))
+        logs.append(log)
+    top = max(logs)
+    weights = [math.exp(log - top) for log in logs]
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def predicted_win_rates(curve, history=()):
+    """The player's chance of winning against each strength on the curve."""
+    distributions = _distributions(curve)
+    posterior = skill_posterior(curve, history)
+    return [sum(weight * win_rate(player, ai) for weight, player in zip(posterior, distributions))
+            for ai in distributions]
+
+
+def choose_strength(curve, target=TARGET_WIN_RATE, history=()):
+    """The Adaptive AI strength expected to leave the player `target` of their games."""
+    if curve is None:
+        return DEFAULT_STRENGTH
+    strengths = curve["strengths"]
+    rates = predicted_win_rates(curve, list(history)[-HISTORY_GAMES:])
+    if target >= rates[0]:
+        return strengths[0]
+    for i in range(1, len(rates)):
+        if target >= rates[i]:
+            # the win rate falls as strength rises; interpolate inside the bracket
+            span = rates[i - 1] - rates[i]
+            part = (rates[i - 1] - target) / span if span > 0 else 1.0
+            return strengths[i - 1] + part * (strengths[i] - strengths[i - 1])
+    return strengths[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate the Adaptive AI's strength curve")
+    parser.add_argument("--games", type=int, default=1000, help="games per strength")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default=CURVE_PATH)
+    args = parser.parse_args(argv)
+
+    curve = calibrate(args.games, STRENGTHS, args.first_seed, args.workers)
+    for strength, shots, rate in zip(curve["strengths"], curve["mean_shots"], predicted_win_rates(curve)):
+        print(f"strength {strength:.1f}: {shots:5.1f} shots to win, "
+              f"a player of unknown skill wins {rate:.0%}")
+    print(f"wrote {save_curve(curve, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Where the human tends to put their ships, remembered between games.
+
+After every finished game the cells of the human's fleet (all revealed by
+then) are added to a per-cell running count kept in a small binary file,
+so loading costs the same after ten games or ten thousand: a header and
+one counter per cell, no history to replay.
+
+    store = HabitStore()            # ~/.battleship/habits.bin
+    ai = AI(board, "Hard", prior=store.prior())
+    ...
+    store.record(cells_of_the_human_fleet)
+
+`prior()` turns the counts into a per-cell multiplier against how often a
+randomly placed fleet covers the cell, shrunk towards 1 by PSEUDO_GAMES
+imaginary random games so a handful of games cannot make the AI chase
+noise. Layout (little-endian): magic, version, board size, games, then
+size * size uint32 counts.
+"""
+import os
+import struct
+
+from game.board import SHIP_SPECS
+from game.probability import placement_probabilities
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".battleship", "habits.bin")
+MAGIC = b"BSHB"
+VERSION = 1
+PSEUDO_GAMES = 10
+_HEADER = struct.Struct("<4sHHI")
+
+
+class HabitStore:
+    """Running per-cell counts of the human's ship cells, backed by one file.
+
+    path=None keeps the counts in memory only (benchmarks, seeded replays).
+    """
+
+    def __init__(self, path=DEFAULT_PATH, size=10):
+        self.path = path
+        self.size = size
+        self.games = 0
+        self.counts = [0] * (size * size)
+        self.load()
+
+    def load(self):
+        """Read the aggregate; a missing, damaged or other-sized file starts empty."""
+        if self.path is None:
+            return False
+        try:
+            with open(self.path, "rb") as fh:
+                data = fh.read()
+            magic, version, size, games = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION or size != self.size:
+                return False
+            counts = list(struct.unpack_from(f"<{size * size}I", data, _HEADER.size))
+        except (OSError, struct.error):
+            return False
+        self.games, self.counts = games, counts
+        return True
+
+    def save(self):
+        if self.path is None:
+            return False
+        data = _HEADER.pack(MAGIC, VERSION, self.size, self.games) + struct.pack(f"<{len(self.counts)}I", *self.counts)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, self.path)
+        except OSError:
+            # read-only home: the counts still help for this session
+            return False
+        return True
+
+    def record(self, cells):
+        """Add one game's fleet, given as (row, col) cells, and write the file."""
+        for r, c in set(cells):
+            self.counts[r * self.size + c] += 1
+        self.games += 1
+        return self.save()
+
+    def prior(self, pseudo_games=PSEUDO_GAMES):
+        """Per-cell multipliers (indexed r * size + c), or None before any game is recorded."""
+        if not self.games:
+            return None
+        base = placement_probabilities(self.size, [size for _, size, _ in SHIP_SPECS], (), ())
+        weights = []
+        for number, count in enumerate(self.counts):
+            expected = base[number // self.size][number % self.size]
+            if expected <= 0:
+                weights.append(1.0)
+                continue
+            rate = (count + pseudo_games * expected) / (self.games + pseudo_games)
+            weights.append(rate / expected)
+        return weights
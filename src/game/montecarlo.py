@@ -0,0 +1,246 @@
+"""Monte Carlo targeting for the Expert AI.
+
+Whole fleets consistent with the shots so far are sampled at random --
+ships clear of misses and of sunk ships' no-touch halos, not touching each
+other, and together covering every unexplained hit -- and each cell is
+scored by how many sampled fleets put a ship on it. Sampling stops at a
+wall-clock deadline and/or a sample limit, so the estimate gets better the
+more time it is given ("anytime"). With workers > 1 the sampling is split
+across a process pool; every process samples until the same deadline and
+the counts are added up.
+
+Cells are numbered r * size + c and sets of cells are int bitmasks.
+"""
+import atexit
+import random
+import threading
+import time
+from concurrent.futures import wait
+
+from game.probability import placements
+
+BUDGET_MS = 50          # default per-move budget
+NODES = 2000            # placements tried for one sample before it is abandoned
+LATE_MS = 5             # how long past the deadline worker results are waited for
+
+_tables = {}            # (size, length) -> placement masks
+_pool = None
+_pool_size = 0
+_shared = None          # game.tables block the pool's workers attach to
+_pool_lock = threading.Lock()
+_ready_size = 0         # workers known to be running
+_warming = None         # thread started by warm()
+
+
+def to_mask(cells, size):
+    mask = 0
+    for r, c in cells:
+        mask |= 1 << (r * size + c)
+    return mask
+
+
+def build_masks(size, length):
+    """(cells mask, cells + halo mask, cell numbers) for every placement of a ship."""
+    return tuple((to_mask(cells, size), to_mask(cells, size) | to_mask(halo, size),
+                  tuple(r * size + c for r, c in cells))
+                 for cells, halo in placements(size, length))
+
+
+def placement_masks(size, length):
+    masks = _tables.get((size, length))
+    if masks is None:
+        masks = _tables[(size, length)] = build_masks(size, length)
+    return masks
+
+
+def install(tables):
+    """Use prebuilt tables ({(size, length): masks or a game.tables view}) instead of building them."""
+    _tables.update(tables)
+
+
+class Sampler:
+    """Random fleets for one position: remaining ship lengths plus shot masks."""
+
+    def __init__(self, size, lengths, misses, hits, sunk):
+        self.size = size
+        self.lengths = tuple(lengths)
+        self.hits = hits
+        blocked = misses | sunk
+        for cells, footprint, _ in placement_masks(size, 1):
+            if cells & sunk:
+                blocked |= footprint
+        # placements allowed on their own: clear of blocked cells, and not
+        # touching a hit without covering it (that hit's ship would touch)
+        self.candidates = {}
+        for length in set(self.lengths):
+            self.candidates[length] = [
+                (cells, footprint, numbers) for cells, footprint, numbers in placement_masks(size, length)
+                if not cells & blocked and not (footprint & ~cells) & hits
+            ]
+
+    def _options(self, lengths, occupied, covered):
+        # (index into lengths, placement) pairs for the next ship: one that
+        # explains the first open hit, or else the longest ship left anywhere
+        open_hits = self.hits & ~covered
+        if open_hits:
+            cell = open_hits & -open_hits
+            return [(index, placement) for index, length in enumerate(lengths)
+                    for placement in self.candidates[length]
+                    if placement[0] & cell and not placement[0] & occupied]
+        index = lengths.index(max(lengths))
+        return [(index, placement) for placement in self.candidates[lengths[index]]
+                if not placement[0] & occupied]
+
+    def _place(self, rng, lengths, occupied, covered, numbers, budget):
+        if not lengths:
+            return not self.hits & ~covered
+        options = self._options(lengths, occupied, covered)
+        rng.shuffle(options)
+        for index, (cells, footprint, cell_numbers) in options:
+            budget[0] -= 1
+            if budget[0] < 0:
+                return False
+            rest = lengths[:index] + lengths[index + 1:]
+            if self._place(rng, rest, occupied | footprint, covered | cells, numbers, budget):
+                numbers.extend(cell_numbers)
+                return True
+        return False
+
+    def sample_one(self, rng):
+        """Cell numbers of one consistent fleet, or None if the search gave up.
+
+        Ships go down one at a time in random order among the placements
+        that still fit, backtracking out of dead ends (a crowded late-game
+        board has many) for at most NODES placements.
+        """
+        numbers = []
+        if self._place(rng, list(self.lengths), 0, 0, numbers, [NODES]):
+            return numbers
+        return None
+
+    def counts(self, rng, deadline=None, limit=None):
+        """Per-cell ship counts over the fleets sampled before `deadline` (time.monotonic) or `limit`."""
+        if deadline is None and limit is None:
+            raise ValueError("sampling needs a deadline or a limit")
+        counts = [0] * (self.size * self.size)
+        samples = 0
+        attempts = 0
+        while True:
+            if limit is not None and samples >= limit:
+                break
+            # checking the clock every few attempts keeps it off the hot path
+            if deadline is not None and attempts % 16 == 0 and time.monotonic() >= deadline:
+                break
+            attempts += 1
+            numbers = self.sample_one(rng)
+            if numbers is None:
+                if deadline is None and attempts > 50 * ((limit or 0) + 1):
+                    break    # no deadline to stop an impossible position
+                continue
+            samples += 1
+            for number in numbers:
+                counts[number] += 1
+        return counts, samples
+
+
+def _sample_task(task):
+    # worker entry point: (sampler arguments, seed, deadline, limit) -> (counts, samples)
+    args, seed, deadline, limit = task
+    return Sampler(*args).counts(random.Random(seed), deadline, limit)
+
+
+def _ready():
+    return True
+
+
+def pool(workers):
+    """A process pool shared by every Expert AI; grown when more workers are asked for."""
+    with _pool_lock:
+        return _start_pool(workers)
+
+
+def _start_pool(workers):
+    global _pool, _pool_size, _shared
+    if _pool is None or _pool_size < workers:
+        shutdown()
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from game import tables
+        _shared = tables.publish()
+        # spawn, not fork: the GUI calls this from its AI worker thread
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                    initializer=tables.attach, initargs=(_shared.name,))
+        _pool_size = workers
+        atexit.unregister(shutdown)
+        atexit.register(shutdown)
+    return _pool
+
+
+def warm(workers):
+    """Start the pool estimate(workers=...) uses, on a background thread.
+
+    Spawning workers takes far longer than a move's budget, so a game calls
+    this when it starts; until the pool is up, timed estimates sample in
+    the calling process alone.
+    """
+    global _warming
+    if workers <= 1 or _ready_size >= workers - 1:
+        return
+    if _warming is not None and _warming.is_alive():
+        return
+    _warming = threading.Thread(target=_warm, args=(workers - 1,), name="expert-pool", daemon=True)
+    _warming.start()
+
+
+def _warm(size):
+    global _ready_size
+    executor = pool(size)
+    wait([executor.submit(_ready) for _ in range(size)])
+    _ready_size = size
+
+
+def shutdown():
+    global _pool, _pool_size, _shared, _ready_size
+    _ready_size = 0
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+    if _shared is not None:
+        _shared.close()
+    _pool = None
+    _pool_size = 0
+    _shared = None
+
+
+def estimate(size, lengths, misses, hits, sunk, rng, budget_ms=BUDGET_MS, limit=None, workers=1):
+    """Per-cell counts and the number of fleets sampled, using up to `workers` processes.
+
+    The calling process samples too, so workers=4 means three pool processes.
+    """
+    if budget_ms is None and limit is None:
+        raise ValueError("estimate needs budget_ms or limit")
+    args = (size, tuple(lengths), misses, hits, sunk)
+    deadline = time.monotonic() + budget_ms / 1000.0 if budget_ms is not None else None
+    futures = []
+    if workers > 1 and deadline is not None and _ready_size < workers - 1:
+        warm(workers)
+        workers = 1
+    if workers > 1:
+        shares = [None] * workers
+        if limit is not None:
+            shares = [limit // workers + (i < limit % workers) for i in range(workers)]
+        executor = pool(workers - 1)
+        futures = [executor.submit(_sample_task, (args, rng.getrandbits(32), deadline, share))
+                   for share in shares[1:]]
+        limit = shares[0]
+    counts, samples = Sampler(*args).counts(rng, deadline, limit)
+    if futures and deadline is not None:
+        # a worker still starting up (or late) adds nothing worth waiting for
+        done, late = wait(futures, timeout=max(0.0, deadline - time.monotonic()) + LATE_MS / 1000.0)
+        for future in late:
+            future.cancel()
+        futures = [future for future in futures if future in done]
+    for future in futures:
+        more, extra = future.result()
+        counts = [a + b for a, b in zip(counts, more)]
+        samples += extra
+    return counts, samples
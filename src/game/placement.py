@@ -0,0 +1,273 @@
+"""Fleet layouts that are hard for hunting strategies to find.
+
+A layout is one (row, col, orientation) per ship of SHIP_SPECS, in order.
+Layouts are scored by how many shots a set of hunters needs before it
+first touches each ship: every hunter is a fixed firing order over the
+cells (highest empty-board placement density first, checkerboard parity
+first, border first, plain random), so scoring a layout is a handful of
+rank lookups.
+Once a ship is touched, targeting finishes it about as fast wherever it
+is, so first contact is where placement makes the difference.
+
+Simulated annealing moves one ship at a time to another legal spot and
+keeps changes that raise the score (and, early on, some that lower it).
+`build_pool` runs that offline; the game loads the pool once and `pick`
+chooses a layout, under a random rotation or reflection of the board, in
+constant time.
+
+    PYTHONPATH=src python -m game.placement --count 200 --output src/game/layouts.json
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+
+from game.board import SHIP_SPECS
+from game.montecarlo import placement_masks
+from game.probability import placement_probabilities
+from game.ship import Ship
+
+SIZE = 10
+LENGTHS = tuple(size for _, size, _ in SHIP_SPECS)
+POOL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "layouts.json")
+POOL_VERSION = 1
+HUNTERS_PER_KIND = 8
+STEPS = 3000
+
+_pool = None
+
+
+def _ring(n, size):
+    r, c = divmod(n, size)
+    return min(r, c, size - 1 - r, size - 1 - c)
+
+
+def hunters(rng, per_kind=HUNTERS_PER_KIND, size=SIZE):
+    """Firing orders as rank tables: rank[cell number] = shots fired before that cell."""
+    density = placement_probabilities(size, LENGTHS, (), ())
+    cells = list(range(size * size))
+    orders = []
+    for _ in range(per_kind):
+        noise = {n: rng.random() for n in cells}
+        # density hunter: most likely cells first, ties broken at random
+        orders.append(sorted(cells, key=lambda n: (-round(density[n // size][n % size], 6), noise[n])))
+        # parity hunters, one per checkerboard colour, then the other colour
+        for colour in (0, 1):
+            orders.append(sorted(cells, key=lambda n: ((n // size + n % size + colour) % 2, noise[n])))
+        # edge hunter: the border ring first, then the next ring in; without it
+        # annealing crowds every ship onto the edge, which a person soon spots
+        orders.append(sorted(cells, key=lambda n: (_ring(n, size), noise[n])))
+        shuffled = cells[:]
+        rng.shuffle(shuffled)
+        orders.append(shuffled)
+    ranks = []
+    for order in orders:
+        rank = [0] * len(order)
+        for position, n in enumerate(order):
+            rank[n] = position
+        ranks.append(rank)
+    return ranks
+
+
+def score(ships, ranks):
+    """Mean shots, over hunters, spent before first contact with each ship (summed over ships)."""
+    total = 0
+    for rank in ranks:
+        for numbers in ships:
+            total += min(rank[n] for n in numbers)
+    return total / len(ranks)
+
+
+def _random_fleet(rng, size):
+    # indices into placement_masks per length, placed so ships never touch
+    while True:
+        occupied = 0
+        chosen = []
+        for length in LENGTHS:
+            options = [i for i, (cells, _, _) in enumerate(placement_masks(size, length)) if not cells & occupied]
+            if not options:
+                break
+            index = rng.choice(options)
+            chosen.append(index)
+            occupied |= placement_masks(size, length)[index][1]
+        else:
+            return chosen
+
+
+def anneal(rng, ranks, steps=STEPS, size=SIZE, start_temperature=20.0, end_temperature=0.2):
+    """One optimized layout as placement indices (see placement_masks), and its score."""
+    tables = [placement_masks(size, length) for length in LENGTHS]
+    chosen = _random_fleet(rng, size)
+    current = score([tables[i][p][2] for i, p in enumerate(chosen)], ranks)
+    best, best_score = chosen[:], current
+    cooling = (end_temperature / start_temperature) ** (1.0 / max(1, steps))
+    temperature = start_temperature
+    for _ in range(steps):
+        ship = rng.randrange(len(LENGTHS))
+        others = 0
+        for i, p in enumerate(chosen):
+            if i != ship:
+                others |= tables[i][p][1]
+        index = rng.randrange(len(tables[ship]))
+        if tables[ship][index][0] & others:
+            temperature *= cooling
+            continue
+        previous = chosen[ship]
+        chosen[ship] = index
+        candidate = score([tables[i][p][2] for i, p in enumerate(chosen)], ranks)
+        if candidate >= current or rng.random() < math.exp((candidate - current) / temperature):
+            current = candidate
+            if current > best_score:
+                best, best_score = chosen[:], current
+        else:
+            chosen[ship] = previous
+        temperature *= cooling
+    return best, best_score
+
+
+def to_layout(chosen, size=SIZE):
+    layout = []
+    for length, index in zip(LENGTHS, chosen):
+        numbers = placement_masks(size, length)[index][2]
+        row, col = divmod(numbers[0], size)
+        orientation = 'H' if length == 1 or numbers[1] == numbers[0] + 1 else 'V'
+        layout.append((row, col, orientation))
+    return tuple(layout)
+
+
+def layout_cells(layout):
+    return [[(r + (i if o == 'V' else 0), c + (i if o == 'H' else 0)) for i in range(length)]
+            for (r, c, o), length in zip(layout, LENGTHS)]
+
+
+def _numbers(layout, size=SIZE):
+    return [[r * size + c for r, c in cells] for cells in layout_cells(layout)]
+
+
+def transform(layout, k, size=SIZE):
+    """The layout under one of the 8 symmetries of the square board (k in 0..7)."""
+    result = []
+    for cells in layout_cells(layout):
+        moved = []
+        for r, c in cells:
+            if k & 4:
+                r, c = c, r
+            if k & 2:
+                r = size - 1 - r
+            if k & 1:
+                c = size - 1 - c
+            moved.append((r, c))
+        moved.sort()
+        (r, c), last = moved[0], moved[-1]
+        result.append((r, c, 'H' if r == last[0] else 'V'))
+    return tuple(result)
+
+
+def apply(board, layout):
+    """Place the standard fleet on an empty board as `layout` says."""
+    for (name, size, symbol), (row, col, orientation) in zip(SHIP_SPECS, layout):
+        if not board.place_ship(Ship(name, size, [], symbol), (row, col), orientation):
+            raise ValueError(f"layout does not fit: {name} at {(row, col, orientation)}")
+    return board
+
+
+def canonical(layout, size=SIZE):
+    """The same representative for every layout that puts ships on the same cells.
+
+    That covers the 8 rotations and reflections and also swapping ships of
+    equal length (the Cruiser and the Submarine).
+    """
+    return min(tuple(sorted(tuple(sorted(cells)) for cells in layout_cells(transform(layout, k, size))))
+               for k in range(8))
+
+
+def build_pool(count, seed=0, steps=STEPS, max_runs=None):
+    """[(layout, score)] of up to `count` annealed layouts, best first.
+
+    Annealing often lands on the same fleet, or a mirror image of one
+    already found (see canonical); those are skipped (pick() applies the symmetries anyway),
+    so a player cannot learn a repeated layout. Gives up after `max_runs`
+    annealing runs (10 * count by default).
+    """
+    rng = random.Random(seed)
+    ranks = hunters(rng)
+    pool = {}
+    for _ in range(max_runs if max_runs is not None else 10 * count):
+        if len(pool) >= count:
+            break
+        chosen, value = anneal(rng, ranks, steps)
+        layout = to_layout(chosen)
+        key = canonical(layout)
+        if key not in pool:
+            pool[key] = (layout, value)
+    return sorted(pool.values(), key=lambda item: -item[1])
+
+
+def save_pool(pool, path=POOL_PATH):
+    data = {"version": POOL_VERSION, "size": SIZE, "fleet": [list(spec[:2]) for spec in SHIP_SPECS],
+            "layouts": [[list(ship) for ship in layout] for layout, _ in pool],
+            "scores": [round(value, 2) for _, value in pool]}
+    with open(path, "w") as fh:
+        json.dump(data, fh, separators=(",", ":"))
+        fh.write("\n")
+    return path
+
+
+def load_pool(path=POOL_PATH):
+    """Layouts from a pool file; [] when it is missing or was built for another fleet."""
+    try:
+        with open(path) as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return []
+    if data.get("version") != POOL_VERSION or data.get("fleet") != [list(spec[:2]) for spec in SHIP_SPECS]:
+        return []
+    return [tuple(tuple(ship) for ship in layout) for layout in data["layouts"]]
+
+
+def pick(rng=random, path=POOL_PATH):
+    """A pooled layout under a random board symmetry, or None without a pool."""
+    global _pool
+    if _pool is None:
+        _pool = load_pool(path)
+    if not _pool:
+        return None
+    return transform(rng.choice(_pool), rng.randrange(8))
+
+
+def place_fleet(board, rng=random):
+    """Put the fleet on `board` from the pool, falling back to random placement."""
+    layout = pick(rng)
+    if layout is not None:
+        try:
+            return apply(board, layout)
+        except ValueError:
+            board.reset()
+    board.place_ships_randomly()
+    return board
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a pool of hard-to-find fleet layouts")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=STEPS, help="annealing steps per layout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=POOL_PATH)
+    args = parser.parse_args(argv)
+
+    pool = build_pool(args.count, args.seed, args.steps)
+    # judge against hunters the pool was not optimized for
+    ranks = hunters(random.Random(args.seed + 1))
+    rng = random.Random(args.seed + 2)
+    baseline = [score(_numbers(to_layout(_random_fleet(rng, SIZE))), ranks) for _ in range(200)]
+    pooled = [score(_numbers(layout), ranks) for layout, _ in pool]
+    print(f"shots to first contact, summed over ships: random {sum(baseline) / len(baseline):.1f}, "
+          f"pool {sum(pooled) / len(pooled):.1f}")
+    print(f"wrote {len(pool)} layouts to {save_pool(pool, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+from functools import lru_cache
+
+# how much more likely a placement becomes for every known (unsunk) hit it explains
+HIT_WEIGHT = 20.0
+
+
+@lru_cache(maxsize=None)
+def placements(size, length):
+    """All straight placements of a ship on a size x size board.
+
+    Returns a tuple of (cells, halo) pairs where halo is the ring of cells
+    around the ship that must stay empty under the no-touch rule.
+    """
+    result = []
+    for orientation in ('H', 'V'):
+        for r in range(size - (length - 1 if orientation == 'V' else 0)):
+            for c in range(size - (length - 1 if orientation == 'H' else 0)):
+                cells = tuple((r + (i if orientation == 'V' else 0), c + (i if orientation == 'H' else 0)) for i in range(length))
+                result.append((cells, neighbours(cells, size)))
+    return tuple(result)
+
+
+def neighbours(cells, size):
+    """Cells touching `cells` (diagonals included) but not part of them."""
+    cells = set(cells)
+    ring = set()
+    for (r, c) in cells:
+        for nr in range(r - 1, r + 2):
+            for nc in range(c - 1, c + 2):
+                if 0 <= nr < size and 0 <= nc < size and (nr, nc) not in cells:
+                    ring.add((nr, nc))
+    return tuple(sorted(ring))
+
+
+def placement_probabilities(size, lengths, misses, hits, sunk_cells=()):
+    """Estimate the chance that each cell holds one of the ships still afloat.
+
+    lengths: lengths of the ships not yet sunk
+    misses, hits: shots fired so far; sunk_cells: cells of ships already sunk
+
+    Every placement of every remaining ship that is consistent with the
+    shots (no misses, no sunk ship or its no-touch halo, and not touching
+    an unexplained hit without covering it) is counted, weighted by
+    HIT_WEIGHT per hit it explains. Summing each ship's normalized counts
+    gives the expected number of ships on a cell, clipped to 1. Cells
+    already shot are 0. Returns a size x size list of floats.
+    """
+    sunk_cells = set(sunk_cells)
+    blocked = set(misses) | sunk_cells | set(neighbours(sunk_cells, size))
+    open_hits = set(hits) - sunk_cells
+    grid = [[0.0] * size for _ in range(size)]
+    for length in lengths:
+        counts = {}
+        total = 0.0
+        for cells, halo in placements(size, length):
+            if any(cell in blocked for cell in cells):
+                continue
+            if open_hits and any(cell in open_hits for cell in halo):
+                continue
+            weight = HIT_WEIGHT ** sum(1 for cell in cells if cell in open_hits)
+            total += weight
+            for cell in cells:
+                counts[cell] = counts.get(cell, 0.0) + weight
+        if total:
+            for (r, c), value in counts.items():
+                grid[r][c] += value / total
+    for (r, c) in set(misses) | set(hits):
+        grid[r][c] = 0.0
+    for row in grid:
+        for c, value in enumerate(row):
+            if value > 1.0:
+                row[c] = 1.0
+    return grid
+
+
+def board_probabilities(board):
+    """placement_probabilities from what an opponent can see of `board`."""
+    sunk = [ship for ship in board.ships if ship.is_sunk()]
+    sunk_cells = [cell for ship in sunk for cell in ship.coordinates]
+    lengths = [ship.size for ship in board.ships if not ship.is_sunk()]
+    return placement_probabilities(board.size, lengths, board.misses, board.hits, sunk_cells)
@@ -0,0 +1,226 @@
+"""Headless games for benchmarks, tests and batch experiments.
+
+Everything is driven by one random.Random, so a seed reproduces a game
+exactly: fleet placement, every AI decision and the result.
+
+Batches can be spread over worker processes and profiled:
+
+    PYTHONPATH=src python -m game.simulation --games 20000 --workers 4 \
+        --profile-every 50 --profile-out sim
+
+writes sim.prof (merged pstats) and sim.folded (collapsed stacks for a
+flame graph, split by Board / AI / engine).
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+from game.ai import AI
+from game.board import Board
+
+# a game that runs this long has an AI stuck re-guessing; stop it
+MAX_SHOTS = 400
+# the Expert AI samples a fixed number of fleets per move here instead of
+# running against the clock, so its games stay reproducible from the seed
+EXPERT_SAMPLES = 200
+
+
+class GameResult:
+    __slots__ = ("seed", "winner", "shots", "turns")
+
+    def __init__(self, seed, winner, shots, turns):
+        self.seed = seed
+        self.winner = winner    # 0 or 1, None if the game hit MAX_SHOTS
+        self.shots = shots      # [shots fired by side 0, by side 1]
+        self.turns = turns      # number of times the turn passed, plus one
+
+    def __repr__(self):
+        return f"GameResult(seed={self.seed}, winner={self.winner}, shots={self.shots}, turns={self.turns})"
+
+
+def random_board(rng):
+    """A Board with the standard fleet placed by `rng` (retrying the rare dead end)."""
+    board = Board(rng=rng)
+    while True:
+        try:
+            board.place_ships_randomly()
+            return board
+        except RuntimeError:
+            board.reset()
+
+
+def hunt(ai, board, max_shots=MAX_SHOTS):
+    """Let `ai` fire at `board` until the fleet is sunk; returns the shots it took."""
+    shots = 0
+    while not board.all_ships_sunk() and shots < max_shots:
+        guess = ai.make_guess()
+        result, _ = board.receive_shot(guess)
+        ai.record_result(guess, result)
+        shots += 1
+    return shots
+
+
+def play_game(seed, difficulties=("Hard", "Hard"), max_shots=MAX_SHOTS):
+    """Two AIs play a full game under the desktop rules (a hit earns another shot).
+
+    Side 0 moves first; side i fires at the board of side 1 - i.
+    """
+    rng = random.Random(seed)
+    boards = [random_board(rng), random_board(rng)]
+    ais = [AI(boards[1], difficulty=difficulties[0], rng=rng, budget_ms=None, samples=EXPERT_SAMPLES),
+           AI(boards[0], difficulty=difficulties[1], rng=rng, budget_ms=None, samples=EXPERT_SAMPLES)]
+    shots = [0, 0]
+    turns = 1
+    side = 0
+    while shots[0] + shots[1] < max_shots:
+        target = boards[1 - side]
+        guess = ais[side].make_guess()
+        result, _ = target.receive_shot(guess)
+        ais[side].record_result(guess, result)
+        shots[side] += 1
+        if target.all_ships_sunk():
+            return GameResult(seed, side, shots, turns)
+        if result == "miss":
+            side = 1 - side
+            turns += 1
+    return GameResult(seed, None, shots, turns)
+
+
+def play_games(seeds, difficulties=("Hard", "Hard")):
+    return [play_game(seed, difficulties) for seed in seeds]
+
+
+def chunks(seeds, size):
+    seeds = list(seeds)
+    return [seeds[i:i + size] for i in range(0, len(seeds), size)]
+
+
+def _play_chunk(task):
+    # runs in a worker: (seeds, difficulties, profile_every, profile_dir) ->
+    # (results, path of this chunk's profile or None)
+    seeds, difficulties, profile_every, profile_dir = task
+    profile = None
+    results = []
+    for seed in seeds:
+        if profile_every and seed % profile_every == 0:
+            if profile is None:
+                import cProfile
+                profile = cProfile.Profile()
+            profile.enable()
+            results.append(play_game(seed, difficulties))
+            profile.disable()
+        else:
+            results.append(play_game(seed, difficulties))
+    path = None
+    if profile is not None:
+        fd, path = tempfile.mkstemp(suffix=".prof", dir=profile_dir)
+        os.close(fd)
+        profile.dump_stats(path)
+    return results, path
+
+
+def run_batch(seeds, difficulties=("Hard", "Hard"), workers=1, chunk_size=200, profile_every=0):
+    """Play every seed, in `workers` processes when more than one.
+
+    With profile_every=N, games whose seed is a multiple of N are traced
+    with cProfile and the stats from all workers are merged. Returns
+    (results in seed order, pstats.Stats or None).
+    """
+    with tempfile.TemporaryDirectory(prefix="battleship-prof-") as profile_dir:
+        tasks = [(chunk, tuple(difficulties), profile_every, profile_dir) for chunk in chunks(seeds, chunk_size)]
+        if workers > 1 and "Expert" in difficulties:
+            import multiprocessing
+            from game import tables
+            # placement tables are built here once and mapped by every worker
+            with tables.publish() as shared, \
+                    multiprocessing.Pool(workers, initializer=tables.attach, initargs=(shared.name,)) as pool:
+                done = pool.map(_play_chunk, tasks)
+        elif workers > 1:
+            import multiprocessing
+            # only the Expert AI reads placement tables
+            with multiprocessing.Pool(workers) as pool:
+                done = pool.map(_play_chunk, tasks)
+        else:
+            done = [_play_chunk(task) for task in tasks]
+        results = [result for chunk_results, _ in done for result in chunk_results]
+        paths = [path for _, path in done if path]
+        stats = None
+        if paths:
+            import pstats
+            stats = pstats.Stats(*paths)
+    return results, stats
+
+
+def tally(results):
+    """Additive counters for a batch; counters from separate batches combine with merge()."""
+    counters = {"games": 0, "wins": [0, 0], "unfinished": 0, "winner_shots": 0, "turns": 0}
+    for result in results:
+        counters["games"] += 1
+        counters["turns"] += result.turns
+        if result.winner is None:
+            counters["unfinished"] += 1
+        else:
+            counters["wins"][result.winner] += 1
+            counters["winner_shots"] += result.shots[result.winner]
+    return counters
+
+
+def merge(total, counters):
+    """Add `counters` into `total` in place and return it."""
+    for key, value in counters.items():
+        if isinstance(value, list):
+            total[key] = [a + b for a, b in zip(total.get(key, [0] * len(value)), value)]
+        else:
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def summarize(results):
+    return summarize_counters(tally(results))
+
+
+def summarize_counters(counters):
+    finished = counters["games"] - counters["unfinished"]
+    return {
+        "games": counters["games"],
+        "wins": counters["wins"],
+        "unfinished": counters["unfinished"],
+        "mean_winner_shots": counters["winner_shots"] / finished if finished else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play headless Battleship games in bulk")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--difficulties", nargs=2, default=["Hard", "Hard"], metavar=("SIDE0", "SIDE1"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=200, help="games per task handed to a worker")
+    parser.add_argument("--profile-every", type=int, default=0, metavar="N", help="trace every Nth game with cProfile")
+    parser.add_argument("--profile-out", metavar="PREFIX", default="simulation",
+                        help="write PREFIX.prof and PREFIX.folded when profiling")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    results, stats = run_batch(seeds, args.difficulties, args.workers, args.chunk_size, args.profile_every)
+    summary = summarize(results)
+    mean = summary["mean_winner_shots"]
+    print(f"games: {summary['games']}  wins: {summary['wins'][0]}/{summary['wins'][1]}  "
+          f"unfinished: {summary['unfinished']}  mean winning shots: {mean:.1f}" if mean is not None
+          else f"games: {summary['games']}  unfinished: {summary['unfinished']}")
+    if stats is not None:
+        from utils.profiling import collapse, write_collapsed
+        stats.dump_stats(args.profile_out + ".prof")
+        stacks, totals = collapse(stats, by_category=True)
+        write_collapsed(args.profile_out + ".folded", stacks)
+        total = sum(totals.values()) or 1.0
+        for name, us in sorted(totals.items(), key=lambda item: -item[1]):
+            print(f"{name:8s} {us / 1000.0:10.1f} ms  {us / total:6.1%}")
+        print(f"wrote {args.profile_out}.prof and {args.profile_out}.folded")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
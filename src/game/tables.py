@@ -0,0 +1,158 @@
+"""Placement tables built once and shared with worker processes.
+
+The bitmask placement tables used by game.montecarlo (every placement of
+every ship length, as a cells mask and a cells-plus-halo mask) are the same
+in every process. A runner that starts workers builds them once, publishes
+them in a multiprocessing.shared_memory block and passes its name to the
+workers. Each worker keeps the block mapped read-only for its lifetime and
+reads placements out of it when they are used (see PlacementView), so all
+workers share the one copy and nothing is pickled through a pipe:
+
+    with tables.publish() as shared:
+        pool = multiprocessing.Pool(n, initializer=tables.attach, initargs=(shared.name,))
+
+Layout (little-endian): magic, version, board size, mask width in bytes
+and the number of lengths, then per length (length, placement count), then
+each placement's cells mask and footprint mask, `width` bytes each,
+followed by its `length` cell numbers, one byte each.
+"""
+import atexit
+import struct
+
+from game import montecarlo
+
+MAGIC = b"BSPT"
+VERSION = 2
+LENGTHS = (1, 2, 3, 4, 5)
+_HEADER = struct.Struct("<4sHHHH")
+_ENTRY = struct.Struct("<HI")
+
+_attached = []          # (shared memory, views) kept open by attach()
+
+
+def encode(size=10, lengths=LENGTHS):
+    width = (size * size + 7) // 8
+    tables = [(length, montecarlo.build_masks(size, length)) for length in lengths]
+    parts = [_HEADER.pack(MAGIC, VERSION, size, width, len(tables))]
+    parts.extend(_ENTRY.pack(length, len(masks)) for length, masks in tables)
+    for _, masks in tables:
+        for cells, footprint, numbers in masks:
+            parts.append(cells.to_bytes(width, "little"))
+            parts.append(footprint.to_bytes(width, "little"))
+            parts.append(bytes(numbers))
+    return b"".join(parts)
+
+
+class PlacementView:
+    """The placements of one ship length, read from an encoded buffer on access.
+
+    Behaves like the tuple montecarlo.build_masks returns: indexing, len()
+    and iteration give (cells mask, cells + halo mask, cell numbers).
+    """
+
+    def __init__(self, buffer, offset, count, width, length):
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+        self.width = width
+        self.length = length
+        self.stride = 2 * width + length
+
+    def __len__(self):
+        return self.count
+
+    def _read(self, start):
+        buffer, width = self.buffer, self.width
+        return (int.from_bytes(buffer[start:start + width], "little"),
+                int.from_bytes(buffer[start + width:start + 2 * width], "little"),
+                tuple(buffer[start + 2 * width:start + self.stride]))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self._read(self.offset + index * self.stride)
+
+    def __iter__(self):
+        for start in range(self.offset, self.offset + self.count * self.stride, self.stride):
+            yield self._read(start)
+
+    def release(self):
+        self.buffer.release()
+
+
+def decode(buffer):
+    """{(size, length): PlacementView} over an encoded table buffer (not copied)."""
+    magic, version, size, width, count = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a placement table")
+    entries = [_ENTRY.unpack_from(buffer, _HEADER.size + i * _ENTRY.size) for i in range(count)]
+    offset = _HEADER.size + count * _ENTRY.size
+    tables = {}
+    view = memoryview(buffer)
+    for length, placements in entries:
+        tables[(size, length)] = PlacementView(view[offset:], 0, placements, width, length)
+        offset += placements * (2 * width + length)
+    return tables
+
+
+class SharedTables:
+    """A published table block; unlinked when closed (or on leaving a with block)."""
+
+    def __init__(self, size=10, lengths=LENGTHS):
+        from multiprocessing import shared_memory
+        data = encode(size, lengths)
+        self.shm = shared_memory.SharedMemory(create=True, size=len(data))
+        self.shm.buf[:len(data)] = data
+        self.name = self.shm.name
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def publish(size=10, lengths=LENGTHS):
+    return SharedTables(size, lengths)
+
+
+def attach(name):
+    """Worker side: map the published block read-only and install views of its tables.
+
+    The mapping stays open until the process exits; the block itself can be
+    unlinked by the publisher meanwhile.
+    """
+    import multiprocessing
+    from multiprocessing import resource_tracker, shared_memory
+    shm = shared_memory.SharedMemory(name=name)
+    if multiprocessing.parent_process() is None:
+        # a separately started worker has its own resource tracker, which
+        # would unlink the publisher's block when this process exits
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+    views = decode(shm.buf.toreadonly())
+    montecarlo.install(views)
+    if not _attached:
+        atexit.register(detach)
+    _attached.append((shm, views))
+
+
+def detach():
+    """Drop the installed views and close every mapping attach() opened."""
+    for shm, views in _attached:
+        for key, view in views.items():
+            if montecarlo._tables.get(key) is view:
+                del montecarlo._tables[key]
+            view.release()
+        shm.close()
+    del _attached[:]
@@ -0,0 +1,69 @@
+import queue
+import threading
+
+from gui.bridge import MainThreadQueue
+
+
+class AIWorker:
+    """Computes AI moves on a background thread so the Tk loop never blocks.
+
+    `request(ai)` asks for `ai.make_guess()`; the guess is handed back to
+    `on_move` on the Tk thread through a MainThreadQueue. `cancel()` bumps
+    the generation counter so anything still in flight is discarded when it
+    arrives (used when the player resets or returns to the start modal). A
+    discarded guess is taken back out of the AI's `previous_guesses` -- on
+    the worker thread, so it never races a make_guess -- or the AI would
+    never fire at that cell. If make_guess raises, `on_error(exc)` is called
+    on the Tk thread instead of `on_move`.
+    """
+
+    def __init__(self, widget, on_move, on_error=None):
+        self.on_move = on_move
+        self.on_error = on_error
+        self.generation = 0
+        self._requests = queue.SimpleQueue()
+        self._results = MainThreadQueue(widget, self._deliver)
+        self._thread = threading.Thread(target=self._run, name="ai-worker", daemon=True)
+        self._thread.start()
+
+    def request(self, ai):
+        self._requests.put((self.generation, ai, None))
+
+    def cancel(self):
+        self.generation += 1
+
+    def close(self):
+        self.cancel()
+        self._requests.put(None)
+        self._results.close()
+
+    def _run(self):
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            generation, ai, guess = item
+            if guess is not None:
+                # a cancelled move: the AI did not really fire there
+                ai.previous_guesses.discard(guess)
+                continue
+            if generation != self.generation:
+                continue
+            try:
+                guess = ai.make_guess()
+            except Exception as exc:
+                guess = exc
+            self._results.put((generation, ai, guess))
+
+    def _deliver(self, item):
+        generation, ai, guess = item
+        if generation != self.generation:
+            if not isinstance(guess, Exception):
+                self._requests.put((generation, ai, guess))
+            return
+        if isinstance(guess, Exception):
+            if self.on_error is None:
+                raise guess
+            self.on_error(guess)
+            return
+        self.on_move(guess)
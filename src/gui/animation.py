@@ -0,0 +1,131 @@
+import time
+from collections import OrderedDict
+
+FRAME_MS = 16        # one tick per display frame (~60 Hz)
+BUDGET_MS = 6.0      # time a tick may spend advancing animations
+MAX_ACTIVE = 48      # beyond this, the oldest animations jump to their last frame
+
+
+class _Animation:
+    __slots__ = ("steps", "interval", "index", "due")
+
+    def __init__(self, steps, interval, due):
+        self.steps = steps
+        self.interval = interval
+        self.index = 1
+        self.due = due
+
+
+def _run(step):
+    try:
+        step()
+    except Exception:
+        # the canvas item may already be gone (reset mid-animation)
+        pass
+
+
+class Animator:
+    """Single animation driver for a window.
+
+    An animation is a list of zero-argument callables ("frames") played
+    `interval_ms` apart; the last frame must leave the item in its final
+    state. One `after` tick advances every active animation:
+
+    - a tick stops after BUDGET_MS and leaves the rest for the next frame;
+    - an animation that has fallen behind skips ahead instead of replaying
+      every missed frame;
+    - starting an animation under a key that is already running finishes
+      the old one first, and past MAX_ACTIVE the oldest are fast-forwarded;
+    - in instant mode (headless runs, replays) only the final frame is
+      applied, synchronously.
+    """
+
+    def __init__(self, widget, frame_ms=FRAME_MS, budget_ms=BUDGET_MS, max_active=MAX_ACTIVE):
+        self.widget = widget
+        self.frame_ms = frame_ms
+        self.budget_ms = budget_ms
+        self.max_active = max_active
+        self.instant = False
+        self._active = OrderedDict()    # key -> _Animation, oldest first
+        self._after_id = None
+        self.frames_run = 0
+        self.frames_skipped = 0
+        self.fast_forwarded = 0
+
+    @classmethod
+    def for_widget(cls, widget):
+        root = widget._root()
+        animator = getattr(root, "_animator", None)
+        if animator is None:
+            animator = root._animator = cls(root)
+        return animator
+
+    def __len__(self):
+        return len(self._active)
+
+    def start(self, key, steps, interval_ms):
+        """Play `steps` under `key`; the first frame is applied right away."""
+        if key in self._active:
+            self._finish(key)
+        if not steps:
+            return
+        if self.instant or len(steps) == 1:
+            _run(steps[-1])
+            return
+        _run(steps[0])
+        self.frames_run += 1
+        self._active[key] = _Animation(steps, interval_ms / 1000.0, time.perf_counter() + interval_ms / 1000.0)
+        while len(self._active) > self.max_active:
+            self._finish(next(iter(self._active)))
+            self.fast_forwarded += 1
+        self._schedule()
+
+    def cancel(self, owner):
+        """Drop every animation whose key is (owner, ...) without finishing it."""
+        for key in [k for k in self._active if isinstance(k, tuple) and k and k[0] is owner]:
+            del self._active[key]
+
+    def finish_all(self):
+        """Jump every running animation to its final frame."""
+        for key in list(self._active):
+            self._finish(key)
+
+    def set_instant(self, instant=True):
+        self.instant = instant
+        if instant:
+            self.finish_all()
+
+    def _finish(self, key):
+        anim = self._active.pop(key)
+        _run(anim.steps[-1])
+
+    def _schedule(self):
+        if self._after_id is None and self._active:
+            try:
+                self._after_id = self.widget.after(self.frame_ms, self._tick)
+            except Exception:
+                # window destroyed
+                self._active.clear()
+
+    def _tick(self):
+        self._after_id = None
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000.0
+        for key, anim in list(self._active.items()):
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if anim.due > now:
+                continue
+            # frames we are late for are skipped, never replayed
+            behind = int((now - anim.due) / anim.interval)
+            if behind:
+                self.frames_skipped += behind
+                anim.index = min(len(anim.steps) - 1, anim.index + behind)
+            _run(anim.steps[anim.index])
+            self.frames_run += 1
+            anim.index += 1
+            anim.due = now + anim.interval
+            if anim.index >= len(anim.steps):
+                del self._active[key]
+        self._schedule()
@@ -1,19 +1,48 @@
-from tkinter import Tk, Frame, Label, messagebox, Canvas, Toplevel
+import os
+import random
+import sys
+import traceback
+from tkinter import Tk, Frame, Label, Canvas, Toplevel
 from game.board import Board
 from game.player import Player
 from game.ai import AI
 from game.ship import Ship
 from gui.widgets import BoardCanvas, draw_ship_preview
+from gui.ai_worker import AIWorker
+from gui.heatmap import HeatmapOverlay
+from gui import playback
+from gui.i18n import LANGUAGES, catalog
+from gui.toast import ToastQueue
+from utils import instrument
+from game.probability import board_probabilities
+from game.placement import place_fleet
+from game.habits import HabitStore
+from game.calibration import choose_strength, load_curve
+from game import montecarlo
+
+# pause between consecutive AI shots so each one is visible on the board
+AI_STREAK_DELAY_MS = 350
+# pause before the AI answers a player's miss, and before play starts after placement
+AI_REPLY_DELAY_MS = 300
+START_DELAY_MS = 150
+# how long the final board stays up after a win before the game resets
+GAME_OVER_DELAY_MS = 2500
+# difficulties whose fleet comes from the optimized layout pool instead of random
+# placement; a Hard-style parity hunter finds pooled fleets slightly faster than
+# random ones, so the pool is kept for Expert only
+STRONG_PLACEMENT = ("Expert",)
+# processes the Expert AI samples fleets in during its time budget
+EXPERT_WORKERS = max(1, min(4, os.cpu_count() or 1))
 
 class App:
-    def __init__(self, master, difficulty="Medium", language="English"):
+    def __init__(self, master, difficulty="Medium", language="English", habits=None):
         self.master = master
         self.master.title("Battleship Game")
         self.master.title("Battleship — Seaside Duel")
         # overall window styling
         self.master.configure(bg="#bfe6ff")
         self.frame = Frame(self.master, padx=12, pady=12, bg="#bfe6ff")
-        self.frame.pack(padx=6, pady=6)
+        self.frame.pack(padx=6, pady=6, fill="both", expand=True)
         # game model
         self.player = Player("Player")
         self.player_board = Board()
@@ -22,7 +51,12 @@ class App:
         # settings from start window
         self.difficulty = difficulty
         self.language = language
-        self.ai = AI(self.player_board, difficulty=self.difficulty)
+        # where this player tends to put ships, kept across games
+        self.habits = habits if habits is not None else HabitStore()
+        # the Adaptive AI's strength comes from the offline curve and this session's results
+        self.curve = load_curve()
+        self.results = []
+        self.ai = self._new_ai()
 
         # placement state
         self.ship_specs = [
@@ -35,6 +69,14 @@ class App:
         self.current_ship_index = None   # selected ship index (None = none selected)
         self.placement_orientation = "H"  # 'H' or 'V'
         self.placement_phase = True
+        # legal (row, col, orientation) starts per ship size; emptied whenever the fleet changes
+        self._legal_cache = {}
+        self._hover_cell = None
+        # AI moves are computed off the Tk thread and applied in _apply_ai_move
+        self.ai_worker = AIWorker(self.master, self._apply_ai_move, self._ai_move_failed)
+        self.ai_turn_pending = False
+        self._ai_after_id = None
+        self._game_over_id = None
 
         # top status
         self.status_label = Label(self.frame, text="Place your ships", bg="#cfe8ff", font=("Helvetica", 12, "bold"))
@@ -60,144 +102,10 @@ class App:
         self.back_canvas_text = self.back_canvas.create_text(50, 14, text="Back", font=("Helvetica", 10))
         self.back_canvas.bind('<Button-1>', lambda ev: self.open_start_modal())
 
-        # simple translations dict
-        self._translations = {
-            "English": {
-                "ships_to_place": "Ships to place:",
-                "your_board": "Your board",
-                "enemy_board": "Enemy board",
-                "selected": "Selected: {name} ({size})",
-                "place_ships": "Place your ships",
-                "select_ship": "Select a ship to place",
-                "no_ship_selected": "Please select which ship to place first.",
-                "cannot_place": "Cannot place {name} at {coord} {orient}",
-                "already_placed": "{name} already placed.",
-                "all_placed": "All ships placed. Starting game...",
-                "game_started": "Game started. Your move: click enemy grid to fire.",
-                "place_first": "Finish placing your ships first.",
-                "invalid_move": "You already shot there or it's out of bounds",
-                "ship_sunk": "You sunk my {name}!",
-                "you_win": "You win!",
-                "ai_win": "AI wins!",
-                "ai_miss": "AI missed at {guess}.",
-                "orientation": "Orientation:",
-                "back": "Back",
-                "start": "Start",
-                "exit": "Exit",
-                "language_label": "Language:",
-                "ai_label": "AI Difficulty:",
-                "author": "Author:",
-                "license": "License:",
-            },
-            "Spanish": {
-                "ships_to_place": "Barcos a colocar:",
-                "your_board": "Tu tablero",
-                "enemy_board": "Tablero enemigo",
-                "selected": "Seleccionado: {name} ({size})",
-                "place_ships": "Coloca tus barcos",
-                "select_ship": "Selecciona un barco",
-                "no_ship_selected": "Por favor selecciona primero un barco.",
-                "cannot_place": "No se puede colocar {name} en {coord} {orient}",
-                "already_placed": "{name} ya colocado.",
-                "all_placed": "Todos los barcos colocados. Iniciando...",
-                "game_started": "Juego iniciado. Tu turno: haz clic en el tablero enemigo.",
-                "place_first": "Termina de colocar tus barcos primero.",
-                "invalid_move": "Ya disparaste ahí o está fuera de los límites",
-                "ship_sunk": "¡Hundiste mi {name}!",
-                "you_win": "¡Has ganado!",
-                "ai_win": "¡La IA gana!",
-                "ai_miss": "La IA falló en {guess}.",
-                "orientation": "Orientación:",
-                "back": "Volver",
-                "start": "Iniciar",
-                "exit": "Salir",
-                "language_label": "Idioma:",
-                "ai_label": "Dificultad IA:",
-                "author": "Autor:",
-                "license": "Licencia:",
-            },
-            "Romanian": {
-                "ships_to_place": "Nave de plasat:",
-                "your_board": "Tabela ta",
-                "enemy_board": "Tabela inamică",
-                "selected": "Selectat: {name} ({size})",
-                "place_ships": "Plasează-ți navele",
-                "select_ship": "Selectează o navă de plasat",
-                "no_ship_selected": "Te rugăm să selectezi mai întâi o navă.",
-                "cannot_place": "Nu se poate plasa {name} la {coord} {orient}",
-                "already_placed": "{name} a fost deja plasat.",
-                "all_placed": "Toate navele au fost plasate. Începem jocul...",
-                "game_started": "Jocul a început. E rândul tău: fă clic pe tabla inamică pentru a trage.",
-                "place_first": "Finalizează plasarea navelor înainte.",
-                "invalid_move": "Ai tras deja acolo sau coordonatele sunt în afara grilei",
-                "ship_sunk": "Ai scufundat {name}!",
-                "you_win": "Ai câștigat!",
-                "ai_win": "AI a câștigat!",
-                "ai_miss": "AI a ratat la {guess}.",
-                "orientation": "Orientare:",
-                "back": "Înapoi",
-                "start": "Start",
-                "exit": "Ieșire",
-                "language_label": "Limbă:",
-                "ai_label": "Dificultate AI:",
-                "author": "Autor:",
-                "license": "Licență:",
-            },
-            "French": {
-                "ships_to_place": "Navires à placer:",
-                "your_board": "Votre plateau",
-                "enemy_board": "Plateau ennemi",
-                "selected": "Sélectionné: {name} ({size})",
-                "place_ships": "Placez vos navires",
-                "select_ship": "Sélectionnez un navire à placer",
-                "no_ship_selected": "Veuillez d'abord sélectionner un navire.",
-                "cannot_place": "Impossible de placer {name} en {coord} {orient}",
-                "already_placed": "{name} déjà placé.",
-                "all_placed": "Tous les navires sont placés. Démarrage...",
-                "game_started": "Le jeu a commencé. À vous: cliquez sur la grille ennemie pour tirer.",
-                "place_first": "Terminez d'abord de placer vos navires.",
-                "invalid_move": "Vous avez déjà tiré ici ou c'est hors limites",
-                "ship_sunk": "Vous avez coulé {name}!",
-                "you_win": "Vous avez gagné!",
-                "ai_win": "L'IA a gagné!",
-                "ai_miss": "L'IA a raté en {guess}.",
-                "orientation": "Orientation:",
-                "back": "Retour",
-                "start": "Démarrer",
-                "exit": "Quitter",
-                "language_label": "Langue:",
-                "ai_label": "Difficulté IA:",
-                "author": "Auteur:",
-                "license": "Licence:",
-            },
-            "German": {
-                "ships_to_place": "Schiffe zum Platzieren:",
-                "your_board": "Dein Feld",
-                "enemy_board": "Gegnerisches Feld",
-                "selected": "Ausgewählt: {name} ({size})",
-                "place_ships": "Platziere deine Schiffe",
-                "select_ship": "Wähle ein Schiff zum Platzieren",
-                "no_ship_selected": "Bitte wähle zuerst ein Schiff aus.",
-                "cannot_place": "Kann {name} nicht bei {coord} {orient} platzieren",
-                "already_placed": "{name} bereits platziert.",
-                "all_placed": "Alle Schiffe platziert. Spiel startet...",
-                "game_started": "Spiel gestartet. Dein Zug: Klicke auf das gegnerische Feld, um zu feuern.",
-                "place_first": "Beende zuerst das Platzieren deiner Schiffe.",
-                "invalid_move": "Dort wurde bereits geschossen oder es liegt außerhalb",
-                "ship_sunk": "Du hast {name} versenkt!",
-                "you_win": "Du hast gewonnen!",
-                "ai_win": "KI gewinnt!",
-                "ai_miss": "KI hat bei {guess} verfehlt.",
-                "orientation": "Ausrichtung:",
-                "back": "Zurück",
-                "start": "Start",
-                "exit": "Beenden",
-                "language_label": "Sprache:",
-                "ai_label": "KI Schwierigkeit:",
-                "author": "Autor:",
-                "license": "Lizenz:",
-            }
-        }
+        # strings for the current language; English fills any gaps
+        self._strings = catalog(self.language)
+        # in-window notifications; nothing in the game loop waits on them
+        self.toasts = ToastQueue(self.master)
 
         # apply initial translations for chosen language
         self.apply_translations()
@@ -216,31 +124,54 @@ class App:
             height = preview_cell + 12
             cv = Canvas(self.ship_sel_frame, width=width, height=height, bg="#f5fbff", highlightthickness=1, highlightbackground="#a9d0ff")
             cv.pack(pady=6)
-            draw_ship_preview(cv, size, cell=preview_cell, color="#9bb7a8", emoji="⛴️")
+            draw_ship_preview(cv, size, cell=preview_cell, color="#9bb7a8")
             cv.bind("<Button-1>", lambda ev, i=idx: self.select_ship(i))
             # double-click preview to toggle orientation if desired
             cv.bind("<Double-1>", lambda ev: self.toggle_orientation())
+            playback.register(cv, f"palette:{idx}")
             # store canvas and overlay id placeholder
             self.ship_preview_canvases.append(cv)
             self.ship_preview_overlays.append(None)
 
         # canvases/boards
         self.player_canvas = BoardCanvas(self.frame, self.player_board, cell_size=34, show_ships=True,
-                         click_callback=self.player_board_click, title="Your board")
-        self.player_canvas.grid(row=2, column=0, columnspan=2, padx=(0,8))
+                         click_callback=self.player_board_click, title="Your board",
+                         hover_callback=self.player_board_hover)
+        self.player_canvas.grid(row=2, column=0, columnspan=2, padx=(0,8), sticky="nsew")
         self.ai_canvas = BoardCanvas(self.frame, self.ai_board, cell_size=34, show_ships=False,
                         click_callback=self.ai_board_click, title="Enemy board")
-        self.ai_canvas.grid(row=2, column=2, columnspan=2)
+        self.ai_canvas.grid(row=2, column=2, columnspan=2, sticky="nsew")
+        playback.register(self.player_canvas.canvas, "player_board")
+        playback.register(self.ai_canvas.canvas, "ai_board")
+        # the boards take up whatever room the window gives them
+        self.frame.rowconfigure(2, weight=1)
+        for col in range(4):
+            self.frame.columnconfigure(col, weight=1)
+        # targeting heatmap over the enemy board, toggled with 'h'
+        self.heatmap = HeatmapOverlay(self.ai_canvas, lambda: board_probabilities(self.ai_board))
+        self.master.bind('<Key-h>', lambda e: self.heatmap.toggle())
 
         # initialize placement
         self.setup_placement()
 
     def setup_placement(self):
+        self._cancel_ai_turn()
+        # the last game's notifications are stale in the new placement phase
+        self.toasts.clear()
+        if self._game_over_id is not None:
+            try:
+                self.master.after_cancel(self._game_over_id)
+            except Exception:
+                pass
+            self._game_over_id = None
         self.player_board.reset()
         self.ai_board.reset()
         self.player_canvas.clear()
         self.ai_canvas.clear()
+        self.heatmap.invalidate()
+        self._legal_cache.clear()
         self.current_ship_index = None
+        self._update_ghost()
         self.placement_orientation = "H"
         self.placement_phase = True
         self.currship_lbl.config(text="Select a ship to place")
@@ -272,7 +203,7 @@ class App:
         name, size, sym = self.ship_specs[index]
         for s in self.player_board.ships:
             if s.name == name:
-                messagebox.showinfo(self._t('already_placed').split('\n')[0], self._t('already_placed').format(name=name))
+                self.toasts.notify(self._t('already_placed').format(name=name), "warning", key="placement")
                 return
         self.current_ship_index = index
         # use localized selected text if available
@@ -286,6 +217,7 @@ class App:
             cv.delete("selrect")
             if i == index:
                 cv.create_rectangle(2, 2, int(cv['width'])-2, int(cv['height'])-2, outline="#ff9f1c", width=3, tags="selrect")
+        self._update_ghost()
 
     def toggle_orientation(self):
         self.placement_orientation = "V" if self.placement_orientation == "H" else "H"
@@ -295,6 +227,27 @@ class App:
             self.orient_canvas.itemconfigure(self._orient_text, text=f"Orientation: {self.placement_orientation}")
         except Exception:
             pass
+        self._update_ghost()
+
+    def _legal_placements(self, size):
+        legal = self._legal_cache.get(size)
+        if legal is None:
+            legal = self._legal_cache[size] = self.player_board.legal_placements(size)
+        return legal
+
+    def player_board_hover(self, cell):
+        self._hover_cell = cell
+        self._update_ghost()
+
+    def _update_ghost(self):
+        """Show the selected ship under the cursor, green where it can be placed."""
+        if not self.placement_phase or self.current_ship_index is None or self._hover_cell is None:
+            self.player_canvas.hide_ghost()
+            return
+        size = self.ship_specs[self.current_ship_index][1]
+        row, col = self._hover_cell
+        ok = (row, col, self.placement_orientation) in self._legal_placements(size)
+        self.player_canvas.show_ghost(row, col, size, self.placement_orientation, ok)
 
     def apply_translations(self):
         # update visible UI texts based on self.language
@@ -340,14 +293,16 @@ class App:
         if not self.placement_phase:
             return
         if self.current_ship_index is None:
-            messagebox.showwarning(self._t('select_ship'), self._t('no_ship_selected'))
+            self.toasts.notify(self._t('no_ship_selected'), "warning", key="placement")
             return
         name, size, symbol = self.ship_specs[self.current_ship_index]
         ship = Ship(name, size, [], symbol)
         success = self.player_board.place_ship(ship, (row, col), self.placement_orientation)
         if not success:
-            messagebox.showwarning(self._t('cannot_place').split('\n')[0], self._t('cannot_place').format(name=name, coord=(row, col), orient=self.placement_orientation))
+            self.toasts.notify(self._t('cannot_place').format(name=name, coord=(row, col), orient=self.placement_orientation),
+                               "warning", key="placement")
             return
+        self._legal_cache.clear()
         # draw placed ship on player canvas
         self.player_canvas.draw_ship(ship, color="#9bb7a8")
         # disable the placed ship preview (overlay a greyscale rect)
@@ -358,6 +313,7 @@ class App:
         cv.delete("selrect")
         cv.config(state="disabled")
         self.current_ship_index = None
+        self._update_ghost()
         self.currship_lbl.config(text="Select a ship to place")
         # check if all placed
         if len(self.player_board.ships) >= len(self.ship_specs):
@@ -365,73 +321,130 @@ class App:
             self.currship_lbl.config(text="All ships placed")
             self.status_label.config(text=self._t('all_placed'))
             # automatically start the game when placement is complete
-            self.master.after(150, self.start_game)
+            self.master.after(START_DELAY_MS, self.start_game)
 
     def start_game(self):
-        # AI places randomly
-        self.ai_board.place_ships_randomly()
+        # the stronger AIs hide their fleet in a layout from the precomputed pool
+        if self.difficulty in STRONG_PLACEMENT:
+            place_fleet(self.ai_board)
+        else:
+            self.ai_board.place_ships_randomly()
         # recreate AI with selected difficulty
-        self.ai = AI(self.player_board, difficulty=self.difficulty)
+        self.ai = self._new_ai()
+        if self.difficulty == "Expert":
+            # the sampling processes start while the player takes the first shots
+            montecarlo.warm(EXPERT_WORKERS)
         # ensure AI canvas does not reveal ships; it will draw hits only
         self.ai_canvas.clear()
+        self.heatmap.invalidate()
         self.status_label.config(text=self._t('game_started'))
 
     def ai_board_click(self, row, col):
         if self.placement_phase:
-            messagebox.showinfo(self._t('place_ships'), self._t('place_first'))
+            self.toasts.notify(self._t('place_first'), "warning", key="placement")
+            return
+        if self.ai_turn_pending or self._game_over_id is not None:
+            # the AI is still shooting
             return
         if not self.ai_board.is_valid_guess(row, col):
-            messagebox.showwarning(self._t('invalid_move'), self._t('invalid_move'))
+            self.toasts.notify(self._t('invalid_move'), "warning", key="invalid_move")
             return
+        instrument.mark_turn("player")
         result, ship_name = self.ai_board.receive_shot((row, col))
+        self.heatmap.invalidate()
         if result in ("hit", "sunk"):
             self.ai_canvas.mark_hit(row, col)
             self.status_label.config(text=f"You {result.upper()} {ship_name or ''}".strip())
             if result == "sunk":
-                messagebox.showinfo(self._t('ship_sunk').split('\n')[0], self._t('ship_sunk').format(name=ship_name))
+                self.toasts.notify(self._t('ship_sunk').format(name=ship_name), key="player_sunk")
                 # draw sunk ship on AI canvas for effect
                 for s in self.ai_board.ships:
                     if s.name == ship_name and s.is_sunk():
                         self.ai_canvas.draw_ship(s, color="#7a3b3b")
                         self.ai_canvas.mark_sunk(s)
                 if self.ai_board.all_ships_sunk():
-                    messagebox.showinfo(self._t('you_win').split('\n')[0], self._t('you_win'))
-                    self.reset_game()
+                    self._game_over(self._t('you_win'), "success")
                     return
             # player gets another shot (click again)
             return
         else:
             self.ai_canvas.mark_miss(row, col)
             self.status_label.config(text="Miss! AI's turn...")
-            self.master.after(300, self.ai_turn)
+            self.ai_turn_pending = True
+            self._ai_after_id = self.master.after(AI_REPLY_DELAY_MS, self.ai_turn)
 
     def ai_turn(self):
-        while True:
-            guess = self.ai.make_guess()
-            result, ship_name = self.player_board.receive_shot(guess)
-            self.ai.record_result(guess, result)
-            r, c = guess
-            if result in ("hit", "sunk"):
-                self.player_canvas.mark_hit(r, c)
-                self.status_label.config(text=f"AI {result.upper()} at {guess}")
-                if result == "sunk":
-                    for s in self.player_board.ships:
-                        if s.name == ship_name and s.is_sunk():
-                            self.player_canvas.mark_sunk(s)
-                    if self.player_board.all_ships_sunk():
-                        messagebox.showinfo(self._t('ai_win').split('\n')[0], self._t('ai_win'))
-                        self.reset_game()
-                        return
-                # AI continues (extra turn)
-            else:
-                self.player_canvas.mark_miss(r, c)
-                self.status_label.config(text=self._t('ai_miss').format(guess=guess) + " Your turn.")
-                break
+        """Ask the worker for the AI's next shot; it is applied in _apply_ai_move."""
+        self._ai_after_id = None
+        self.ai_turn_pending = True
+        instrument.mark_turn("ai")
+        self.ai_worker.request(self.ai)
+
+    def _ai_move_failed(self, exc):
+        """The AI raised instead of moving: report it and fire at a random open cell."""
+        traceback.print_exception(type(exc), exc, exc.__traceback__, file=sys.stderr)
+        size = self.player_board.size
+        cells = [(r, c) for r in range(size) for c in range(size) if self.player_board.is_valid_guess(r, c)]
+        if not cells:
+            self.ai_turn_pending = False
+            return
+        guess = random.choice(cells)
+        self.ai.previous_guesses.add(guess)
+        self._apply_ai_move(guess)
+
+    def _apply_ai_move(self, guess):
+        result, ship_name = self.player_board.receive_shot(guess)
+        self.ai.record_result(guess, result)
+        r, c = guess
+        if result in ("hit", "sunk"):
+            self.player_canvas.mark_hit(r, c)
+            self.status_label.config(text=f"AI {result.upper()} at {guess}")
+            if result == "sunk":
+                for s in self.player_board.ships:
+                    if s.name == ship_name and s.is_sunk():
+                        self.player_canvas.mark_sunk(s)
+                # a streak can sink several ships; they share one toast
+                self.toasts.notify(self._t('ai_sunk').format(name=ship_name), "warning", key="ai_sunk")
+                if self.player_board.all_ships_sunk():
+                    self.ai_turn_pending = False
+                    self._game_over(self._t('ai_win'), "warning")
+                    return
+            # AI continues (extra turn)
+            self._ai_after_id = self.master.after(AI_STREAK_DELAY_MS, self.ai_turn)
+        else:
+            self.player_canvas.mark_miss(r, c)
+            self.status_label.config(text=self._t('ai_miss').format(guess=guess) + " Your turn.")
+            self.ai_turn_pending = False
+
+    def _new_ai(self):
+        strength = choose_strength(self.curve, history=self.results) if self.difficulty == "Adaptive" else 0.5
+        return AI(self.player_board, difficulty=self.difficulty, workers=EXPERT_WORKERS,
+                  prior=self.habits.prior(), strength=strength)
+
+    def _game_over(self, text, kind):
+        """Announce the result and reset once the final board has been seen."""
+        # the whole fleet is revealed now, so it counts towards the player's habits
+        self.habits.record([cell for ship in self.player_board.ships for cell in ship.coordinates])
+        # a winner took one turn per miss plus the last; a loser played one per miss
+        won = kind == "success"
+        self.results.append((won, len(self.ai_board.misses) + won))
+        self.status_label.config(text=text)
+        self.toasts.notify(text, kind, key="game_over")
+        self._game_over_id = self.master.after(GAME_OVER_DELAY_MS, self.reset_game)
+
+    def _cancel_ai_turn(self):
+        """Drop any AI move that is scheduled or still being computed."""
+        self.ai_worker.cancel()
+        if self._ai_after_id is not None:
+            try:
+                self.master.after_cancel(self._ai_after_id)
+            except Exception:
+                pass
+            self._ai_after_id = None
+        self.ai_turn_pending = False
 
     def _t(self, key):
-        # simple translator with fallback to English
-        lang = self.language if self.language in self._translations else "English"
-        return self._translations.get(lang, self._translations["English"]).get(key, self._translations["English"].get(key, key))
+        return self._strings.get(key, key)
 
     def reset_game(self):
         """Reset the game state to allow replay/placement.
@@ -441,7 +454,7 @@ class App:
         """
         try:
             # re-create AI with current difficulty and clear any state
-            self.ai = AI(self.player_board, difficulty=self.difficulty)
+            self.ai = self._new_ai()
         except Exception:
             pass
         # reuse existing setup_placement which clears boards/canvases
@@ -466,6 +479,9 @@ class App:
 
     def open_start_modal(self):
         # create a modal start dialog (canvas-driven) to change language/difficulty and restart
+        # stop the AI mid-streak; it must not keep shooting behind the modal
+        resume_ai = self.ai_turn_pending
+        self._cancel_ai_turn()
         # hide the entire main window so only the start/modal is visible
         try:
             self.master.withdraw()
@@ -484,8 +500,8 @@ class App:
         except Exception:
             pass
 
-        langs = ["English", "Spanish", "French", "German", "Romanian"]
-        diffs = ["Easy", "Medium", "Hard"]
+        langs = list(LANGUAGES)
+        diffs = ["Easy", "Medium", "Hard", "Expert", "Adaptive"]
         lang_idx = langs.index(self.language) if self.language in langs else 0
         diff_idx = diffs.index(self.difficulty) if self.difficulty in diffs else 1
 
@@ -516,8 +532,9 @@ class App:
             # apply selections and restore main window
             try:
                 self.language = langs[lang_idx]
+                self._strings = catalog(self.language)
                 self.difficulty = diffs[diff_idx]
-                self.ai = AI(self.player_board, difficulty=self.difficulty)
+                self.ai = self._new_ai()
                 self.reset_game()
                 self.apply_translations()
             except Exception:
@@ -536,7 +553,7 @@ class App:
             except Exception:
                 pass
             try:
-                self.frame.pack(padx=6, pady=6)
+                self.frame.pack(padx=6, pady=6, fill="both", expand=True)
             except Exception:
                 pass
             try:
@@ -567,7 +584,7 @@ class App:
             except Exception:
                 pass
             try:
-                self.frame.pack(padx=6, pady=6)
+                self.frame.pack(padx=6, pady=6, fill="both", expand=True)
             except Exception:
                 pass
             try:
@@ -576,6 +593,9 @@ class App:
                 self.master.update_idletasks()
             except Exception:
                 pass
+            # nothing changed, so let the AI finish the turn it was taking
+            if resume_ai:
+                self.ai_turn()
 
         def on_click(ev):
             nonlocal lang_idx, diff_idx
@@ -600,13 +620,13 @@ class App:
             if 'lang_area' in tags or (lx0 <= x <= lx1 and ly0 <= y <= ly1):
                 lang_idx = (lang_idx + 1) % len(langs)
                 # update modal labels using the newly selected language translations
-                trans = self._translations.get(langs[lang_idx], self._translations.get('English'))
-                canvas.itemconfigure(lang_text, text=f"{trans.get('language_label','Language:')} {langs[lang_idx]}")
-                canvas.itemconfigure(diff_text, text=f"{trans.get('ai_label','AI Difficulty:')} {diffs[diff_idx]}")
-                canvas.itemconfigure(start_text_id, text=trans.get('start','Start'))
-                canvas.itemconfigure(exit_text_id, text=trans.get('exit','Exit'))
-                canvas.itemconfigure(author_id, text=f"{trans.get('author','Author:')} Mihai Sirbu")
-                canvas.itemconfigure(license_id, text=f"{trans.get('license','License:')} MIT License 2025")
+                trans = catalog(langs[lang_idx])
+                canvas.itemconfigure(lang_text, text=f"{trans['language_label']} {langs[lang_idx]}")
+                canvas.itemconfigure(diff_text, text=f"{trans['ai_label']} {diffs[diff_idx]}")
+                canvas.itemconfigure(start_text_id, text=trans['start'])
+                canvas.itemconfigure(exit_text_id, text=trans['exit'])
+                canvas.itemconfigure(author_id, text=f"{trans['author']} Mihai Sirbu")
+                canvas.itemconfigure(license_id, text=f"{trans['license']} MIT License 2025")
                 try:
                     canvas.update_idletasks()
                     w.update()
@@ -616,8 +636,8 @@ class App:
             if 'diff_area' in tags or (dx0 <= x <= dx1 and dy0 <= y <= dy1):
                 diff_idx = (diff_idx + 1) % len(diffs)
                 # update difficulty label using currently selected language
-                trans = self._translations.get(langs[lang_idx], self._translations.get('English'))
-                canvas.itemconfigure(diff_text, text=f"{trans.get('ai_label','AI Difficulty:')} {diffs[diff_idx]}")
+                trans = catalog(langs[lang_idx])
+                canvas.itemconfigure(diff_text, text=f"{trans['ai_label']} {diffs[diff_idx]}")
                 try:
                     canvas.update_idletasks()
                     w.update()
@@ -644,6 +664,7 @@ class App:
 
         # bind canvas click fallback and also bind tags to ensure text/rect item clicks are handled
         canvas.bind('<Button-1>', on_click)
+        playback.register(canvas, "start_modal")
         try:
             canvas.tag_bind('lang_area', '<Button-1>', on_click)
             canvas.tag_bind('diff_area', '<Button-1>', on_click)
@@ -0,0 +1,121 @@
+import asyncio
+import queue
+import socket
+import threading
+import tkinter
+
+
+class MainThreadQueue:
+    """Thread-safe queue whose items are handed to `callback` on the Tk thread.
+
+    Producers on any thread call put(). The Tk side is woken through a
+    socketpair registered with createfilehandler, so items are delivered as
+    soon as they arrive without polling or an `after` timer. Where Tk has
+    no file handlers (Windows) a virtual event is posted instead.
+    """
+
+    def __init__(self, widget, callback):
+        self.widget = widget
+        self.callback = callback
+        self._items = queue.SimpleQueue()
+        self._closed = False
+        self._use_files = hasattr(widget.tk, "createfilehandler")
+        if self._use_files:
+            self._rsock, self._wsock = socket.socketpair()
+            self._rsock.setblocking(False)
+            self._wsock.setblocking(False)
+            widget.tk.createfilehandler(self._rsock, tkinter.READABLE, self._on_wake)
+        else:
+            self._event = f"<<MainThreadQueue{id(self)}>>"
+            widget.bind(self._event, lambda ev: self._drain(), add="+")
+
+    def put(self, item):
+        if self._closed:
+            return
+        self._items.put(item)
+        if self._use_files:
+            try:
+                self._wsock.send(b"\0")
+            except OSError:
+                # socket buffer full: a wake-up is already pending
+                pass
+        else:
+            try:
+                self.widget.event_generate(self._event, when="tail")
+            except Exception:
+                pass
+
+    def _on_wake(self, *args):
+        try:
+            while self._rsock.recv(4096):
+                pass
+        except OSError:
+            pass
+        self._drain()
+
+    def _drain(self):
+        while not self._closed:
+            try:
+                item = self._items.get_nowait()
+            except queue.Empty:
+                return
+            self.callback(item)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._use_files:
+            try:
+                self.widget.tk.deletefilehandler(self._rsock)
+            except Exception:
+                pass
+            self._rsock.close()
+            self._wsock.close()
+
+
+class AsyncioBridge:
+    """Runs an asyncio event loop on a background thread beside Tk's mainloop.
+
+    Coroutines are submitted to the loop with `submit`; code on the loop
+    thread hands work back to Tk with `call_in_tk`, which goes through a
+    MainThreadQueue so the GUI reacts the moment a message arrives.
+    """
+
+    def __init__(self, widget):
+        self.loop = asyncio.new_event_loop()
+        self._calls = MainThreadQueue(widget, lambda call: call[0](*call[1]))
+        self._thread = threading.Thread(target=self._run, name="asyncio-bridge", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Schedule a coroutine on the loop; returns a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_in_loop(self, fn, *args):
+        self.loop.call_soon_threadsafe(fn, *args)
+
+    def call_in_tk(self, fn, *args):
+        self._calls.put((fn, args))
+
+    def close(self):
+        if self.loop.is_closed():
+            return
+
+        def shutdown():
+            for task in asyncio.all_tasks(self.loop):
+                task.cancel()
+            self.loop.stop()
+
+        try:
+            self.loop.call_soon_threadsafe(shutdown)
+        except RuntimeError:
+            pass
+        self._thread.join(timeout=1.0)
+        self._calls.close()
+        if not self._thread.is_alive():
+            self.loop.close()
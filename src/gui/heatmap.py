@@ -0,0 +1,94 @@
+import time
+
+from gui.widgets import STATIC
+
+HEAT_TAG = "heatmap"
+FRAME_MS = 16
+# pale yellow to deep red; level 0 is hidden
+HEAT_COLORS = ("", "#fff3b0", "#ffe08a", "#ffc266", "#ff9f4a", "#f77b3a", "#e5532d", "#c82a22")
+
+
+class HeatmapOverlay:
+    """Optional per-cell shading on a BoardCanvas, driven by a probability grid.
+
+    One stippled rectangle per cell is created the first time the overlay
+    is shown and kept for the life of the widget (it is neither static nor
+    dynamic, so BoardCanvas.clear() leaves it alone). `invalidate()` marks
+    the overlay stale; at most once per display frame it pulls a fresh grid
+    from `source()` and only reconfigures cells whose shade level changed.
+    """
+
+    def __init__(self, board_canvas, source, frame_ms=FRAME_MS):
+        self.board_canvas = board_canvas
+        self.canvas = board_canvas.canvas
+        self.source = source
+        self.frame_ms = frame_ms
+        self.visible = False
+        self._items = None
+        self._levels = None
+        self._dirty = True
+        self._after_id = None
+        self._last_refresh = 0.0
+        self.cells_updated = 0
+
+    def show(self):
+        if self._items is None:
+            self._create()
+        self.visible = True
+        self.invalidate()
+
+    def hide(self):
+        self.visible = False
+        if self._items is not None:
+            self.canvas.itemconfigure(HEAT_TAG, state="hidden")
+            self._levels = [[0] * len(row) for row in self._levels]
+
+    def toggle(self):
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def invalidate(self):
+        """Note that the board changed; the overlay catches up on the next frame."""
+        self._dirty = True
+        if not self.visible or self._after_id is not None:
+            return
+        wait = self.frame_ms - (time.perf_counter() - self._last_refresh) * 1000.0
+        self._after_id = self.canvas.after(max(0, int(wait)), self._refresh)
+
+    def _create(self):
+        size = self.board_canvas.size
+        cs = self.board_canvas.cell
+        off = self.board_canvas.off
+        self._items = []
+        for r in range(size):
+            row = []
+            for c in range(size):
+                x0 = off + c * cs + 1
+                y0 = off + r * cs + 1
+                row.append(self.canvas.create_rectangle(x0, y0, x0 + cs - 2, y0 + cs - 2, outline="",
+                                                        stipple="gray50", state="hidden", tags=HEAT_TAG))
+            self._items.append(row)
+        self._levels = [[0] * size for _ in range(size)]
+        # above the water and grid, below ships and pegs
+        self.canvas.tag_raise(HEAT_TAG, STATIC)
+
+    def _refresh(self):
+        self._after_id = None
+        self._last_refresh = time.perf_counter()
+        if not self.visible or not self._dirty:
+            return
+        self._dirty = False
+        top = len(HEAT_COLORS) - 1
+        for r, row in enumerate(self.source()):
+            for c, value in enumerate(row):
+                level = min(top, int(round(value * top)))
+                if level == self._levels[r][c]:
+                    continue
+                self._levels[r][c] = level
+                self.cells_updated += 1
+                if level:
+                    self.canvas.itemconfigure(self._items[r][c], fill=HEAT_COLORS[level], state="normal")
+                else:
+                    self.canvas.itemconfigure(self._items[r][c], state="hidden")
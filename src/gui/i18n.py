@@ -0,0 +1,84 @@
+"""Translation catalogs.
+
+Strings live in one JSON file per language under gui/locales. A catalog is
+only read when its language is first used; missing keys are filled from
+English at that point, so a lookup is a single dict access. The merged
+catalog is also kept on disk in marshal form (keyed by the source files'
+mtimes) so later runs skip the JSON parse and merge.
+"""
+import marshal
+import os
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".battleship", "cache", "locales")
+
+# display name -> catalog file, in the order the language pickers cycle through
+LANGUAGES = {
+    "English": "en",
+    "Spanish": "es",
+    "French": "fr",
+    "German": "de",
+    "Romanian": "ro",
+}
+FALLBACK = "English"
+
+_catalogs = {}
+
+
+def _source(language):
+    return os.path.join(LOCALES_DIR, LANGUAGES[language] + ".json")
+
+
+def _read_json(path):
+    # only needed when the marshal cache is missing or stale; keeps startup lean
+    import json
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _compile(language):
+    merged = dict(_read_json(_source(FALLBACK)))
+    if language != FALLBACK:
+        merged.update(_read_json(_source(language)))
+    return merged
+
+
+def _stamp(language):
+    return tuple(os.stat(_source(name)).st_mtime_ns for name in sorted({FALLBACK, language}))
+
+
+def catalog(language, cache_dir=None):
+    """Merged strings for `language` (unknown languages get English)."""
+    if language not in LANGUAGES:
+        language = FALLBACK
+    strings = _catalogs.get(language)
+    if strings is not None:
+        return strings
+    cache_dir = CACHE_DIR if cache_dir is None else cache_dir
+    cached = os.path.join(cache_dir, LANGUAGES[language] + ".marshal")
+    stamp = _stamp(language)
+    try:
+        with open(cached, "rb") as fh:
+            saved_stamp, strings = marshal.load(fh)
+        if saved_stamp != stamp:
+            strings = None
+    except (OSError, EOFError, ValueError, TypeError):
+        strings = None
+    if strings is None:
+        strings = _compile(language)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = cached + ".tmp"
+            with open(tmp, "wb") as fh:
+                marshal.dump((stamp, strings), fh)
+            os.replace(tmp, cached)
+        except OSError:
+            # read-only home: keep the in-memory copy only
+            pass
+    _catalogs[language] = strings
+    return strings
+
+
+def clear_cache():
+    """Forget catalogs loaded in this process (the on-disk cache stays)."""
+    _catalogs.clear()
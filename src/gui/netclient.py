@@ -0,0 +1,186 @@
+import asyncio
+from tkinter import Frame, Label
+
+from game.board import Board
+from game.ship import Ship
+from gui.bridge import AsyncioBridge
+from gui.widgets import BoardCanvas
+from net.protocol import MAX_FRAME, ProtocolError, encode, read_message
+
+
+class NetworkClient:
+    """Asyncio side of a network game: owns the connection to the server.
+
+    Runs entirely on the bridge's loop thread. Every message received is
+    passed to `on_message`; a final {"type": "disconnected"} is delivered
+    when the connection ends, with a "reason" when it ended on an error.
+    """
+
+    def __init__(self, host, port, on_message):
+        self.host = host
+        self.port = port
+        self.on_message = on_message
+        self.writer = None
+
+    async def run(self, hello):
+        reason = None
+        try:
+            reader, self.writer = await asyncio.open_connection(self.host, self.port, limit=MAX_FRAME)
+            self.writer.write(encode(hello))
+            while True:
+                msg = await read_message(reader)
+                if msg is None:
+                    break
+                self.on_message(msg)
+        except (OSError, asyncio.IncompleteReadError, ProtocolError) as exc:
+            reason = str(exc) or type(exc).__name__
+            self.on_message({"type": "error", "reason": reason})
+        finally:
+            if self.writer is not None:
+                self.writer.close()
+                self.writer = None
+            self.on_message({"type": "disconnected", "reason": reason})
+
+    def send(self, msg):
+        if self.writer is not None:
+            self.writer.write(encode(msg))
+
+
+def board_from_fleet(fleet):
+    """Build a Board holding the ships listed in a server "fleet" message."""
+    board = Board()
+    for name, cells in fleet:
+        cells = [tuple(c) for c in cells]
+        start = min(cells)
+        orientation = 'V' if len(cells) > 1 and cells[0][1] == cells[1][1] else 'H'
+        board.place_ship(Ship(name, len(cells), [], name[0]), start, orientation)
+    return board
+
+
+class NetworkApp:
+    """Player-vs-player window for the multiplayer server.
+
+    Network I/O runs on an AsyncioBridge; incoming messages are dispatched
+    on the Tk thread as soon as they arrive and update the BoardCanvas
+    widgets directly.
+    """
+
+    def __init__(self, master, host, port):
+        self.master = master
+        self.master.title("Battleship — Seaside Duel (online)")
+        self.master.configure(bg="#bfe6ff")
+        self.frame = Frame(self.master, padx=12, pady=12, bg="#bfe6ff")
+        self.frame.pack(padx=6, pady=6, fill="both", expand=True)
+        self.hdr = Label(self.frame, text="Battleship — Seaside Duel", bg="#bfe6ff", fg="#022f40", font=("Helvetica", 18, "bold"))
+        self.hdr.grid(row=0, column=0, columnspan=2, pady=(0, 8))
+        self.status_label = Label(self.frame, text=f"Connecting to {host}:{port}...", bg="#cfe8ff", font=("Helvetica", 12, "bold"))
+        self.status_label.grid(row=1, column=0, columnspan=2)
+
+        self.seat = None
+        self.turn = None
+        self.finished = False
+        self._awaiting_shot = False
+        self.player_canvas = BoardCanvas(self.frame, Board(), cell_size=34, show_ships=True, title="Your board")
+        self.player_canvas.grid(row=2, column=0, padx=(0, 8), sticky="nsew")
+        self.enemy_board = Board()
+        self.ai_canvas = BoardCanvas(self.frame, self.enemy_board, cell_size=34, show_ships=False,
+                                     click_callback=self.enemy_board_click, title="Enemy board")
+        self.ai_canvas.grid(row=2, column=1, sticky="nsew")
+        self.frame.rowconfigure(2, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.columnconfigure(1, weight=1)
+
+        self._handlers = {
+            "joined": self._on_joined,
+            "start": self._on_start,
+            "shot": self._on_shot,
+            "over": self._on_over,
+            "opponent_away": lambda msg: self.status_label.config(text="Opponent disconnected, waiting for them to return..."),
+            "opponent_back": lambda msg: self._show_turn(),
+            "error": self._on_error,
+            "disconnected": self._on_disconnected,
+        }
+        self.bridge = AsyncioBridge(self.master)
+        self.client = NetworkClient(host, port, lambda msg: self.bridge.call_in_tk(self.handle_message, msg))
+        self.bridge.submit(self.client.run({"type": "join"}))
+        self.master.protocol("WM_DELETE_WINDOW", self.close)
+
+    def handle_message(self, msg):
+        handler = self._handlers.get(msg.get("type"))
+        if handler is not None:
+            handler(msg)
+
+    def enemy_board_click(self, row, col):
+        if self.finished or self.turn is None or self.turn != self.seat:
+            return
+        if not self.enemy_board.is_valid_guess(row, col):
+            return
+        # wait for the server's verdict before allowing another shot
+        self.turn = None
+        self._awaiting_shot = True
+        self.bridge.call_in_loop(self.client.send, {"type": "fire", "row": row, "col": col})
+
+    def close(self):
+        self.bridge.close()
+        self.master.destroy()
+
+    # --- message handlers ---
+    def _on_joined(self, msg):
+        self.seat = msg["seat"]
+        self.player_canvas.board = board_from_fleet(msg["fleet"])
+        self.player_canvas.clear()
+        self.player_canvas.draw_ships()
+        self.status_label.config(text="Waiting for an opponent...")
+
+    def _on_start(self, msg):
+        self.turn = msg["turn"]
+        self._show_turn()
+
+    def _on_shot(self, msg):
+        row, col, result = msg["row"], msg["col"], msg["result"]
+        mine = msg["seat"] == self.seat
+        canvas = self.ai_canvas if mine else self.player_canvas
+        if mine:
+            self._awaiting_shot = False
+            # remember our own shots so repeated clicks are caught locally
+            (self.enemy_board.misses if result == "miss" else self.enemy_board.hits).add((row, col))
+        if result == "miss":
+            canvas.mark_miss(row, col)
+        else:
+            canvas.mark_hit(row, col)
+        if result == "sunk":
+            if mine and msg.get("cells"):
+                ship = Ship(msg["ship"], len(msg["cells"]), [tuple(c) for c in msg["cells"]], "?")
+                self.ai_canvas.draw_ship(ship, color="#7a3b3b")
+                self.ai_canvas.mark_sunk(ship)
+            elif not mine:
+                for ship in self.player_canvas.board.ships:
+                    if ship.name == msg["ship"]:
+                        self.player_canvas.mark_sunk(ship)
+        self.turn = msg["turn"]
+        self._show_turn()
+
+    def _on_over(self, msg):
+        self.finished = True
+        self.status_label.config(text="You win!" if msg["winner"] == self.seat else "Opponent wins!")
+
+    def _on_error(self, msg):
+        self.status_label.config(text=f"Server: {msg.get('reason')}")
+        if self._awaiting_shot:
+            # the shot was rejected; it is still our turn
+            self._awaiting_shot = False
+            self.turn = self.seat
+
+    def _on_disconnected(self, msg):
+        if not self.finished:
+            reason = msg.get("reason")
+            self.status_label.config(text=f"Disconnected from server: {reason}" if reason else "Disconnected from server.")
+        self.turn = None
+
+    def _show_turn(self):
+        if self.finished or self.turn is None:
+            return
+        if self.turn == self.seat:
+            self.status_label.config(text="Your turn: click the enemy grid to fire.")
+        else:
+            self.status_label.config(text="Opponent's turn...")
@@ -0,0 +1,154 @@
+"""Record and replay GUI input for end-to-end latency measurements.
+
+Widgets that take part are registered under a stable role ("start",
+"palette:2", "player_board", ...) so a script recorded on one build still
+finds its targets after the widget tree changes. Widgets without a role
+are addressed by their Tk path.
+
+A script is JSON: {"version": 1, "events": [{"t": seconds since the first
+event, "type": "click" | "key", "role": ..., "x": ..., "y": ...} or
+{..., "keysym": ...}]}.
+"""
+import time
+import weakref
+
+SCRIPT_VERSION = 1
+FIND_TIMEOUT = 10.0    # seconds to wait for a target widget to appear (e.g. App after Start)
+
+_widgets = weakref.WeakValueDictionary()
+
+
+def register(widget, role):
+    """Give `widget` a stable name for recording and replay."""
+    widget._playback_role = role
+    _widgets[role] = widget
+
+
+def role_of(widget):
+    role = getattr(widget, "_playback_role", None)
+    return role if role is not None else str(widget)
+
+
+def find(root, role):
+    widget = _widgets.get(role)
+    if widget is not None:
+        try:
+            if widget.winfo_exists():
+                return widget
+        except Exception:
+            pass
+        return None
+    if role.startswith("."):
+        try:
+            return root.nametowidget(role)
+        except KeyError:
+            return None
+    return None
+
+
+class Recorder:
+    """Captures left clicks and key presses anywhere in the application."""
+
+    def __init__(self, root):
+        self.root = root
+        self.events = []
+        self._started = None
+        root.bind_all("<ButtonPress-1>", self._on_click, add="+")
+        root.bind_all("<KeyPress>", self._on_key, add="+")
+
+    def _stamp(self):
+        now = time.perf_counter()
+        if self._started is None:
+            self._started = now
+        return round(now - self._started, 4)
+
+    def _on_click(self, event):
+        self.events.append({"t": self._stamp(), "type": "click", "role": role_of(event.widget),
+                            "x": event.x, "y": event.y})
+
+    def _on_key(self, event):
+        self.events.append({"t": self._stamp(), "type": "key", "role": role_of(event.widget),
+                            "keysym": event.keysym})
+
+    def save(self, path):
+        import json
+        with open(path, "w") as fh:
+            json.dump({"version": SCRIPT_VERSION, "events": self.events}, fh, indent=1)
+        return path
+
+
+def load(path):
+    import json
+    with open(path) as fh:
+        script = json.load(fh)
+    if script.get("version") != SCRIPT_VERSION:
+        raise ValueError(f"unsupported script version {script.get('version')!r}")
+    return script["events"]
+
+
+class Player:
+    """Replays a script with event_generate and times each action until it is painted.
+
+    An action's latency runs from generating the input to the end of the
+    idle pass that redraws the affected canvases. Between actions the event
+    loop keeps running (AI turns, animations), either on the recorded
+    schedule scaled by `speed` or, with speed=0, only until it goes idle.
+    """
+
+    def __init__(self, root, speed=1.0):
+        self.root = root
+        self.speed = speed
+        self.results = []
+
+    def _pump_until(self, deadline):
+        while True:
+            self.root.update()
+            if time.perf_counter() >= deadline:
+                return
+            time.sleep(0.001)
+
+    def _target(self, role):
+        deadline = time.perf_counter() + FIND_TIMEOUT
+        while True:
+            widget = find(self.root, role)
+            if widget is not None:
+                return widget
+            if time.perf_counter() > deadline:
+                raise LookupError(f"no widget for role {role!r}")
+            self._pump_until(time.perf_counter() + 0.01)
+
+    def play(self, events):
+        started = time.perf_counter()
+        for event in events:
+            if self.speed:
+                self._pump_until(started + event["t"] / self.speed)
+            else:
+                self.root.update()
+            widget = self._target(event["role"])
+            began = time.perf_counter()
+            if event["type"] == "click":
+                widget.event_generate("<ButtonPress-1>", x=event["x"], y=event["y"])
+                widget.event_generate("<ButtonRelease-1>", x=event["x"], y=event["y"])
+            else:
+                widget.event_generate("<KeyPress>", keysym=event["keysym"])
+            # bindings ran synchronously above; redraws happen in the idle pass
+            self.root.update_idletasks()
+            self.results.append({"type": event["type"], "role": event["role"],
+                                 "latency_ms": (time.perf_counter() - began) * 1000.0})
+        return self.results
+
+    def summary(self):
+        """Latency percentiles per target role."""
+        by_role = {}
+        for result in self.results:
+            by_role.setdefault(result["role"].split(":")[0], []).append(result["latency_ms"])
+        report = {}
+        for role, values in sorted(by_role.items()):
+            values.sort()
+            report[role] = {
+                "count": len(values),
+                "p50": values[len(values) // 2],
+                "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+                "max": values[-1],
+            }
+        return report
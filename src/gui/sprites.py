@@ -0,0 +1,199 @@
+import weakref
+from tkinter import PhotoImage
+
+# colours shared with the vector drawing this cache replaces
+SHIP_OUTLINE = "#3e2e2e"
+PREVIEW_OUTLINE = "#5a3e2a"
+PLANK = "#6f4f36"
+SHADOW = "#5b6b75"
+SUNK = "#5a1f1f"
+PORTHOLE = "#dfe9ef"
+
+# cumulative scale of a hit peg over its pop animation; the last entry is the
+# size it settles at
+HIT_POP_SCALES = (1.2, 1.392, 1.559, 1.684, 1.751)
+# cell sizes whose board sprites are kept after the last board leaves them,
+# so resizing back and forth does not render them again
+KEEP_SIZES = 2
+
+
+def _in_hull(x, y, length, thick, radius, shrink):
+    """Is (x, y) inside a horizontal hull (rect with elliptic caps) inset by `shrink`?"""
+    rx = radius / 2.0 - shrink
+    ry = thick / 2.0 - shrink
+    if rx <= 0 or ry <= 0:
+        return False
+    if radius / 2.0 <= x <= length - radius / 2.0 and shrink <= y <= thick - shrink:
+        return True
+    for cx in (radius / 2.0, length - radius / 2.0):
+        if ((x - cx) / rx) ** 2 + ((y - thick / 2.0) / ry) ** 2 <= 1.0:
+            return True
+    return False
+
+
+def ship_pixels(length, thick, radius, color, outline=SHIP_OUTLINE, shadow=True, plank_inset=6, state="normal"):
+    """Rasterize a horizontal ship hull into rows of colour strings (None = transparent).
+
+    Mirrors the vector ship: optional stippled shadow offset below-right,
+    a rounded hull with a 2px outline, vertical planks and a porthole in the
+    middle. A "sunk" state repaints fill, planks and shadow in SUNK.
+    """
+    if state == "sunk":
+        color = plank = shade = port = SUNK
+    else:
+        plank, shade, port = PLANK, SHADOW, PORTHOLE
+    width = length + (7 if shadow else 1)
+    height = thick + (11 if shadow else 1)
+    planks = max(1, int(length // 12))
+    plank_xs = {int(radius / 2 + i * ((length - radius) / planks)) for i in range(1, planks)}
+    port_r = max(2.0, thick * 0.18)
+    rows = []
+    for py in range(height):
+        y = py + 0.5
+        row = []
+        for px in range(width):
+            x = px + 0.5
+            if _in_hull(x, y, length, thick, radius, 0):
+                if not _in_hull(x, y, length, thick, radius, 2):
+                    row.append(outline)
+                    continue
+                d2 = (x - length / 2.0) ** 2 + (y - thick / 2.0) ** 2
+                if d2 <= port_r ** 2:
+                    row.append(port if d2 <= (port_r - 1.5) ** 2 else outline)
+                elif px in plank_xs and plank_inset <= y <= thick - plank_inset:
+                    row.append(plank)
+                else:
+                    row.append(color)
+            elif shadow and 4 <= x <= length + 6 and 6 <= y <= thick + 10 and px % 2 == 0 and py % 2 == 0:
+                # 25% dither, like the gray25 stipple of the vector shadow
+                row.append(shade)
+            else:
+                row.append(None)
+        rows.append(row)
+    return rows
+
+
+def peg_pixels(kind, radius):
+    """Rasterize a hit peg (red with a white cross), a miss peg or its splash."""
+    fill, outline, ring = {
+        "hit": ("#d62828", "#7b0000", 1.0),
+        "miss": ("#ffffff", "#bfbfbf", 2.0),
+        "splash": ("#e8f6ff", "#9fd3ff", 2.0),
+    }[kind]
+    size = int(2 * radius) + 3
+    c = size / 2.0
+    arm = radius * 0.55
+    rows = []
+    for py in range(size):
+        y = py + 0.5 - c
+        row = []
+        for px in range(size):
+            x = px + 0.5 - c
+            d2 = x * x + y * y
+            if d2 > radius * radius:
+                row.append(None)
+            elif d2 > (radius - ring) ** 2:
+                row.append(outline)
+            elif kind == "hit" and abs(x) <= arm and abs(y) <= arm and min(abs(x - y), abs(x + y)) <= 1.06:
+                row.append("white")
+            else:
+                row.append(fill)
+        rows.append(row)
+    return rows
+
+
+def transpose(rows):
+    return [list(col) for col in zip(*rows)]
+
+
+def to_photo(master, rows):
+    """Copy pixel rows into a new PhotoImage, leaving None pixels transparent."""
+    height = len(rows)
+    width = len(rows[0]) if rows else 0
+    img = PhotoImage(master=master, width=width, height=height)
+    for y, row in enumerate(rows):
+        x = 0
+        while x < width:
+            if row[x] is None:
+                x += 1
+                continue
+            start = x
+            while x < width and row[x] is not None:
+                x += 1
+            img.put("{" + " ".join(row[start:x]) + "}", to=(start, y))
+    return img
+
+
+class SpriteCache:
+    """Pre-rendered ship and peg images, shared by every canvas of a window.
+
+    Each look is rendered once per key, e.g. (length, orientation, colour,
+    cell size, state) for ships, and then placed as a single image item.
+    Boards report their cell size through use_cell() so ship and peg
+    sprites of sizes no board is drawn at any more can be let go; the
+    KEEP_SIZES most recently used sizes are kept regardless.
+    """
+
+    def __init__(self, master):
+        self.master = master
+        self._images = {}
+        self._cells = weakref.WeakKeyDictionary()    # board -> cell size it draws at
+        self._recent = []                             # last KEEP_SIZES sizes passed to use_cell
+
+    @classmethod
+    def for_widget(cls, widget):
+        root = widget._root()
+        cache = getattr(root, "_sprite_cache", None)
+        if cache is None:
+            cache = root._sprite_cache = cls(root)
+        return cache
+
+    def __len__(self):
+        return len(self._images)
+
+    def clear(self):
+        self._images.clear()
+
+    def use_cell(self, owner, cell):
+        """Record that `owner` now draws at `cell` and drop board sprites of unused sizes."""
+        self._cells[owner] = cell
+        if cell in self._recent:
+            self._recent.remove(cell)
+        self._recent.append(cell)
+        del self._recent[:-KEEP_SIZES]
+        live = set(self._cells.values()) | set(self._recent)
+        for key in list(self._images):
+            size = key[4] if key[0] == "ship" else key[2] if key[0] == "peg" else None
+            if size is not None and size not in live:
+                del self._images[key]
+
+    def ship(self, length, orientation, color, cell, state="normal"):
+        """Board ship of `length` cells; anchor its top-left 6px inside the first cell."""
+        key = ("ship", length, orientation, color, cell, state)
+        img = self._images.get(key)
+        if img is None:
+            radius = max(8, min(16, cell // 3))
+            rows = ship_pixels(length * cell - 12, cell - 12, radius, color, state=state)
+            if orientation == 'V':
+                rows = transpose(rows)
+            img = self._images[key] = to_photo(self.master, rows)
+        return img
+
+    def preview(self, length, cell, color):
+        """Palette ship, drawn without a shadow like the old vector preview."""
+        key = ("preview", length, color, cell)
+        img = self._images.get(key)
+        if img is None:
+            radius = max(6, min(12, cell // 3))
+            rows = ship_pixels(length * cell, cell, radius, color, outline=PREVIEW_OUTLINE, shadow=False, plank_inset=5)
+            img = self._images[key] = to_photo(self.master, rows)
+        return img
+
+    def peg(self, kind, cell, scale=1.0):
+        """Hit, miss or splash peg for a cell size, optionally scaled (pop frames)."""
+        key = ("peg", kind, cell, scale)
+        img = self._images.get(key)
+        if img is None:
+            radius = cell * (0.20 if kind == "hit" else 0.14) * scale
+            img = self._images[key] = to_photo(self.master, peg_pixels(kind, radius))
+        return img
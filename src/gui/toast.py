@@ -0,0 +1,136 @@
+from collections import deque
+from tkinter import Canvas
+
+TOAST_MS = 2200       # how long a toast stays up (restarted when a message joins it)
+MAX_LINES = 3
+TOAST_COLORS = {
+    "info": ("#022f40", "#ffffff"),
+    "success": ("#2f6b45", "#ffffff"),
+    "warning": ("#a94444", "#ffffff"),
+}
+
+
+class Notification:
+    """One toast's worth of messages; repeats of a line are counted, not duplicated."""
+
+    __slots__ = ("key", "kind", "lines")
+
+    def __init__(self, key, kind):
+        self.key = key
+        self.kind = kind
+        self.lines = []    # [text, count]
+
+    def add(self, text):
+        for line in self.lines:
+            if line[0] == text:
+                line[1] += 1
+                return
+        self.lines.append([text, 1])
+
+    def render(self, max_lines=MAX_LINES):
+        shown = [text if count == 1 else f"{text} (x{count})" for text, count in self.lines[:max_lines]]
+        if len(self.lines) > max_lines:
+            shown.append(f"+{len(self.lines) - max_lines} more")
+        return "\n".join(shown)
+
+
+class NotificationQueue:
+    """FIFO of notifications; a message whose key is already queued joins that entry."""
+
+    def __init__(self):
+        self._items = deque()
+
+    def __len__(self):
+        return len(self._items)
+
+    def push(self, text, kind="info", key=None):
+        if key is not None:
+            for item in self._items:
+                if item.key == key:
+                    item.add(text)
+                    return item
+        item = Notification(key, kind)
+        item.add(text)
+        self._items.append(item)
+        return item
+
+    def pop(self):
+        return self._items.popleft() if self._items else None
+
+    def clear(self):
+        self._items.clear()
+
+
+class ToastQueue:
+    """Non-blocking replacement for messagebox popups.
+
+    Messages show one toast at a time near the top of `master`, each for
+    TOAST_MS, and never take a grab or run a nested event loop. Bursts are
+    coalesced: a message with the same key as the toast on screen joins it
+    (and keeps it up a little longer), and one with the key of a queued
+    toast joins that. Clicking a toast dismisses it.
+    """
+
+    def __init__(self, master, duration_ms=TOAST_MS, max_lines=MAX_LINES):
+        self.master = master
+        self.duration_ms = duration_ms
+        self.max_lines = max_lines
+        self.pending = NotificationQueue()
+        self.current = None
+        self._after_id = None
+        self.canvas = Canvas(master, highlightthickness=0, bd=0)
+        self._box = self.canvas.create_rectangle(0, 0, 0, 0, outline="")
+        self._text = self.canvas.create_text(0, 0, anchor="nw", font=("Helvetica", 11, "bold"), justify="center")
+        self.canvas.bind("<Button-1>", lambda ev: self._next())
+
+    def notify(self, text, kind="info", key=None):
+        current = self.current
+        if current is not None and key is not None and current.key == key:
+            current.add(text)
+            self._render()
+            self._restart_timer()
+            return
+        self.pending.push(text, kind, key)
+        if current is None:
+            self._next()
+
+    def clear(self):
+        """Drop everything, e.g. when the board is reset."""
+        self.pending.clear()
+        self._cancel_timer()
+        self.current = None
+        self.canvas.place_forget()
+
+    def _next(self):
+        self._cancel_timer()
+        self.current = self.pending.pop()
+        if self.current is None:
+            self.canvas.place_forget()
+            return
+        self._render()
+        self.canvas.place(relx=0.5, y=8, anchor="n")
+        self.canvas.lift()
+        self._restart_timer()
+
+    def _render(self):
+        bg, fg = TOAST_COLORS.get(self.current.kind, TOAST_COLORS["info"])
+        pad = 10
+        self.canvas.itemconfigure(self._text, text=self.current.render(self.max_lines), fill=fg)
+        self.canvas.coords(self._text, pad, pad)
+        x0, y0, x1, y1 = self.canvas.bbox(self._text)
+        width, height = x1 + pad, y1 + pad
+        self.canvas.coords(self._box, 0, 0, width, height)
+        self.canvas.itemconfigure(self._box, fill=bg)
+        self.canvas.configure(width=width, height=height, bg=bg)
+
+    def _restart_timer(self):
+        self._cancel_timer()
+        self._after_id = self.master.after(self.duration_ms, self._next)
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            try:
+                self.master.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
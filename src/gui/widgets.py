@@ -2,6 +2,32 @@ from tkinter import Canvas, Frame, Label
 from tkinter import Canvas, Frame, Label
 import math
 
+from gui.animation import Animator
+from gui.sprites import HIT_POP_SCALES, SpriteCache
+
+# canvas layers: the grid is drawn once under STATIC; ships, pegs and
+# overlays go under DYNAMIC so a reset only has to delete that tag
+STATIC = "static"
+DYNAMIC = "dynamic"
+GHOST = "ghost"
+LABEL = "label"
+SUNK_TEXT = "sunk_text"
+GHOST_OK = "#3fbf5f"
+GHOST_BAD = "#e04040"
+# margin for the row/column labels at the design cell size; it scales with the cell
+MARGIN = 30
+MIN_CELL = 16
+# a window drag is rescaled once it has been still this long
+RESIZE_DEBOUNCE_MS = 100
+
+
+def ui_scale(widget):
+    """Display scale relative to a 96 dpi screen (tk scaling is pixels per point)."""
+    try:
+        return max(1.0, float(widget.tk.call("tk", "scaling")) * 72.0 / 96.0)
+    except Exception:
+        return 1.0
+
 
 class BoardCanvas(Frame):
     """Canvas-based board widget with improved visuals:
@@ -9,74 +35,218 @@ class BoardCanvas(Frame):
     - rounded, textured ships with shadow
     - animated hit pegs and subtle miss pegs
     - grid labels
+
+    Ships and pegs are single image items whose pictures come from a
+    SpriteCache shared by the whole window; their pop and splash effects
+    are played by the window's Animator.
+
+    The water, labels and grid lines form a static layer drawn once;
+    clear() only removes the dynamic layer on top of it.
+
+    The cell size starts at `cell_size` times the display scale and then
+    follows the canvas size. A resize scales the items already on the
+    canvas in place and only swaps ship and peg images for sprites of the
+    new cell size.
     """
 
-    def __init__(self, master, board, cell_size=36, show_ships=False, click_callback=None, title=None):
+    def __init__(self, master, board, cell_size=36, show_ships=False, click_callback=None, title=None,
+                 hover_callback=None):
         super().__init__(master, bg="#cfe8ff")
         self.board = board
-        self.cell = cell_size
+        self.cell = max(MIN_CELL, int(round(cell_size * ui_scale(self))))
+        self.off = MARGIN * self.cell / float(cell_size)
+        self._design_cell = self.cell
         self.size = board.size
         self.show_ships = show_ships
         self.click_callback = click_callback
+        self.hover_callback = hover_callback
         if title:
             lbl = Label(self, text=title, bg="#cfe8ff", font=("Helvetica", 10, "bold"))
             lbl.pack(anchor="w")
             self.title_label = lbl
         else:
             self.title_label = None
-        self.canvas = Canvas(self, width=self.cell * (self.size) + 40, height=self.cell * (self.size) + 40, bg="#e6f2ff", highlightthickness=0)
-        self.canvas.pack()
+        side = math.ceil(self.off + self.cell * self.size + self.off / 3)
+        self.canvas = Canvas(self, width=side, height=side, bg="#e6f2ff", highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
         self._ship_items = {}
+        self._ship_looks = {}    # ship -> (length, orientation, color, state) of its sprite
         self._peg_items = {}
+        self._peg_kinds = {}     # (row, col) -> "hit" or "miss"
+        self._resize_after_id = None
+        self._ghost_item = None
+        self._ghost_state = None
+        self._hover_cell = None
+        self.sprites = SpriteCache.for_widget(self)
+        self.sprites.use_cell(self, self.cell)
+        self.animator = Animator.for_widget(self)
         self._draw_grid()
         self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Configure>", self._on_configure)
+        if hover_callback is not None:
+            self.canvas.bind("<Motion>", self._on_motion)
+            self.canvas.bind("<Leave>", self._on_leave)
         if self.show_ships:
             self.draw_ships()
 
     # --- drawing helpers ---
     def _draw_grid(self):
         cs = self.cell
-        off = 30
-        w = off + self.size * cs + 10
-        h = off + self.size * cs + 10
+        off = self.off
+        w = off + self.size * cs + off / 3
+        h = off + self.size * cs + off / 3
         # water background: alternating subtle waves
-        self.canvas.create_rectangle(0, 0, w + 10, h + 10, fill="#cde7ff", outline="")
+        self.canvas.create_rectangle(0, 0, w + 10, h + 10, fill="#cde7ff", outline="", tags=STATIC)
         for i in range(0, int(h / 8)):
             y = i * 8 + 18
             color = "#cfefff" if i % 2 == 0 else "#d9f2ff"
-            self.canvas.create_line(0, y, w + 10, y, fill=color)
+            self.canvas.create_line(0, y, w + 10, y, fill=color, tags=STATIC)
 
         # column letters and row numbers
         for c in range(self.size):
-            self.canvas.create_text(off + c * cs + cs / 2, 12, text=chr(ord("A") + c), font=("Helvetica", 10, "bold"), fill="#034f84")
+            self.canvas.create_text(off + c * cs + cs / 2, off * 0.4, text=chr(ord("A") + c), font=self._label_font(), fill="#034f84", tags=(STATIC, LABEL))
         for r in range(self.size):
-            self.canvas.create_text(12, off + r * cs + cs / 2, text=str(r + 1), font=("Helvetica", 10, "bold"), fill="#034f84")
+            self.canvas.create_text(off * 0.4, off + r * cs + cs / 2, text=str(r + 1), font=self._label_font(), fill="#034f84", tags=(STATIC, LABEL))
 
         # grid lines with softened color
         for i in range(self.size + 1):
             x = off + i * cs
-            self.canvas.create_line(x, off, x, off + self.size * cs, fill="#7ea9ff")
+            self.canvas.create_line(x, off, x, off + self.size * cs, fill="#7ea9ff", tags=STATIC)
         for j in range(self.size + 1):
             y = off + j * cs
-            self.canvas.create_line(off, y, off + self.size * cs, y, fill="#7ea9ff")
+            self.canvas.create_line(off, y, off + self.size * cs, y, fill="#7ea9ff", tags=STATIC)
 
-    def _on_click(self, event):
-        off = 30
-        x = event.x - off
-        y = event.y - off
+    def _label_font(self):
+        return ("Helvetica", max(6, int(round(10 * self.cell / float(self._design_cell)))), "bold")
+
+    def _cell_origin(self, row, col):
+        return (self.off + col * self.cell, self.off + row * self.cell)
+
+    def cell_at(self, x, y):
+        """Board (row, col) under canvas point (x, y), or None outside the grid."""
+        x -= self.off
+        y -= self.off
         if x < 0 or y < 0:
-            return
+            return None
         col = int(x // self.cell)
         row = int(y // self.cell)
         if 0 <= row < self.size and 0 <= col < self.size:
-            if callable(self.click_callback):
-                self.click_callback(row, col)
+            return (row, col)
+        return None
+
+    def _on_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None and callable(self.click_callback):
+            self.click_callback(*cell)
+
+    def _on_motion(self, event):
+        # motion events come in far more often than the cell changes
+        cell = self.cell_at(event.x, event.y)
+        if cell != self._hover_cell:
+            self._hover_cell = cell
+            self.hover_callback(cell)
+
+    def _on_leave(self, event):
+        if self._hover_cell is not None:
+            self._hover_cell = None
+            self.hover_callback(None)
+
+    # --- placement ghost ---
+    def show_ghost(self, row, col, length, orientation, ok):
+        """Outline a ship of `length` starting at (row, col), green if `ok` else red.
+
+        The ghost is one rectangle kept across clears; it is only
+        reconfigured when what it shows actually changes.
+        """
+        state = (row, col, length, orientation, ok)
+        if state == self._ghost_state:
+            return
+        self._ghost_state = state
+        off = self.off
+        cs = self.cell
+        # clip to the board so an overhanging ship still shows where it would go
+        r1 = min(self.size, row + (length if orientation == 'V' else 1))
+        c1 = min(self.size, col + (length if orientation == 'H' else 1))
+        coords = (off + col * cs + 2, off + row * cs + 2, off + c1 * cs - 2, off + r1 * cs - 2)
+        color = GHOST_OK if ok else GHOST_BAD
+        if self._ghost_item is None:
+            self._ghost_item = self.canvas.create_rectangle(*coords, outline=color, fill=color, stipple="gray25",
+                                                            width=2, tags=GHOST)
+        else:
+            self.canvas.coords(self._ghost_item, *coords)
+            self.canvas.itemconfigure(self._ghost_item, outline=color, fill=color, state="normal")
+        self.canvas.tag_raise(GHOST)
+
+    def hide_ghost(self):
+        if self._ghost_state is None:
+            return
+        self._ghost_state = None
+        self.canvas.itemconfigure(self._ghost_item, state="hidden")
+
+    # --- resizing ---
+    def _on_configure(self, event):
+        # a window drag produces configure events for its whole length;
+        # re-rendering sprites for every size on the way is too slow, so
+        # rescale once the size has not changed for RESIZE_DEBOUNCE_MS
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def destroy(self):
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        Frame.destroy(self)
+
+    def _apply_resize(self):
+        self._resize_after_id = None
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return
+        # the label margin is MARGIN + MARGIN / 3 at the design cell size
+        margins = (self.off + self.off / 3) / self.cell
+        # the epsilon keeps float error from costing a cell on an exact fit
+        cell = max(MIN_CELL, int(min(width, height) / (self.size + margins) + 1e-9))
+        if cell != self.cell:
+            self.rescale(cell)
+
+    def rescale(self, cell):
+        """Scale everything on the canvas to a new cell size without redrawing it."""
+        factor = cell / float(self.cell)
+        # running pop/splash frames hold images for the old size: settle them
+        self.animator.cancel(self)
+        self.canvas.scale("all", 0, 0, factor, factor)
+        self.off *= factor
+        self.cell = cell
+        # text and images do not scale with the canvas
+        self.canvas.itemconfigure(LABEL, font=self._label_font())
+        self.canvas.itemconfigure(SUNK_TEXT, font=("Helvetica", int(cell / 2), "bold"))
+        for ship, items in self._ship_items.items():
+            length, orientation, color, state = self._ship_looks[ship]
+            img = self.sprites.ship(length, orientation, color, cell, state=state)
+            r0, c0 = sorted(ship.coordinates)[0]
+            x0, y0 = self._cell_origin(r0, c0)
+            for it in items:
+                self.canvas.coords(it, x0 + 6, y0 + 6)
+                self.canvas.itemconfigure(it, image=img)
+        hit = self.sprites.peg("hit", cell, HIT_POP_SCALES[-1])
+        miss = self.sprites.peg("miss", cell)
+        for key, items in self._peg_items.items():
+            img = hit if self._peg_kinds[key] == "hit" else miss
+            for it in items:
+                self.canvas.itemconfigure(it, image=img)
+        # sprites for the old size go once no board is drawn at it
+        self.sprites.use_cell(self, cell)
 
     def clear(self):
-        self.canvas.delete("all")
+        # the static grid layer stays; only ships, pegs and overlays go
+        self.animator.cancel(self)
+        self.canvas.delete(DYNAMIC)
         self._ship_items.clear()
+        self._ship_looks.clear()
         self._peg_items.clear()
-        self._draw_grid()
+        self._peg_kinds.clear()
 
     def set_title(self, text):
         """Update the optional title label for the board widget."""
@@ -95,129 +265,75 @@ class BoardCanvas(Frame):
         if not hasattr(ship, "coordinates") or not ship.coordinates:
             return
         coords = sorted(ship.coordinates)
-        rs = [r for (r, c) in coords]
-        cs = [c for (r, c) in coords]
-        r0, r1 = min(rs), max(rs)
-        c0, c1 = min(cs), max(cs)
-        x0 = 30 + c0 * self.cell + 6
-        y0 = 30 + r0 * self.cell + 6
-        x1 = 30 + (c1 + 1) * self.cell - 6
-        y1 = 30 + (r1 + 1) * self.cell - 6
-
-        # shadow
-        shadow = self.canvas.create_rectangle(x0 + 4, y0 + 6, x1 + 6, y1 + 10, fill="#5b6b75", outline="", stipple="gray25")
-
-        # textured body: draw layered rounded shape to suggest wood/metal
-        radius = max(8, min(16, self.cell // 3))
-        body = self.canvas.create_rectangle(x0 + radius / 2, y0, x1 - radius / 2, y1, fill=color, outline="#3e2e2e", width=2)
-        left_cap = self.canvas.create_oval(x0, y0, x0 + radius, y1, fill=color, outline="#3e2e2e", width=2)
-        right_cap = self.canvas.create_oval(x1 - radius, y0, x1, y1, fill=color, outline="#3e2e2e", width=2)
-        items = [shadow, body, left_cap, right_cap]
-
-        # planking lines
-        length_pixels = max(1, int((x1 - x0)))
-        planks = max(1, int(length_pixels // 12))
-        for i in range(1, planks):
-            px = x0 + radius / 2 + i * ((x1 - x0 - radius) / planks)
-            items.append(self.canvas.create_line(px, y0 + 6, px, y1 - 6, fill="#6f4f36", width=1))
-
-        # central label (subtle emoji scaled to cell)
-        try:
-            items.append(self.canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text="⛴️", font=("Helvetica", int(self.cell / 1.8))))
-        except Exception:
-            pass
-
-        self._ship_items[ship] = items
+        r0, c0 = coords[0]
+        orientation = 'V' if len(coords) > 1 and coords[1][1] == c0 else 'H'
+        x0, y0 = self._cell_origin(r0, c0)
+        img = self.sprites.ship(len(coords), orientation, color, self.cell)
+        item = self.canvas.create_image(x0 + 6, y0 + 6, image=img, anchor="nw", tags=DYNAMIC)
+        self._ship_items[ship] = [item]
+        self._ship_looks[ship] = (len(coords), orientation, color, "normal")
 
     # --- pegs and animations ---
     def mark_hit(self, row, col):
         key = (row, col)
         if key in self._peg_items:
             return
-        off = 30
-        cx = off + col * self.cell + self.cell / 2
-        cy = off + row * self.cell + self.cell / 2
-        # slightly smaller peg for a less dominant look
-        r = self.cell * 0.20
-
-        oval = self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill="#d62828", outline="#7b0000", width=1)
-        cross1 = self.canvas.create_line(cx - r * 0.55, cy - r * 0.55, cx + r * 0.55, cy + r * 0.55, fill="white", width=1.5)
-        cross2 = self.canvas.create_line(cx + r * 0.55, cy - r * 0.55, cx - r * 0.55, cy + r * 0.55, fill="white", width=1.5)
-        self._peg_items[key] = [oval, cross1, cross2]
-
-        # simple pop animation (scale up then settle)
-        def pop(step=0):
-            if step >= 5:
-                return
-            # subtle scale animation
-            s = 1.0 + 0.04 * (5 - step)
-            try:
-                self.canvas.scale(oval, cx, cy, s, s)
-                self.canvas.scale(cross1, cx, cy, s, s)
-                self.canvas.scale(cross2, cx, cy, s, s)
-            except Exception:
-                pass
-            self.after(25, lambda: pop(step + 1))
+        x0, y0 = self._cell_origin(row, col)
+        cx = x0 + self.cell / 2
+        cy = y0 + self.cell / 2
+        peg = self.canvas.create_image(cx, cy, image=self.sprites.peg("hit", self.cell, HIT_POP_SCALES[0]), tags=DYNAMIC)
+        self._peg_items[key] = [peg]
+        self._peg_kinds[key] = "hit"
 
-        pop()
+        # simple pop animation: step through pre-rendered sizes
+        frames = [self.sprites.peg("hit", self.cell, s) for s in HIT_POP_SCALES]
+        self.animator.start((self, key), [lambda img=img: self.canvas.itemconfig(peg, image=img) for img in frames], 25)
 
     def mark_miss(self, row, col):
         key = (row, col)
         if key in self._peg_items:
             return
-        off = 30
-        cx = off + col * self.cell + self.cell / 2
-        cy = off + row * self.cell + self.cell / 2
-        r = self.cell * 0.14
-        peg = self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill="#ffffff", outline="#bfbfbf", width=2)
+        x0, y0 = self._cell_origin(row, col)
+        cx = x0 + self.cell / 2
+        cy = y0 + self.cell / 2
+        peg = self.canvas.create_image(cx, cy, image=self.sprites.peg("splash", self.cell), tags=DYNAMIC)
         self._peg_items[key] = [peg]
+        self._peg_kinds[key] = "miss"
 
-        # gentle fade-out highlight to simulate a small splash
-        def pulse(alpha=0):
-            if alpha > 6:
-                return
-            try:
-                self.canvas.itemconfig(peg, fill="#ffffff")
-            except Exception:
-                pass
-            self.after(80, lambda: pulse(alpha + 1))
-
-        pulse()
+        # flicker between splash and peg to simulate a small splash
+        splash = self.sprites.peg("splash", self.cell)
+        settled = self.sprites.peg("miss", self.cell)
+        frames = [splash, settled, splash, settled, splash, settled, settled]
+        self.animator.start((self, key), [lambda img=img: self.canvas.itemconfig(peg, image=img) for img in frames], 80)
 
     def mark_sunk(self, ship):
         items = self._ship_items.get(ship)
         if not items:
             return
+        length, orientation, color, _ = self._ship_looks[ship]
+        self._ship_looks[ship] = (length, orientation, color, "sunk")
+        sunk = self.sprites.ship(length, orientation, color, self.cell, state="sunk")
         for it in items:
             try:
-                self.canvas.itemconfig(it, fill="#5a1f1f")
+                self.canvas.itemconfig(it, image=sunk)
             except Exception:
                 pass
         coords = ship.coordinates
         r = sum([c[0] for c in coords]) / len(coords)
         c = sum([c[1] for c in coords]) / len(coords)
-        cx = 30 + c * self.cell + self.cell / 2
-        cy = 30 + r * self.cell + self.cell / 2
-        self.canvas.create_text(cx, cy, text="SUNK!", fill="yellow", font=("Helvetica", int(self.cell / 2), "bold"))
+        x0, y0 = self._cell_origin(r, c)
+        cx = x0 + self.cell / 2
+        cy = y0 + self.cell / 2
+        self.canvas.create_text(cx, cy, text="SUNK!", fill="yellow", font=("Helvetica", int(self.cell / 2), "bold"), tags=(DYNAMIC, SUNK_TEXT))
 
 
 # utility to draw a small ship preview onto any Canvas (used by the UI ship palette)
-def draw_ship_preview(canvas, length, cell=28, color="#9bb7a8", emoji="⛴️"):
+def draw_ship_preview(canvas, length, cell=28, color="#9bb7a8", emoji=None):
     pad = 6
-    x0 = pad
-    y0 = pad
-    x1 = pad + length * cell
-    y1 = pad + cell
-    radius = max(6, min(12, cell // 3))
-    body = canvas.create_rectangle(x0 + radius / 2, y0, x1 - radius / 2, y1, fill=color, outline="#5a3e2a", width=2)
-    left_cap = canvas.create_oval(x0, y0, x0 + radius, y1, fill=color, outline="#5a3e2a", width=2)
-    right_cap = canvas.create_oval(x1 - radius, y0, x1, y1, fill=color, outline="#5a3e2a", width=2)
-    length_pixels = x1 - x0
-    planks = max(1, int(length_pixels // 12))
-    for i in range(1, planks):
-        px = x0 + radius / 2 + i * ((x1 - x0 - radius) / planks)
-        canvas.create_line(px, y0 + 5, px, y1 - 5, fill="#6f4f36", width=1)
-    try:
-        canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=emoji, font=("Helvetica", max(10, int(cell / 1.6))))
-    except Exception:
-        pass
+    img = SpriteCache.for_widget(canvas).preview(length, cell, color)
+    canvas.create_image(pad, pad, image=img, anchor="nw")
+    if emoji:
+        try:
+            canvas.create_text(pad + length * cell / 2, pad + cell / 2, text=emoji, font=("Helvetica", max(10, int(cell / 1.6))))
+        except Exception:
+            pass
@@ -1,11 +1,15 @@
+import argparse
 import tkinter as tk
 from tkinter import Toplevel, Label, Canvas
-from gui.app import App
+from gui.i18n import LANGUAGES, catalog
+from gui import playback
 
 
 class StartWindow:
-    def __init__(self, root):
+    def __init__(self, root, habits=None):
         self.root = root
+        # placement-habit store handed to the App (None: the user's saved one)
+        self.habits = habits
         # hide main root while start window shown
         self.root.withdraw()
         self.win = Toplevel(root)
@@ -21,42 +25,34 @@ class StartWindow:
 
         self.canvas = Canvas(self.win, width=360, height=220, bg="#f5fbff", highlightthickness=0)
         self.canvas.pack(padx=8, pady=6)
+        playback.register(self.canvas, "start")
 
         # interactive areas positions
-        self.langs = ["English", "Spanish", "French", "German", "Romanian"]
+        self.langs = list(LANGUAGES)
         self.lang_index = 0
-        self.diffs = ["Easy", "Medium", "Hard"]
+        self.diffs = ["Easy", "Medium", "Hard", "Expert", "Adaptive"]
         self.diff_index = 1
 
-        # small translations map used by the start window so labels update live
-        self._translations = {
-            "English": {"language_label": "Language:", "ai_label": "AI Difficulty:", "author": "Author:", "license": "License:", "start": "Start", "exit": "Exit"},
-            "Spanish": {"language_label": "Idioma:", "ai_label": "Dificultad IA:", "author": "Autor:", "license": "Licencia:", "start": "Iniciar", "exit": "Salir"},
-            "French": {"language_label": "Langue:", "ai_label": "Difficulté IA:", "author": "Auteur:", "license": "Licence:", "start": "Démarrer", "exit": "Quitter"},
-            "German": {"language_label": "Sprache:", "ai_label": "KI Schwierigkeit:", "author": "Autor:", "license": "Lizenz:", "start": "Start", "exit": "Beenden"},
-            "Romanian": {"language_label": "Limbă:", "ai_label": "Dificultate AI:", "author": "Autor:", "license": "Licență:", "start": "Start", "exit": "Ieșire"},
-        }
-
         # language box
         self.lang_box = (20, 20, 320, 60)
         self.canvas.create_rectangle(*self.lang_box, fill="#ffffff", outline="#a9d0ff")
-        tr = self._translations[self.langs[self.lang_index]]
-        self.lang_text = self.canvas.create_text(170, 40, text=f"{tr.get('language_label','Language:')} {self.langs[self.lang_index]}", font=("Helvetica", 12))
+        tr = catalog(self.langs[self.lang_index])
+        self.lang_text = self.canvas.create_text(170, 40, text=f"{tr['language_label']} {self.langs[self.lang_index]}", font=("Helvetica", 12))
 
         # difficulty box
         self.diff_box = (20, 80, 320, 120)
         self.canvas.create_rectangle(*self.diff_box, fill="#ffffff", outline="#a9d0ff")
-        self.diff_text = self.canvas.create_text(170, 100, text=f"{tr.get('ai_label','AI Difficulty:')} {self.diffs[self.diff_index]}", font=("Helvetica", 12))
+        self.diff_text = self.canvas.create_text(170, 100, text=f"{tr['ai_label']} {self.diffs[self.diff_index]}", font=("Helvetica", 12))
 
         # start box (drawn like a button but handled via canvas events)
         self.start_box = (110, 140, 250, 180)
         self.canvas.create_rectangle(*self.start_box, fill="#9bb7a8", outline="#5a8f6a", width=2, tags="start_rect")
-        self.start_text = self.canvas.create_text(180, 160, text=tr.get('start','Start'), font=("Helvetica", 12, "bold"), fill="white", tags="start_text")
+        self.start_text = self.canvas.create_text(180, 160, text=tr['start'], font=("Helvetica", 12, "bold"), fill="white", tags="start_text")
 
         # exit box
         self.exit_box = (20, 140, 100, 180)
         self.canvas.create_rectangle(*self.exit_box, fill="#e86a6a", outline="#a94444", width=2, tags="exit_rect")
-        self.exit_text = self.canvas.create_text(60, 160, text=tr.get('exit','Exit'), font=("Helvetica", 10, "bold"), fill="white", tags="exit_text")
+        self.exit_text = self.canvas.create_text(60, 160, text=tr['exit'], font=("Helvetica", 10, "bold"), fill="white", tags="exit_text")
 
         # click handling
         self.canvas.bind("<Button-1>", self._on_click)
@@ -68,7 +64,10 @@ class StartWindow:
         lang = self.langs[self.lang_index]
         self.win.destroy()
         self.root.deiconify()
-        App(self.root, difficulty=diff, language=lang)
+        # the game modules are only needed once Start is clicked; importing
+        # them here keeps them off the path to the first paint
+        from gui.app import App
+        App(self.root, difficulty=diff, language=lang, habits=self.habits)
 
     def _on_click(self, ev):
         x, y = ev.x, ev.y
@@ -78,19 +77,19 @@ class StartWindow:
         if lx0 <= x <= lx1 and ly0 <= y <= ly1:
             # cycle language
             self.lang_index = (self.lang_index + 1) % len(self.langs)
-            tr = self._translations.get(self.langs[self.lang_index], self._translations['English'])
-            self.canvas.itemconfigure(self.lang_text, text=f"{tr.get('language_label','Language:')} {self.langs[self.lang_index]}")
+            tr = catalog(self.langs[self.lang_index])
+            self.canvas.itemconfigure(self.lang_text, text=f"{tr['language_label']} {self.langs[self.lang_index]}")
             # update other widgets (labels and buttons)
             try:
                 self.header_label.config(text="Battleship — Seaside Duel")
-                self.author_label.config(text=f"{tr.get('author','Author:')} Mihai Sirbu")
-                self.license_label.config(text=f"{tr.get('license','License:')} MIT License 2025")
+                self.author_label.config(text=f"{tr['author']} Mihai Sirbu")
+                self.license_label.config(text=f"{tr['license']} MIT License 2025")
             except Exception:
                 pass
             try:
-                self.canvas.itemconfigure(self.diff_text, text=f"{tr.get('ai_label','AI Difficulty:')} {self.diffs[self.diff_index]}")
-                self.canvas.itemconfigure(self.start_text, text=tr.get('start','Start'))
-                self.canvas.itemconfigure(self.exit_text, text=tr.get('exit','Exit'))
+                self.canvas.itemconfigure(self.diff_text, text=f"{tr['ai_label']} {self.diffs[self.diff_index]}")
+                self.canvas.itemconfigure(self.start_text, text=tr['start'])
+                self.canvas.itemconfigure(self.exit_text, text=tr['exit'])
             except Exception:
                 pass
             try:
@@ -114,11 +113,45 @@ class StartWindow:
             self.root.quit()
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Battleship — Seaside Duel")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="play online on a multiplayer server")
+    parser.add_argument("--instrument", metavar="PATH", help="record per-turn latencies and write them to PATH on exit")
+    parser.add_argument("--record", metavar="PATH", help="record clicks and key presses as a replay script at PATH")
+    parser.add_argument("--seed", type=int, help="seed the random module (AI fleet and moves) for repeatable replays; "
+                        "the saved placement habits are neither used nor updated")
+    args = parser.parse_args(argv)
+    if args.seed is not None:
+        import random
+        random.seed(args.seed)
     root = tk.Tk()
     root.title("Battleship")
-    StartWindow(root)
+    recorder = playback.Recorder(root) if args.record else None
+    probe = None
+    if args.instrument:
+        from utils import instrument
+        # the timed methods live in the game modules; wrapping them would
+        # import those before the start window is painted, so it waits
+        probe = instrument.LagProbe(root, instrument.enable(methods=()))
+        probe.start()
+        root.after_idle(root.after, 0, instrument.wrap)
+    if args.connect:
+        from gui.netclient import NetworkApp
+        host, _, port = args.connect.rpartition(":")
+        NetworkApp(root, host or "127.0.0.1", int(port))
+    else:
+        habits = None
+        if args.seed is not None or args.record:
+            # a recorded or seeded session must not depend on, or change, the saved habits
+            from game.habits import HabitStore
+            habits = HabitStore(path=None)
+        StartWindow(root, habits)
     root.mainloop()
+    if probe is not None:
+        probe.stop()
+        instrument.disable().dump(args.instrument)
+    if recorder is not None:
+        recorder.save(args.record)
 
 
 if __name__ == "__main__":
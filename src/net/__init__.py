@@ -0,0 +1 @@
+# This file initializes the net module.
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""Localhost load generator for the multiplayer server.
+
+Opens two client connections per game, lets every game join first (so all
+of them are resident on the server at once), samples the server's RSS, then
+plays every game to completion with random shots and reports throughput and
+shot round-trip latency percentiles.
+
+    PYTHONPATH=src python -m net.loadgen --games 2000 --spawn-server
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from net.protocol import MAX_FRAME, encode, read_message
+
+
+def _rss_bytes(pid):
+    # Linux only; returns None elsewhere
+    try:
+        with open(f"/proc/{pid}/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def play_client(host, port, joined, go, latencies, rng, think=0.0):
+    """Play one seat of one game; returns True when the game finished cleanly."""
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_FRAME)
+    try:
+        writer.write(encode({"type": "join"}))
+        targets = [(r, c) for r in range(10) for c in range(10)]
+        rng.shuffle(targets)
+        seat = None
+        turn = None
+        sent_at = None
+        started = False
+        while True:
+            msg = await read_message(reader)
+            if msg is None:
+                return False
+            kind = msg["type"]
+            if kind == "joined":
+                seat = msg["seat"]
+                joined()
+                continue
+            if kind == "start":
+                turn = msg["turn"]
+                await go.wait()
+                started = True
+            elif kind == "shot":
+                if msg["seat"] == seat and sent_at is not None:
+                    latencies.append(time.perf_counter() - sent_at)
+                    sent_at = None
+                turn = msg["turn"]
+            elif kind == "over":
+                return True
+            elif kind in ("error", "opponent_away"):
+                return False
+            else:
+                continue
+            if started and turn == seat and targets:
+                if think:
+                    await asyncio.sleep(think)
+                r, c = targets.pop()
+                sent_at = time.perf_counter()
+                writer.write(encode({"type": "fire", "row": r, "col": c}))
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, games, seed=0, think=0.0, server_pid=None):
+    rng = random.Random(seed)
+    latencies = []
+    joined_count = 0
+    all_joined = asyncio.Event()
+    go = asyncio.Event()
+
+    def joined():
+        nonlocal joined_count
+        joined_count += 1
+        if joined_count == games * 2:
+            all_joined.set()
+
+    t0 = time.perf_counter()
+    idle_rss = _rss_bytes(server_pid) if server_pid else None
+    tasks = [asyncio.ensure_future(play_client(host, port, joined, go, latencies, random.Random(rng.random()), think))
+             for _ in range(games * 2)]
+    await all_joined.wait()
+    t_joined = time.perf_counter()
+    peak_rss = _rss_bytes(server_pid) if server_pid else None
+    go.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    t_done = time.perf_counter()
+
+    ok = sum(1 for r in results if r is True)
+    report = {
+        "games": games,
+        "clients_ok": ok,
+        "clients_failed": len(results) - ok,
+        "join_seconds": t_joined - t0,
+        "play_seconds": t_done - t_joined,
+        "shots": len(latencies),
+        "shots_per_second": len(latencies) / max(1e-9, t_done - t_joined),
+        "latency_ms": {
+            "p50": percentile(latencies, 50) * 1000,
+            "p95": percentile(latencies, 95) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+            "max": max(latencies, default=0.0) * 1000,
+        },
+    }
+    if idle_rss is not None and peak_rss is not None:
+        report["server_rss_bytes"] = {"idle": idle_rss, "all_games_resident": peak_rss,
+                                      "per_game": (peak_rss - idle_rss) / max(1, games)}
+    return report
+
+
+def _spawn_server(port):
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = src_dir + os.pathsep + env.get("PYTHONPATH", "")
+    store = os.path.join(tempfile.mkdtemp(prefix="battleship-loadgen-"), "sessions")
+    proc = subprocess.Popen([sys.executable, "-m", "net.server", "--port", str(port), "--store", store], env=env)
+    return proc
+
+
+async def _wait_for_port(host, port, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the Battleship multiplayer server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--games", type=int, default=1000, help="concurrent games (2 connections each)")
+    parser.add_argument("--think", type=float, default=0.0, help="seconds each client waits before firing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn-server", action="store_true", help="start a server subprocess and measure its RSS")
+    args = parser.parse_args(argv)
+
+    proc = _spawn_server(args.port) if args.spawn_server else None
+    try:
+        async def run():
+            await _wait_for_port(args.host, args.port)
+            return await run_load(args.host, args.port, args.games, args.seed, args.think,
+                                  server_pid=proc.pid if proc else None)
+        report = asyncio.run(run())
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    lat = report["latency_ms"]
+    print(f"games: {report['games']}  clients ok/failed: {report['clients_ok']}/{report['clients_failed']}")
+    print(f"join: {report['join_seconds']:.2f}s  play: {report['play_seconds']:.2f}s  "
+          f"shots: {report['shots']} ({report['shots_per_second']:.0f}/s)")
+    print(f"shot latency ms  p50 {lat['p50']:.2f}  p95 {lat['p95']:.2f}  p99 {lat['p99']:.2f}  max {lat['max']:.2f}")
+    if "server_rss_bytes" in report:
+        rss = report["server_rss_bytes"]
+        print(f"server RSS: idle {rss['idle'] / 1e6:.1f} MB, all games resident "
+              f"{rss['all_games_resident'] / 1e6:.1f} MB, ~{rss['per_game'] / 1024:.1f} KiB/game")
+    return 0 if report["clients_failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
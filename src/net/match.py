@@ -0,0 +1,54 @@
+from game.board import Board
+
+
+class MatchError(Exception):
+    """Raised when a player attempts a move the rules do not allow."""
+
+
+class Match:
+    """Headless player-vs-player match built on two Board instances.
+
+    Seats are 0 and 1; seat 0 fires first. As in the local game, a hit or
+    sunk result earns the shooter another shot and a miss passes the turn.
+    """
+
+    __slots__ = ("match_id", "boards", "turn", "winner", "shots")
+
+    def __init__(self, match_id, boards=None):
+        self.match_id = match_id
+        if boards is None:
+            boards = (Board(), Board())
+            for board in boards:
+                board.place_ships_randomly()
+        self.boards = boards
+        self.turn = 0
+        self.winner = None
+        self.shots = 0
+
+    @property
+    def finished(self):
+        return self.winner is not None
+
+    def fleet(self, seat):
+        """Return the ship layout of a seat as [name, [[row, col], ...]] pairs."""
+        return [[s.name, [list(c) for c in s.coordinates]] for s in self.boards[seat].ships]
+
+    def fire(self, seat, row, col):
+        """Resolve a shot from `seat` at the opponent's (row, col).
+
+        Returns (result, ship_name) exactly like Board.receive_shot.
+        """
+        if self.finished:
+            raise MatchError("match is over")
+        if seat != self.turn:
+            raise MatchError("not your turn")
+        target = self.boards[1 - seat]
+        if not target.is_valid_guess(row, col):
+            raise MatchError("invalid move")
+        result, ship_name = target.receive_shot((row, col))
+        self.shots += 1
+        if result == "miss":
+            self.turn = 1 - seat
+        elif target.all_ships_sunk():
+            self.winner = seat
+        return result, ship_name
@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+# Messages are single-line JSON objects terminated by "\n". A frame larger
+# than MAX_FRAME is a protocol error; the StreamReader limit enforces it so a
+# misbehaving peer can never grow a connection's input buffer past this size.
+MAX_FRAME = 4096
+
+
+class ProtocolError(Exception):
+    """Raised when a peer sends a frame that cannot be decoded."""
+
+
+def encode(msg):
+    """Serialize a message dict into one newline-terminated frame."""
+    data = json.dumps(msg, separators=(",", ":")).encode("utf-8") + b"\n"
+    if len(data) > MAX_FRAME:
+        raise ProtocolError("frame too large")
+    return data
+
+
+def decode(line):
+    """Parse one frame (bytes, with or without the trailing newline)."""
+    try:
+        msg = json.loads(line)
+    except (ValueError, UnicodeDecodeError):
+        raise ProtocolError("malformed frame")
+    if not isinstance(msg, dict) or not isinstance(msg.get("type"), str):
+        raise ProtocolError("frame must be an object with a 'type'")
+    return msg
+
+
+async def read_message(reader):
+    """Read the next message from an asyncio StreamReader.
+
+    Returns None on a clean EOF. The reader should be created with
+    ``limit=MAX_FRAME`` so oversized frames fail fast.
+    """
+    try:
+        line = await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial.strip():
+            raise ProtocolError("truncated frame")
+        return None
+    except asyncio.LimitOverrunError:
+        raise ProtocolError("frame too large")
+    return decode(line)
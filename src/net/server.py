@@ -0,0 +1,333 @@
+import argparse
+import asyncio
+import os
+
+from net.match import MatchError
+from net.protocol import MAX_FRAME, ProtocolError, encode, read_message
+from net.sessions import SessionManager
+from net.spectators import SpectatorChannel
+
+# a peer whose unsent output grows past this is too slow to keep up and is
+# disconnected instead of letting its buffer (and our memory) grow unbounded
+MAX_OUTBUF = 64 * 1024
+
+DEFAULT_STORE = os.path.join(os.path.expanduser("~"), ".battleship", "sessions")
+
+
+class Connection:
+    """A connected client: its transport plus the seat it occupies, if any."""
+
+    __slots__ = ("writer", "match_id", "seat", "watching", "closed")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.match_id = None
+        self.seat = None
+        self.watching = None     # (SpectatorChannel, Subscriber) for spectators
+        self.closed = False
+
+    def send(self, msg):
+        """Queue a message without waiting; drop the peer if it falls behind."""
+        if self.closed:
+            return False
+        self.writer.write(encode(msg))
+        if self.writer.transport.get_write_buffer_size() > MAX_OUTBUF:
+            self.close()
+            return False
+        return True
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class GameServer:
+    """Asyncio server hosting many concurrent player-vs-player matches.
+
+    Every match is a headless Match; clients talk newline-delimited JSON
+    (see net.protocol). Players are paired in arrival order:
+
+        -> {"type": "join"}
+        <- {"type": "joined", "match": id, "seat": 0|1, "fleet": [...]}
+        <- {"type": "start", "turn": 0}
+        -> {"type": "fire", "row": r, "col": c}
+        <- {"type": "shot", "seat": s, "row": r, "col": c,
+            "result": "miss"|"hit"|"sunk", "ship": name|None, "turn": t,
+            "cells": [[r, c], ...] (sunk only)}
+        <- {"type": "over", "winner": s}
+
+    A player who drops out of a running match keeps their seat: the
+    "joined" reply carries a token, and
+
+        -> {"type": "resume", "match": id, "token": t}
+        <- {"type": "resumed", "match": id, "seat": s, "fleet": [...],
+            "turn": t, "shots": [[[r, c, "hit"|"miss"], ...], [...]]}
+
+    puts them back, rehydrating the match from the session store if it was
+    hibernated in the meantime. Anyone can watch a running match:
+
+        -> {"type": "watch", "match": id}
+        <- {"type": "snapshot", ...}, then every "shot" and "over" event
+
+    Spectators are served from a SpectatorChannel, so a slow watcher is
+    resynced or dropped rather than holding up the players.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8765, store_path=DEFAULT_STORE, max_resident=10000,
+                 idle_seconds=300.0, ttl_seconds=24 * 3600.0, sweep_interval=30.0):
+        self.host = host
+        self.port = port
+        self.sessions = SessionManager(store_path, max_resident=max_resident,
+                                       idle_seconds=idle_seconds, ttl_seconds=ttl_seconds)
+        self.seats = {}          # match_id -> [Connection|None, Connection|None] while anyone is connected
+        self.channels = {}       # match_id -> SpectatorChannel while anyone is watching
+        self._waiting = None     # match_id of a match that still needs seat 1
+        self.sweep_interval = sweep_interval
+        self._sweeper = None
+        self._server = None
+        self.connections = 0
+        self.matches_started = 0
+        self.matches_finished = 0
+        self._handlers = {
+            "join": self._on_join,
+            "resume": self._on_resume,
+            "watch": self._on_watch,
+            "fire": self._on_fire,
+            "ping": self._on_ping,
+        }
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_FRAME, backlog=1024)
+        # port 0 asks the OS for a free port; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._sweeper = asyncio.ensure_future(self._sweep_loop())
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.sessions.close()
+
+    def stats(self):
+        stats = {
+            "connections": self.connections,
+            "matches_started": self.matches_started,
+            "matches_finished": self.matches_finished,
+            "spectators": sum(len(ch.subscribers) for ch in self.channels.values()),
+        }
+        stats.update(self.sessions.metrics())
+        return stats
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sessions.sweep(is_busy=lambda match_id: match_id == self._waiting)
+
+    # --- connection handling ---
+    async def _handle(self, reader, writer):
+        conn = Connection(writer)
+        self.connections += 1
+        try:
+            while not conn.closed:
+                msg = await read_message(reader)
+                if msg is None:
+                    break
+                handler = self._handlers.get(msg["type"])
+                if handler is None:
+                    conn.send({"type": "error", "reason": "unknown message type"})
+                    continue
+                handler(conn, msg)
+        except ProtocolError as exc:
+            conn.send({"type": "error", "reason": str(exc)})
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            self._leave(conn)
+            conn.close()
+
+    def _on_ping(self, conn, msg):
+        conn.send({"type": "pong", "t": msg.get("t")})
+
+    def _on_join(self, conn, msg):
+        if conn.match_id is not None:
+            conn.send({"type": "error", "reason": "already in a match"})
+            return
+        if self._waiting is None:
+            session = self.sessions.create()
+            match_id = session.match.match_id
+            self.seats[match_id] = [conn, None]
+            self._waiting = match_id
+            seat = 0
+        else:
+            match_id = self._waiting
+            session = self.sessions.get(match_id)
+            self.seats[match_id][1] = conn
+            self._waiting = None
+            seat = 1
+        conn.match_id = match_id
+        conn.seat = seat
+        match = session.match
+        conn.send({"type": "joined", "match": match_id, "seat": seat, "token": session.tokens[seat],
+                   "fleet": match.fleet(seat)})
+        if seat == 1:
+            self.matches_started += 1
+            self._broadcast(match_id, {"type": "start", "turn": match.turn})
+
+    def _on_resume(self, conn, msg):
+        if conn.match_id is not None:
+            conn.send({"type": "error", "reason": "already in a match"})
+            return
+        match_id = msg.get("match")
+        session = self.sessions.get(match_id) if isinstance(match_id, int) else None
+        token = msg.get("token")
+        if session is None or token not in session.tokens:
+            conn.send({"type": "error", "reason": "unknown session"})
+            return
+        seat = session.tokens.index(token)
+        seats = self.seats.setdefault(match_id, [None, None])
+        if seats[seat] is not None:
+            conn.send({"type": "error", "reason": "seat already connected"})
+            return
+        seats[seat] = conn
+        conn.match_id = match_id
+        conn.seat = seat
+        match = session.match
+        shots = []
+        for board in (match.boards[1 - seat], match.boards[seat]):
+            shots.append([[r, c, "hit"] for (r, c) in sorted(board.hits)] +
+                         [[r, c, "miss"] for (r, c) in sorted(board.misses)])
+        conn.send({"type": "resumed", "match": match_id, "seat": seat, "fleet": match.fleet(seat),
+                   "turn": match.turn, "shots": shots})
+        opponent = seats[1 - seat]
+        if opponent is not None:
+            opponent.send({"type": "opponent_back"})
+
+    def _on_watch(self, conn, msg):
+        if conn.match_id is not None or conn.watching is not None:
+            conn.send({"type": "error", "reason": "already in a match"})
+            return
+        match_id = msg.get("match")
+        if not isinstance(match_id, int) or match_id not in self.sessions:
+            conn.send({"type": "error", "reason": "unknown match"})
+            return
+        channel = self.channels.get(match_id)
+        if channel is None:
+            channel = self.channels[match_id] = SpectatorChannel(lambda: self._match(match_id))
+        sub = channel.subscribe(conn.writer)
+        if sub is not None:
+            conn.watching = (channel, sub)
+
+    def _on_fire(self, conn, msg):
+        session = self.sessions.get(conn.match_id) if conn.match_id is not None else None
+        if session is None:
+            conn.send({"type": "error", "reason": "not in a match"})
+            return
+        match = session.match
+        if conn.match_id == self._waiting:
+            conn.send({"type": "error", "reason": "waiting for opponent"})
+            return
+        row, col = msg.get("row"), msg.get("col")
+        if not isinstance(row, int) or not isinstance(col, int):
+            conn.send({"type": "error", "reason": "row and col must be integers"})
+            return
+        try:
+            result, ship_name = match.fire(conn.seat, row, col)
+        except MatchError as exc:
+            conn.send({"type": "error", "reason": str(exc)})
+            return
+        event = {"type": "shot", "seat": conn.seat, "row": row, "col": col,
+                 "result": result, "ship": ship_name, "turn": match.turn}
+        if result == "sunk":
+            # a sunk ship is public knowledge; reveal where it was
+            for ship in match.boards[1 - conn.seat].ships:
+                if ship.name == ship_name:
+                    event["cells"] = [list(c) for c in ship.coordinates]
+        self._broadcast(match.match_id, event)
+        if match.finished:
+            self._broadcast(match.match_id, {"type": "over", "winner": match.winner})
+            self.matches_finished += 1
+            self._end(match.match_id)
+
+    # --- match bookkeeping ---
+    def _match(self, match_id):
+        session = self.sessions.get(match_id)
+        return session.match if session is not None else None
+
+    def _broadcast(self, match_id, msg):
+        for peer in self.seats.get(match_id, ()):
+            if peer is not None:
+                peer.send(msg)
+        channel = self.channels.get(match_id)
+        if channel is not None:
+            channel.publish(msg)
+
+    def _leave(self, conn):
+        if conn.watching is not None:
+            channel, sub = conn.watching
+            conn.watching = None
+            channel.unsubscribe(sub)
+            return
+        match_id = conn.match_id
+        if match_id is None:
+            return
+        if match_id == self._waiting:
+            self._waiting = None
+            self._end(match_id)
+            return
+        seats = self.seats[match_id]
+        seats[conn.seat] = None
+        conn.match_id = None
+        opponent = seats[1 - conn.seat]
+        if opponent is not None:
+            # keep the seat open so the player can resume
+            opponent.send({"type": "opponent_away"})
+        else:
+            # nobody is watching this match any more; park it on disk
+            del self.seats[match_id]
+            self.sessions.hibernate(match_id)
+
+    def _end(self, match_id):
+        channel = self.channels.pop(match_id, None)
+        if channel is not None:
+            channel.close()
+        self.sessions.discard(match_id)
+        for peer in self.seats.pop(match_id, ()):
+            if peer is not None:
+                peer.match_id = None
+                peer.seat = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Battleship multiplayer server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--store", default=DEFAULT_STORE, help="path of the hibernated session store")
+    parser.add_argument("--max-resident", type=int, default=10000, help="matches kept in memory")
+    parser.add_argument("--idle", type=float, default=300.0, help="seconds before an idle match is hibernated")
+    parser.add_argument("--ttl", type=float, default=24 * 3600.0, help="seconds a hibernated match is kept")
+    args = parser.parse_args(argv)
+    server = GameServer(args.host, args.port, store_path=args.store, max_resident=args.max_resident,
+                        idle_seconds=args.idle, ttl_seconds=args.ttl)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+import dbm
+import itertools
+import os
+import secrets
+import struct
+import time
+from collections import OrderedDict
+
+from game.board import Board, SHIP_SPECS
+from game.ship import Ship
+from net.match import Match
+
+# record layout (little endian):
+#   header: version, board size, turn, winner (-1 = none), shots, stored_at
+#   two 8-byte seat tokens
+#   per board: ship count, then (spec index, row, col, vertical) per ship,
+#              followed by hit and miss bitsets of ceil(size*size/8) bytes
+_HEADER = struct.Struct("<BBBbHd")
+_SHIP = struct.Struct("<BBBB")
+_VERSION = 1
+
+
+class Session:
+    """A resident match plus the secrets players use to reclaim their seats."""
+
+    __slots__ = ("match", "tokens", "last_active")
+
+    def __init__(self, match, tokens, last_active):
+        self.match = match
+        self.tokens = tokens
+        self.last_active = last_active
+
+
+def cells_to_bits(cells, size):
+    """Pack a set of (row, col) cells into a little-endian bitset."""
+    value = 0
+    for (r, c) in cells:
+        value |= 1 << (r * size + c)
+    return value.to_bytes((size * size + 7) // 8, "little")
+
+
+def bits_to_cells(data, size):
+    """Inverse of cells_to_bits."""
+    value = int.from_bytes(data, "little")
+    cells = set()
+    while value:
+        low = value & -value
+        idx = low.bit_length() - 1
+        cells.add(divmod(idx, size))
+        value ^= low
+    return cells
+
+
+def pack_session(session, stored_at):
+    """Encode a session into its compact on-disk form (about 120 bytes)."""
+    match = session.match
+    size = match.boards[0].size
+    names = [spec[0] for spec in SHIP_SPECS]
+    winner = -1 if match.winner is None else match.winner
+    parts = [_HEADER.pack(_VERSION, size, match.turn, winner, match.shots, stored_at)]
+    parts.extend(bytes.fromhex(tok) for tok in session.tokens)
+    for board in match.boards:
+        parts.append(bytes([len(board.ships)]))
+        for ship in board.ships:
+            (r, c) = min(ship.coordinates)
+            vertical = len(ship.coordinates) > 1 and ship.coordinates[0][1] == ship.coordinates[1][1]
+            parts.append(_SHIP.pack(names.index(ship.name), r, c, int(vertical)))
+        parts.append(cells_to_bits(board.hits, size))
+        parts.append(cells_to_bits(board.misses, size))
+    return b"".join(parts)
+
+
+def unpack_session(match_id, data, last_active):
+    """Rebuild a Session (boards, ships and their hits) from pack_session output."""
+    version, size, turn, winner, shots, _ = _HEADER.unpack_from(data)
+    if version != _VERSION:
+        raise ValueError(f"unsupported session record version {version}")
+    pos = _HEADER.size
+    tokens = (data[pos:pos + 8].hex(), data[pos + 8:pos + 16].hex())
+    pos += 16
+    nbytes = (size * size + 7) // 8
+    boards = []
+    for _ in range(2):
+        board = Board()
+        count = data[pos]
+        pos += 1
+        for _ in range(count):
+            spec, r, c, vertical = _SHIP.unpack_from(data, pos)
+            pos += _SHIP.size
+            name, length, symbol = SHIP_SPECS[spec]
+            board.place_ship(Ship(name, length, [], symbol), (r, c), 'V' if vertical else 'H')
+        board.hits = bits_to_cells(data[pos:pos + nbytes], size)
+        board.misses = bits_to_cells(data[pos + nbytes:pos + 2 * nbytes], size)
+        pos += 2 * nbytes
+        for ship in board.ships:
+            ship.hits = {cell for cell in ship.coordinates if cell in board.hits}
+        boards.append(board)
+    match = Match(match_id, tuple(boards))
+    match.turn = turn
+    match.winner = None if winner < 0 else winner
+    match.shots = shots
+    return Session(match, tokens, last_active)
+
+
+def _stored_at(data):
+    return _HEADER.unpack_from(data)[5]
+
+
+class SessionManager:
+    """Keeps recently used matches in memory and hibernates the rest to disk.
+
+    Resident sessions live in an LRU ordered by last activity. A session is
+    written to the on-disk store (a dbm file) when it has been idle for
+    `idle_seconds`, when nobody is connected to it, or when the resident set
+    exceeds `max_resident`. `get` transparently rehydrates a hibernated
+    session; hibernated sessions older than `ttl_seconds` are deleted.
+    """
+
+    def __init__(self, path, max_resident=10000, idle_seconds=300.0, ttl_seconds=24 * 3600.0, clock=time.monotonic):
+        self.path = path
+        self.max_resident = max(1, max_resident)
+        self.idle_seconds = idle_seconds
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._resident = OrderedDict()   # match_id -> Session, oldest activity first
+        self._hibernated = {}            # match_id -> wall-clock time it was stored
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = dbm.open(path, "c")
+        # sessions hibernated by a previous run can still be resumed
+        for key in self._db.keys():
+            self._hibernated[int(key)] = _stored_at(self._db[key])
+        self._ids = itertools.count(max(self._hibernated, default=0) + 1)
+        self.hibernations = 0
+        self.rehydrations = 0
+        self.expired = 0
+
+    def create(self):
+        """Start a new match with fresh seat tokens; returns its Session."""
+        match_id = next(self._ids)
+        session = Session(Match(match_id), (secrets.token_hex(8), secrets.token_hex(8)), self.clock())
+        self._resident[match_id] = session
+        self._enforce_capacity()
+        return session
+
+    def get(self, match_id):
+        """Return the session for `match_id`, loading it from disk if needed."""
+        session = self._resident.get(match_id)
+        if session is None:
+            if match_id not in self._hibernated:
+                return None
+            key = str(match_id).encode()
+            session = unpack_session(match_id, self._db[key], self.clock())
+            del self._db[key]
+            del self._hibernated[match_id]
+            self._resident[match_id] = session
+            self.rehydrations += 1
+            self._enforce_capacity(keep=match_id)
+        self.touch(match_id)
+        return session
+
+    def touch(self, match_id):
+        session = self._resident.get(match_id)
+        if session is not None:
+            session.last_active = self.clock()
+            self._resident.move_to_end(match_id)
+
+    def is_resident(self, match_id):
+        return match_id in self._resident
+
+    def __contains__(self, match_id):
+        return match_id in self._resident or match_id in self._hibernated
+
+    def hibernate(self, match_id):
+        session = self._resident.pop(match_id, None)
+        if session is None:
+            return False
+        stored_at = time.time()
+        self._db[str(match_id).encode()] = pack_session(session, stored_at)
+        self._hibernated[match_id] = stored_at
+        self.hibernations += 1
+        return True
+
+    def discard(self, match_id):
+        """Forget a session entirely (finished or abandoned matches)."""
+        self._resident.pop(match_id, None)
+        if self._hibernated.pop(match_id, None) is not None:
+            del self._db[str(match_id).encode()]
+
+    def sweep(self, is_busy=None):
+        """Hibernate idle sessions and expire old hibernated ones.
+
+        `is_busy(match_id)` may veto hibernation of a session that is idle but
+        should stay resident. Returns (hibernated, expired) counts.
+        """
+        cutoff = self.clock() - self.idle_seconds
+        idle = []
+        for match_id, session in self._resident.items():
+            if session.last_active > cutoff:
+                break
+            if is_busy is None or not is_busy(match_id):
+                idle.append(match_id)
+        for match_id in idle:
+            self.hibernate(match_id)
+        expire_before = time.time() - self.ttl_seconds
+        stale = [mid for mid, stored_at in self._hibernated.items() if stored_at < expire_before]
+        for match_id in stale:
+            self.discard(match_id)
+        self.expired += len(stale)
+        return len(idle), len(stale)
+
+    def metrics(self):
+        return {
+            "resident": len(self._resident),
+            "hibernated": len(self._hibernated),
+            "hibernations": self.hibernations,
+            "rehydrations": self.rehydrations,
+            "expired": self.expired,
+        }
+
+    def close(self):
+        """Hibernate everything still resident and close the store."""
+        for match_id in list(self._resident):
+            self.hibernate(match_id)
+        sync = getattr(self._db, "sync", None)
+        if sync is not None:
+            sync()
+        self._db.close()
+
+    def _enforce_capacity(self, keep=None):
+        while len(self._resident) > self.max_resident:
+            oldest = next(iter(self._resident))
+            if oldest == keep:
+                self._resident.move_to_end(oldest)
+                continue
+            self.hibernate(oldest)
@@ -0,0 +1,140 @@
+import asyncio
+
+from net.protocol import encode
+from net.sessions import cells_to_bits
+
+# events a watcher may fall behind by before it is resynced with a snapshot
+QUEUE_SIZE = 64
+# resyncs a watcher may need before it is considered hopeless and dropped
+MAX_RESYNCS = 3
+
+
+def snapshot(match):
+    """Compact view of a match for late joiners: no unhit ship cells.
+
+    Shots on each board are sent as hex bitsets (bit r*size+c), plus the
+    revealed cells of every sunk ship.
+    """
+    boards = []
+    for board in match.boards:
+        sunk = [[s.name, [list(c) for c in s.coordinates]] for s in board.ships if s.is_sunk()]
+        boards.append({
+            "hits": cells_to_bits(board.hits, board.size).hex(),
+            "misses": cells_to_bits(board.misses, board.size).hex(),
+            "sunk": sunk,
+        })
+    return {"type": "snapshot", "match": match.match_id, "size": match.boards[0].size,
+            "turn": match.turn, "winner": match.winner, "boards": boards}
+
+
+class Subscriber:
+    """One watcher: a bounded queue of encoded frames and the task that drains it."""
+
+    __slots__ = ("writer", "queue", "resyncs", "task", "closed")
+
+    def __init__(self, writer, queue_size=QUEUE_SIZE):
+        self.writer = writer
+        self.queue = asyncio.Queue(queue_size)
+        self.resyncs = 0
+        self.task = None
+        self.closed = False
+
+    async def pump(self):
+        try:
+            while True:
+                frame = await self.queue.get()
+                if frame is None:
+                    break
+                self.writer.write(frame)
+                await self.writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class SpectatorChannel:
+    """Fans the events of one match out to any number of watchers.
+
+    `publish` never awaits: each event is encoded once and offered to every
+    subscriber's bounded queue. A watcher whose queue is full skips the
+    backlog and is sent a fresh snapshot instead (downsampling it to the
+    current state); one that needs more than MAX_RESYNCS resyncs is dropped.
+    """
+
+    def __init__(self, get_match, queue_size=QUEUE_SIZE, max_resyncs=MAX_RESYNCS):
+        self.get_match = get_match
+        self.queue_size = queue_size
+        self.max_resyncs = max_resyncs
+        self.subscribers = set()
+        self.published = 0
+        self.resynced = 0
+        self.dropped = 0
+
+    def subscribe(self, writer):
+        """Start streaming to `writer`, beginning with a snapshot of the match."""
+        frame = self._snapshot_frame()
+        if frame is None:
+            return None
+        sub = Subscriber(writer, self.queue_size)
+        sub.queue.put_nowait(frame)
+        sub.task = asyncio.ensure_future(sub.pump())
+        sub.task.add_done_callback(lambda _: self.subscribers.discard(sub))
+        self.subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        self.subscribers.discard(sub)
+        if sub.task is not None and not sub.task.done():
+            sub.task.cancel()
+        sub.close()
+
+    def publish(self, event):
+        if not self.subscribers:
+            return
+        self.published += 1
+        frame = encode(event)
+        snap = None
+        for sub in list(self.subscribers):
+            try:
+                sub.queue.put_nowait(frame)
+                continue
+            except asyncio.QueueFull:
+                pass
+            sub.resyncs += 1
+            if sub.resyncs > self.max_resyncs:
+                self.dropped += 1
+                self.unsubscribe(sub)
+                continue
+            # throw the backlog away; the snapshot already includes this event
+            while not sub.queue.empty():
+                sub.queue.get_nowait()
+            if snap is None:
+                snap = self._snapshot_frame()
+            if snap is None:
+                self.unsubscribe(sub)
+                continue
+            sub.queue.put_nowait(snap)
+            self.resynced += 1
+
+    def close(self):
+        """Let every watcher flush what it has queued, then hang up."""
+        for sub in list(self.subscribers):
+            try:
+                sub.queue.put_nowait(None)
+            except asyncio.QueueFull:
+                self.unsubscribe(sub)
+        self.subscribers.clear()
+
+    def _snapshot_frame(self):
+        match = self.get_match()
+        return encode(snapshot(match)) if match is not None else None
@@ -0,0 +1,345 @@
+"""Distributed AI-vs-AI sweeps: a coordinator hands seed ranges to workers.
+
+The seeds first .. first+games-1 are cut into fixed ranges. Workers connect
+over TCP (newline-delimited JSON, see net.protocol), ask for a range, play
+it with game.simulation and send back the range's additive counters:
+
+    -> {"type": "next"}
+    <- {"type": "range", "id": i, "start": s, "stop": e, "difficulties": [...]}
+    -> {"type": "progress", "id": i}    still playing range i (renews its lease)
+    -> {"type": "result", "id": i, "counters": {...}}     (also asks for the next)
+    <- {"type": "wait", "seconds": t}   every range is out; ask again later
+    <- {"type": "done"}                 the sweep is complete
+
+Workers send a progress message every HEARTBEAT_SECONDS while they play,
+which renews the range's lease, so long ranges (Expert games take over a
+second each) are not handed out twice. A range whose worker disconnects,
+or that goes a whole lease without a result or progress, goes back on the
+queue; games are seeded, so a re-run produces the
+same counters and each range is counted once. Completed ranges and the
+running totals are checkpointed after every result, so a coordinator
+started again with the same --checkpoint and settings resumes the sweep.
+
+    PYTHONPATH=src python -m net.sweep coordinator --games 1000000 \\
+        --checkpoint sweep.json --spawn-workers 8
+    PYTHONPATH=src python -m net.sweep worker --host 10.0.0.5    # more hosts
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import deque
+
+from game.simulation import merge, play_games, summarize_counters, tally
+from net.protocol import MAX_FRAME, ProtocolError, encode, read_message
+
+DEFAULT_PORT = 8766
+LEASE_SECONDS = 600.0    # a range not reported or renewed in this long is handed out again
+HEARTBEAT_SECONDS = 60.0
+WAIT_SECONDS = 0.5
+
+
+def valid_counters(counters):
+    """Whether `counters` looks like a tally() result: the same keys, non-negative ints."""
+    template = tally([])
+    if not isinstance(counters, dict) or set(counters) != set(template):
+        return False
+    for key, value in counters.items():
+        values = value if isinstance(template[key], list) else [value]
+        if isinstance(template[key], list) and (not isinstance(value, list) or len(value) != len(template[key])):
+            return False
+        if not all(isinstance(v, int) and not isinstance(v, bool) and v >= 0 for v in values):
+            return False
+    return True
+
+
+class Coordinator:
+    """Bookkeeping for one sweep; `serve()` puts it on a socket."""
+
+    def __init__(self, first, games, range_size, difficulties=("Hard", "Hard"),
+                 checkpoint=None, lease_seconds=LEASE_SECONDS, clock=time.monotonic):
+        self.config = {"first": first, "games": games, "range_size": range_size,
+                       "difficulties": list(difficulties)}
+        self.checkpoint = checkpoint
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+        self.done = set()
+        self.totals = tally([])
+        self.assigned = {}        # range id -> (owner, lease deadline)
+        self.issued = set()       # range ids handed out since this coordinator started
+        self.reassigned = 0
+        if checkpoint and os.path.exists(checkpoint):
+            self._load()
+        count = -(-games // range_size)
+        self.pending = deque(i for i in range(count) if i not in self.done)
+        self._finished = None
+        self._peers = {}          # handler task -> writer
+
+    def _load(self):
+        with open(self.checkpoint) as fh:
+            state = json.load(fh)
+        if state["config"] != self.config:
+            raise ValueError(f"{self.checkpoint} belongs to a different sweep: {state['config']}")
+        self.done = set(state["done"])
+        self.totals = state["totals"]
+
+    def save(self):
+        if not self.checkpoint:
+            return
+        tmp = self.checkpoint + ".tmp"
+        with open(tmp, "w") as fh:
+            json.dump({"config": self.config, "done": sorted(self.done), "totals": self.totals}, fh)
+        os.replace(tmp, self.checkpoint)
+
+    def bounds(self, range_id):
+        first, games, size = self.config["first"], self.config["games"], self.config["range_size"]
+        start = first + range_id * size
+        return start, min(start + size, first + games)
+
+    def complete(self):
+        return not self.pending and not self.assigned
+
+    def assign(self, owner):
+        """The next message for a worker asking for work."""
+        self.expire()
+        if self.pending:
+            range_id = self.pending.popleft()
+            self.assigned[range_id] = (owner, self.clock() + self.lease_seconds)
+            self.issued.add(range_id)
+            start, stop = self.bounds(range_id)
+            return {"type": "range", "id": range_id, "start": start, "stop": stop,
+                    "difficulties": self.config["difficulties"]}
+        if self.complete():
+            return {"type": "done"}
+        return {"type": "wait", "seconds": WAIT_SECONDS}
+
+    def record(self, range_id, counters):
+        """Count a finished range once, however many workers reported it.
+
+        Results for ranges that were never handed out, and counters that do
+        not have the shape tally() produces, are ignored.
+        """
+        if not isinstance(range_id, int) or range_id not in self.issued or not valid_counters(counters):
+            return False
+        self.assigned.pop(range_id, None)
+        if range_id in self.done:
+            return False
+        try:
+            self.pending.remove(range_id)    # reassigned while the late result was in flight
+        except ValueError:
+            pass
+        self.done.add(range_id)
+        merge(self.totals, counters)
+        self.save()
+        return True
+
+    def renew(self, range_id, owner):
+        """Extend the lease of a range `owner` is still playing."""
+        lease = self.assigned.get(range_id)
+        if lease is None or lease[0] is not owner:
+            return False
+        self.assigned[range_id] = (owner, self.clock() + self.lease_seconds)
+        return True
+
+    def release(self, owner):
+        """Put the ranges of a lost worker back at the front of the queue."""
+        lost = [range_id for range_id, (who, _) in self.assigned.items() if who is owner]
+        for range_id in lost:
+            del self.assigned[range_id]
+            self.pending.appendleft(range_id)
+        self.reassigned += len(lost)
+        return lost
+
+    def expire(self):
+        now = self.clock()
+        late = [range_id for range_id, (_, deadline) in self.assigned.items() if deadline <= now]
+        for range_id in late:
+            del self.assigned[range_id]
+            self.pending.appendleft(range_id)
+        self.reassigned += len(late)
+        return late
+
+    def progress(self):
+        return len(self.done), len(self.done) + len(self.pending) + len(self.assigned)
+
+    async def _handle(self, reader, writer):
+        owner = object()
+        self._peers[asyncio.current_task()] = writer
+        try:
+            while True:
+                try:
+                    msg = await read_message(reader)
+                except ProtocolError:
+                    break
+                if msg is None:
+                    break
+                if msg["type"] == "result":
+                    # a malformed result is dropped; the range's lease brings it back
+                    self.record(msg.get("id"), msg.get("counters"))
+                    if self.complete():
+                        self._finished.set()
+                elif msg["type"] == "progress":
+                    self.renew(msg.get("id"), owner)
+                    continue
+                elif msg["type"] != "next":
+                    break
+                reply = self.assign(owner)
+                writer.write(encode(reply))
+                await writer.drain()
+                if reply["type"] == "done":
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._peers.pop(asyncio.current_task(), None)
+            self.release(owner)
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT, started=None):
+        """Run until every range is recorded; returns the totals.
+
+        `started`, if given, is called with the bound port once listening.
+        """
+        self._finished = asyncio.Event()
+        if self.complete():
+            return self.totals
+        server = await asyncio.start_server(self._handle, host, port, limit=MAX_FRAME)
+        if started is not None:
+            started(server.sockets[0].getsockname()[1])
+        async with server:
+            while not self._finished.is_set():
+                # wakes idle waiters' leases up even when no worker is talking
+                try:
+                    await asyncio.wait_for(self._finished.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    self.expire()
+            # workers still waiting for a range (or re-running a late one) are
+            # told the sweep is over and their connections closed
+            for writer in list(self._peers.values()):
+                try:
+                    writer.write(encode({"type": "done"}))
+                    writer.close()
+                except Exception:
+                    pass
+            if self._peers:
+                await asyncio.wait(list(self._peers), timeout=5.0)
+        return self.totals
+
+
+async def run_worker(host="127.0.0.1", port=DEFAULT_PORT, connect_timeout=10.0, heartbeat=HEARTBEAT_SECONDS):
+    """Play ranges until the coordinator says done or goes away; returns ranges played."""
+    loop = asyncio.get_running_loop()
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_FRAME)
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+    played = 0
+    try:
+        writer.write(encode({"type": "next"}))
+        while True:
+            await writer.drain()
+            msg = await read_message(reader)
+            if msg is None or msg["type"] == "done":
+                break
+            if msg["type"] == "wait":
+                await asyncio.sleep(msg["seconds"])
+                writer.write(encode({"type": "next"}))
+            elif msg["type"] == "range":
+                # played off the event loop so the heartbeat keeps the lease
+                playing = loop.run_in_executor(None, play_games, range(msg["start"], msg["stop"]),
+                                               tuple(msg["difficulties"]))
+                while True:
+                    try:
+                        results = await asyncio.wait_for(asyncio.shield(playing), heartbeat)
+                        break
+                    except asyncio.TimeoutError:
+                        writer.write(encode({"type": "progress", "id": msg["id"]}))
+                        await writer.drain()
+                played += 1
+                writer.write(encode({"type": "result", "id": msg["id"], "counters": tally(results)}))
+    except (ConnectionError, OSError):
+        pass
+    finally:
+        writer.close()
+    return played
+
+
+def _spawn_workers(count, port, tables_name=None):
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = src_dir + os.pathsep + env.get("PYTHONPATH", "")
+    command = [sys.executable, "-m", "net.sweep", "worker", "--port", str(port)]
+    if tables_name:
+        command += ["--tables", tables_name]
+    return [subprocess.Popen(command, env=env) for _ in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distributed headless Battleship sweeps")
+    sub = parser.add_subparsers(dest="role", required=True)
+    coord = sub.add_parser("coordinator", help="hand out seed ranges and collect counters")
+    coord.add_argument("--host", default="127.0.0.1")
+    coord.add_argument("--port", type=int, default=DEFAULT_PORT)
+    coord.add_argument("--games", type=int, required=True)
+    coord.add_argument("--first-seed", type=int, default=0)
+    coord.add_argument("--range-size", type=int, default=500, help="games per range handed to a worker")
+    coord.add_argument("--difficulties", nargs=2, default=["Hard", "Hard"], metavar=("SIDE0", "SIDE1"))
+    coord.add_argument("--checkpoint", metavar="PATH", help="progress file; an existing one is resumed")
+    coord.add_argument("--lease", type=float, default=LEASE_SECONDS, help="seconds before a silent range is reassigned")
+    coord.add_argument("--spawn-workers", type=int, default=0, metavar="N", help="start N local worker processes")
+    worker = sub.add_parser("worker", help="play ranges for a coordinator")
+    worker.add_argument("--host", default="127.0.0.1")
+    worker.add_argument("--port", type=int, default=DEFAULT_PORT)
+    worker.add_argument("--tables", metavar="NAME", help="shared placement tables published by the coordinator")
+    args = parser.parse_args(argv)
+
+    if args.role == "worker":
+        if args.tables:
+            from game import tables
+            tables.attach(args.tables)
+        played = asyncio.run(run_worker(args.host, args.port))
+        print(f"worker played {played} ranges")
+        return 0
+
+    coordinator = Coordinator(args.first_seed, args.games, args.range_size, args.difficulties,
+                              checkpoint=args.checkpoint, lease_seconds=args.lease)
+    done, total = coordinator.progress()
+    if done:
+        print(f"resuming: {done}/{total} ranges already done")
+    procs = []
+    shared = None
+    if args.spawn_workers and "Expert" in args.difficulties:
+        from game import tables
+        shared = tables.publish()
+    started = time.perf_counter()
+    try:
+        totals = asyncio.run(coordinator.serve(
+            args.host, args.port,
+            started=lambda port: procs.extend(_spawn_workers(args.spawn_workers, port, shared and shared.name))))
+    finally:
+        for proc in procs:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.terminate()
+                proc.wait()
+        if shared is not None:
+            shared.close()
+    summary = summarize_counters(totals)
+    mean = summary["mean_winner_shots"]
+    print(f"games: {summary['games']}  wins: {summary['wins'][0]}/{summary['wins'][1]}  "
+          f"unfinished: {summary['unfinished']}  mean winning shots: {mean:.1f}  "
+          f"reassigned ranges: {coordinator.reassigned}  {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
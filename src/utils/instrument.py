@@ -0,0 +1,220 @@
+"""Optional per-turn latency instrumentation.
+
+Nothing here runs unless `enable()` is called. Enabling wraps a few hot
+methods at class level (AI.make_guess, Board.receive_shot and the
+BoardCanvas drawing calls) with timers, and `disable()` puts the original
+functions back, so a normal game pays nothing beyond a `mark_turn()` call
+that returns straight away.
+
+    recorder = instrument.enable()
+    ...
+    recorder.snapshot()["receive_shot"]["p99"]
+    recorder.dump("latency.json")
+"""
+import bisect
+import importlib
+import json
+import threading
+import time
+from collections import deque
+
+WINDOW = 2048        # samples kept per metric
+TURNS = 256          # per-turn breakdowns kept
+# histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+BUCKETS_MS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# (module, class, method, metric) wrapped by enable()
+TIMED_METHODS = (
+    ("game.ai", "AI", "make_guess", "make_guess"),
+    ("game.board", "Board", "receive_shot", "receive_shot"),
+    ("gui.widgets", "BoardCanvas", "mark_hit", "canvas_update"),
+    ("gui.widgets", "BoardCanvas", "mark_miss", "canvas_update"),
+    ("gui.widgets", "BoardCanvas", "draw_ship", "canvas_update"),
+)
+
+
+def _pick(ordered, p):
+    return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))]
+
+
+class Histogram:
+    """Rolling window of latency samples (milliseconds)."""
+
+    def __init__(self, window=WINDOW):
+        self.samples = deque(maxlen=window)
+        self.total = 0    # samples ever recorded, including ones rolled out
+
+    def add(self, ms):
+        self.samples.append(ms)
+        self.total += 1
+
+    def __len__(self):
+        return len(self.samples)
+
+    def percentile(self, p):
+        if not self.samples:
+            return None
+        return _pick(sorted(self.samples), p)
+
+    def buckets(self):
+        """Sample counts per BUCKETS_MS bound, plus one for anything slower."""
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for ms in self.samples:
+            counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        return counts
+
+    def summary(self):
+        if not self.samples:
+            return {"count": 0, "total": self.total}
+        ordered = sorted(self.samples)
+        return {
+            "count": len(ordered),
+            "total": self.total,
+            "mean": sum(ordered) / len(ordered),
+            "p50": _pick(ordered, 50),
+            "p90": _pick(ordered, 90),
+            "p99": _pick(ordered, 99),
+            "max": ordered[-1],
+            "buckets": self.buckets(),
+        }
+
+
+class Recorder:
+    """Named histograms plus a rolling per-turn breakdown of where time went."""
+
+    def __init__(self, window=WINDOW, turns=TURNS):
+        self.window = window
+        self.histograms = {}
+        self.turns = deque(maxlen=turns)
+        self.turn = None
+        self._lock = threading.Lock()    # AI moves are timed on the worker thread
+
+    def record(self, metric, ms):
+        with self._lock:
+            hist = self.histograms.get(metric)
+            if hist is None:
+                hist = self.histograms[metric] = Histogram(self.window)
+            hist.add(ms)
+            if self.turn is not None:
+                self.turn[metric] = self.turn.get(metric, 0.0) + ms
+
+    def mark_turn(self, label):
+        """Start attributing samples to a new turn (e.g. "player" or "ai")."""
+        with self._lock:
+            self.turn = {"turn": label, "at": time.time()}
+            self.turns.append(self.turn)
+
+    def histogram(self, metric):
+        return self.histograms.get(metric)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: hist.summary() for name, hist in self.histograms.items()}
+
+    def dump(self, path):
+        with self._lock:
+            turns = [dict(t) for t in self.turns]
+        data = {"buckets_ms": list(BUCKETS_MS), "metrics": self.snapshot(), "turns": turns}
+        with open(path, "w") as fh:
+            json.dump(data, fh, indent=2)
+        return path
+
+
+class LagProbe:
+    """Measures event-loop lag: how late an `after` callback fires."""
+
+    def __init__(self, widget, recorder, interval_ms=100):
+        self.widget = widget
+        self.recorder = recorder
+        self.interval_ms = interval_ms
+        self._after_id = None
+        self._due = None
+
+    def start(self):
+        if self._after_id is None:
+            self._schedule()
+
+    def stop(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _schedule(self):
+        self._due = time.perf_counter() + self.interval_ms / 1000.0
+        self._after_id = self.widget.after(self.interval_ms, self._fire)
+
+    def _fire(self):
+        self.recorder.record("event_loop_lag", max(0.0, (time.perf_counter() - self._due) * 1000.0))
+        self._schedule()
+
+
+_active = None
+_originals = []
+
+
+def _timed(func, metric):
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder = _active
+            if recorder is not None:
+                recorder.record(metric, (time.perf_counter() - started) * 1000.0)
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def enable(recorder=None, methods=TIMED_METHODS):
+    """Start recording into `recorder` (a new one by default) and return it.
+
+    Modules in `methods` that cannot be imported (no Tk, say) are skipped.
+    Pass methods=() and call wrap() later to keep those imports off startup.
+    """
+    global _active
+    if _active is not None:
+        disable()
+    _active = recorder if recorder is not None else Recorder()
+    wrap(methods)
+    return _active
+
+
+def wrap(methods=TIMED_METHODS):
+    """Put timers on `methods` (importing their modules) while recording is on."""
+    if _active is None:
+        return
+    for module_name, class_name, method, metric in methods:
+        try:
+            cls = getattr(importlib.import_module(module_name), class_name)
+        except ImportError:
+            continue
+        original = cls.__dict__[method]
+        if getattr(original, "__wrapped__", None) is not None:
+            continue    # already timed
+        _originals.append((cls, method, original))
+        setattr(cls, method, _timed(original, metric))
+
+
+def disable():
+    """Restore the original methods; returns the recorder that was active."""
+    global _active
+    recorder = _active
+    while _originals:
+        cls, method, original = _originals.pop()
+        setattr(cls, method, original)
+    _active = None
+    return recorder
+
+
+def active():
+    return _active
+
+
+def mark_turn(label):
+    if _active is not None:
+        _active.mark_turn(label)
@@ -0,0 +1,104 @@
+"""Turn cProfile data from simulation runs into flame-graph input.
+
+cProfile only keeps caller -> callee edges, not whole stacks, so stacks
+are rebuilt by walking the call graph from its roots and splitting each
+callee's time across its callers in proportion to the edge times (the
+usual approximation of gprof-style tools). Each frame is attributed to a
+category -- Board, AI or engine -- by the game module it lives in; library
+and builtin frames inherit the category of the nearest game frame above
+them, so `random.choice` inside the AI counts as AI.
+
+    stats = pstats.Stats(*profile_files)
+    stacks, totals = collapse(stats)
+    write_collapsed("sim.folded", stacks)    # flamegraph.pl / speedscope
+"""
+import os
+
+# (category, module paths) used to attribute frames; first match wins
+CATEGORIES = (
+    ("Board", ("game/board.py", "game/ship.py")),
+    ("AI", ("game/ai.py", "game/probability.py")),
+    ("engine", ("game/simulation.py",)),
+)
+OTHER = "other"
+MIN_US = 1.0        # stacks smaller than this (microseconds) are dropped
+MAX_DEPTH = 64
+
+
+def category(func):
+    """The category of a pstats function key (file, line, name), or None."""
+    path = func[0].replace(os.sep, "/")
+    for name, suffixes in CATEGORIES:
+        if path.endswith(suffixes):
+            return name
+    return None
+
+
+def label(func):
+    path, line, name = func
+    if path == "~":
+        text = name                      # builtins: "<built-in method builtins.len>"
+    else:
+        text = f"{name} ({os.path.basename(path)}:{line})"
+    return text.replace(";", ",")
+
+
+def _callees(stats):
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    return callees
+
+
+def collapse(stats, by_category=False):
+    """Rebuild stacks from a pstats.Stats.
+
+    Returns ({"frame;frame;...": microseconds of self time}, {category:
+    microseconds}). With by_category each stack is prefixed with its
+    category so a flame graph splits Board / AI / engine at the top.
+    """
+    raw = stats.stats
+    callees = _callees(raw)
+    stacks = {}
+    totals = {}
+
+    def walk(func, path, share, current):
+        _, _, tt, ct, _ = raw[func]
+        current = category(func) or current
+        path = path + (func,)
+        self_us = tt * share * 1e6
+        if self_us >= MIN_US:
+            frames = [label(f) for f in path]
+            if by_category:
+                frames.insert(0, current)
+            key = ";".join(frames)
+            stacks[key] = stacks.get(key, 0.0) + self_us
+        totals[current] = totals.get(current, 0.0) + tt * share * 1e6
+        if len(path) >= MAX_DEPTH or not ct:
+            return
+        for callee, edge_ct in callees.get(func, ()):
+            if callee in path:
+                continue    # recursion is folded into the outer frame
+            callee_ct = raw[callee][3]
+            if not callee_ct:
+                continue
+            # the callee time spent under func, scaled to this path's part of func
+            child = share * edge_ct / callee_ct
+            if child * callee_ct * 1e6 >= MIN_US:
+                walk(callee, path, child, current)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, (), 1.0, OTHER)
+    return stacks, totals
+
+
+def write_collapsed(path, stacks):
+    """One "frame;frame;... count" line per stack, counts in whole microseconds."""
+    with open(path, "w") as fh:
+        for key, us in sorted(stacks.items()):
+            count = int(round(us))
+            if count:
+                fh.write(f"{key} {count}\n")
+    return path
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# the game modules import each other as top-level packages (game.*, gui.*),
+# the same way they resolve when running src/main.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
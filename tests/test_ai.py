@@ -1,30 +1,63 @@
+import random
 import unittest
-from src.game.ai import AI
-from src.game.board import Board
+
+from game.ai import AI
+from game.board import Board
+from game.ship import Ship
+
 
 class TestAI(unittest.TestCase):
+
     def setUp(self):
         self.board = Board()
-        self.ai = AI(self.board)
-
-    def test_ai_makes_valid_guess(self):
-        guess = self.ai.make_guess()
-        self.assertIn(guess, self.board.get_available_coordinates())
-
-    def test_ai_tracks_hits(self):
-        self.board.place_ship("A1", "horizontal", 3)  # Place a ship for testing
-        self.ai.make_guess()  # AI makes a guess
-        hit = self.board.check_hit(guess)
-        if hit:
-            self.ai.track_hit(guess)
-            self.assertIn(guess, self.ai.hit_coordinates)
-
-    def test_ai_sinks_ship(self):
-        self.board.place_ship("B2", "vertical", 2)  # Place a ship for testing
-        self.ai.make_guess()  # AI makes a guess
-        self.board.check_hit(guess)
-        if self.board.is_sunk("B2"):
-            self.assertIn("You sunk my ship at B2!", self.ai.messages)
+        self.board.place_ship(Ship("Cruiser", 3, [], "R"), (4, 4), 'H')
+
+    def test_guesses_are_in_bounds_and_never_repeat(self):
+        for difficulty in ("Easy", "Medium", "Hard"):
+            board = Board(rng=random.Random(1))
+            board.place_ships_randomly()
+            ai = AI(board, difficulty=difficulty, rng=random.Random(2))
+            seen = set()
+            for _ in range(60):
+                guess = ai.make_guess()
+                self.assertTrue(board.is_valid_guess(*guess), (difficulty, guess))
+                self.assertNotIn(guess, seen)
+                seen.add(guess)
+                ai.record_result(guess, board.receive_shot(guess)[0])
+
+    def test_follows_up_on_a_hit(self):
+        ai = AI(self.board, difficulty="Medium", rng=random.Random(0))
+        ai.previous_guesses.add((4, 5))
+        ai.record_result((4, 5), "hit")
+        self.assertIn(ai.make_guess(), {(3, 5), (5, 5), (4, 4), (4, 6)})
+
+    def test_extends_a_line_of_hits(self):
+        ai = AI(self.board, difficulty="Hard", rng=random.Random(0))
+        for cell in ((4, 4), (4, 5)):
+            ai.previous_guesses.add(cell)
+            ai.record_result(cell, "hit")
+        self.assertIn(ai.make_guess(), {(4, 3), (4, 6)})
+
+    def test_sinking_clears_targets(self):
+        ai = AI(self.board, difficulty="Hard")
+        ai.record_result((4, 4), "hit")
+        ai.record_result((4, 5), "sunk")
+        self.assertEqual(ai.hit_positions, [])
+        self.assertEqual(ai.sunk_ships, [(4, 5)])
+
+    def test_hard_hunts_on_parity(self):
+        ai = AI(Board(), difficulty="Hard", rng=random.Random(3))
+        for _ in range(20):
+            r, c = ai.make_guess()
+            self.assertEqual((r + c) % 2, 0)
+
+    def test_seeded_ai_is_repeatable(self):
+        guesses = []
+        for _ in range(2):
+            ai = AI(Board(), difficulty="Easy", rng=random.Random(11))
+            guesses.append([ai.make_guess() for _ in range(10)])
+        self.assertEqual(guesses[0], guesses[1])
+
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,80 @@
+import _tkinter
+import threading
+import time
+import tkinter
+import unittest
+
+from gui.ai_worker import AIWorker
+
+
+class SlowAI:
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+        self.threads = []
+        self.previous_guesses = set()
+
+    def make_guess(self):
+        self.calls += 1
+        self.threads.append(threading.get_ident())
+        time.sleep(self.delay)
+        guess = (self.calls, 0)
+        self.previous_guesses.add(guess)
+        return guess
+
+
+class BrokenAI:
+    def make_guess(self):
+        raise ValueError("no move")
+
+
+class TestAIWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.interp = tkinter.Tcl()
+        self.moves = []
+        self.worker = AIWorker(self.interp, self.moves.append)
+
+    def tearDown(self):
+        self.worker.close()
+
+    def _pump(self, seconds):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.interp.dooneevent(_tkinter.DONT_WAIT)
+            time.sleep(0.001)
+
+    def test_move_is_computed_off_thread_and_delivered_on_it(self):
+        ai = SlowAI(0.05)
+        started = time.monotonic()
+        self.worker.request(ai)
+        # request() must return immediately even though make_guess is slow
+        self.assertLess(time.monotonic() - started, 0.04)
+        self._pump(0.3)
+        self.assertEqual(self.moves, [(1, 0)])
+        self.assertNotEqual(ai.threads[0], threading.get_ident())
+
+    def test_cancel_discards_moves_in_flight(self):
+        ai = SlowAI(0.05)
+        self.worker.request(ai)
+        self.worker.request(ai)
+        time.sleep(0.01)
+        self.worker.cancel()
+        self._pump(0.3)
+        self.assertEqual(self.moves, [])
+        # the queued second request was skipped without computing it
+        self.assertEqual(ai.calls, 1)
+        # and the dropped guess can be fired at later
+        self.assertEqual(ai.previous_guesses, set())
+
+    def test_errors_go_to_on_error(self):
+        errors = []
+        self.worker.on_error = errors.append
+        self.worker.request(BrokenAI())
+        self._pump(0.2)
+        self.assertEqual(self.moves, [])
+        self.assertIsInstance(errors[0], ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()
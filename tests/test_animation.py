@@ -0,0 +1,72 @@
+import _tkinter
+import time
+import tkinter
+import unittest
+
+from gui.animation import Animator
+
+
+class TestAnimator(unittest.TestCase):
+
+    def setUp(self):
+        self.interp = tkinter.Tcl()
+        self.animator = Animator(self.interp)
+        self.log = []
+
+    def _frames(self, name, n):
+        return [lambda i=i: self.log.append((name, i)) for i in range(n)]
+
+    def _pump(self, seconds):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline and len(self.animator):
+            self.interp.dooneevent(_tkinter.DONT_WAIT)
+            time.sleep(0.001)
+
+    def test_animations_share_one_tick_and_reach_their_last_frame(self):
+        self.animator.start(("a", 1), self._frames("a", 4), 10)
+        self.animator.start(("b", 1), self._frames("b", 3), 10)
+        self.assertEqual(self.log, [("a", 0), ("b", 0)])
+        self._pump(1.0)
+        self.assertEqual(len(self.animator), 0)
+        self.assertEqual([e for e in self.log if e[0] == "a"][-1], ("a", 3))
+        self.assertEqual([e for e in self.log if e[0] == "b"][-1], ("b", 2))
+
+    def test_instant_mode_applies_only_the_final_frame(self):
+        self.animator.set_instant()
+        self.animator.start(("a", 1), self._frames("a", 5), 25)
+        self.assertEqual(self.log, [("a", 4)])
+        self.assertEqual(len(self.animator), 0)
+
+    def test_restarting_a_key_finishes_the_previous_animation(self):
+        self.animator.start(("a", 1), self._frames("old", 5), 25)
+        self.animator.start(("a", 1), self._frames("new", 5), 25)
+        self.assertEqual(self.log, [("old", 0), ("old", 4), ("new", 0)])
+        self.assertEqual(len(self.animator), 1)
+
+    def test_overload_fast_forwards_the_oldest(self):
+        self.animator.max_active = 3
+        for i in range(5):
+            self.animator.start(("a", i), self._frames(i, 4), 25)
+        self.assertEqual(len(self.animator), 3)
+        self.assertIn((0, 3), self.log)
+        self.assertIn((1, 3), self.log)
+        self.assertEqual(self.animator.fast_forwarded, 2)
+
+    def test_late_animations_skip_frames(self):
+        self.animator.start(("a", 1), self._frames("a", 10), 5)
+        time.sleep(0.03)
+        self._pump(1.0)
+        self.assertLess(len(self.log), 10)
+        self.assertEqual(self.log[-1], ("a", 9))
+        self.assertGreater(self.animator.frames_skipped, 0)
+
+    def test_cancel_by_owner(self):
+        owner = object()
+        self.animator.start((owner, 1), self._frames("a", 4), 25)
+        self.animator.start(("other", 1), self._frames("b", 4), 25)
+        self.animator.cancel(owner)
+        self.assertEqual(len(self.animator), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
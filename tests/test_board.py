@@ -1,6 +1,9 @@
+import random
 import unittest
-from src.game.board import Board
-from src.game.ship import Ship
+
+from game.board import SHIP_SPECS, Board
+from game.ship import Ship
+
 
 class TestBoard(unittest.TestCase):
 
@@ -8,47 +11,76 @@ class TestBoard(unittest.TestCase):
         self.board = Board()
 
     def test_place_ship(self):
-        ship = Ship(size=3)
-        result = self.board.place_ship(ship, (0, 0), 'horizontal')
-        self.assertTrue(result)
-        self.assertEqual(self.board.grid[0][0], ship)
-        self.assertEqual(self.board.grid[0][1], ship)
-        self.assertEqual(self.board.grid[0][2], ship)
+        ship = Ship("Cruiser", 3, [], "R")
+        self.assertTrue(self.board.place_ship(ship, (0, 0), 'H'))
+        self.assertEqual(ship.coordinates, [(0, 0), (0, 1), (0, 2)])
+        self.assertEqual([self.board.grid[0][c] for c in range(4)], ['R', 'R', 'R', ' '])
 
     def test_place_ship_out_of_bounds(self):
-        ship = Ship(size=3)
-        result = self.board.place_ship(ship, (0, 8), 'horizontal')
-        self.assertFalse(result)
+        self.assertFalse(self.board.place_ship(Ship("Cruiser", 3, [], "R"), (0, 8), 'H'))
+        self.assertEqual(self.board.ships, [])
 
     def test_place_ship_vertical(self):
-        ship = Ship(size=3)
-        result = self.board.place_ship(ship, (0, 0), 'vertical')
-        self.assertTrue(result)
-        self.assertEqual(self.board.grid[0][0], ship)
-        self.assertEqual(self.board.grid[1][0], ship)
-        self.assertEqual(self.board.grid[2][0], ship)
-
-    def test_hit_detection(self):
-        ship = Ship(size=3)
-        self.board.place_ship(ship, (0, 0), 'horizontal')
-        hit_result = self.board.receive_shot((0, 1))
-        self.assertTrue(hit_result)
-        self.assertTrue(ship.is_hit((0, 1)))
-
-    def test_miss_detection(self):
-        ship = Ship(size=3)
-        self.board.place_ship(ship, (0, 0), 'horizontal')
-        miss_result = self.board.receive_shot((1, 1))
-        self.assertFalse(miss_result)
+        ship = Ship("Cruiser", 3, [], "R")
+        self.assertTrue(self.board.place_ship(ship, (0, 0), 'V'))
+        self.assertEqual(ship.coordinates, [(0, 0), (1, 0), (2, 0)])
+
+    def test_ships_may_not_touch(self):
+        self.board.place_ship(Ship("Cruiser", 3, [], "R"), (0, 0), 'H')
+        self.assertFalse(self.board.place_ship(Ship("Destroyer", 2, [], "D"), (1, 3), 'H'))
+        self.assertTrue(self.board.place_ship(Ship("Destroyer", 2, [], "D"), (2, 0), 'H'))
+
+    def test_hit_and_miss(self):
+        self.board.place_ship(Ship("Cruiser", 3, [], "R"), (0, 0), 'H')
+        self.assertEqual(self.board.receive_shot((0, 1)), ("hit", "Cruiser"))
+        self.assertEqual(self.board.receive_shot((1, 1)), ("miss", None))
+        self.assertFalse(self.board.is_valid_guess(0, 1))
+        self.assertFalse(self.board.is_valid_guess(1, 1))
+        self.assertFalse(self.board.is_valid_guess(10, 0))
+        self.assertTrue(self.board.is_valid_guess(0, 2))
 
     def test_sinking_ship(self):
-        ship = Ship(size=3)
-        self.board.place_ship(ship, (0, 0), 'horizontal')
+        ship = Ship("Cruiser", 3, [], "R")
+        self.board.place_ship(ship, (0, 0), 'H')
         self.board.receive_shot((0, 0))
         self.board.receive_shot((0, 1))
-        sunk = self.board.receive_shot((0, 2))
-        self.assertTrue(sunk)
+        self.assertEqual(self.board.receive_shot((0, 2)), ("sunk", "Cruiser"))
         self.assertTrue(ship.is_sunk())
+        self.assertTrue(self.board.all_ships_sunk())
+
+    def test_out_of_bounds_shot_raises(self):
+        with self.assertRaises(ValueError):
+            self.board.receive_shot((10, 0))
+
+    def test_random_placement_is_seedable(self):
+        first = Board(rng=random.Random(7))
+        second = Board(rng=random.Random(7))
+        first.place_ships_randomly()
+        second.place_ships_randomly()
+        self.assertEqual([s.coordinates for s in first.ships], [s.coordinates for s in second.ships])
+        self.assertEqual(sorted(s.size for s in first.ships), sorted(size for _, size, _ in SHIP_SPECS))
+
+
+class TestLegalPlacements(unittest.TestCase):
+
+    def test_empty_board(self):
+        legal = Board().legal_placements(5)
+        self.assertEqual(len(legal), 2 * 6 * 10)
+        self.assertIn((0, 5, 'H'), legal)
+        self.assertNotIn((0, 6, 'H'), legal)
+
+    def test_matches_place_ship(self):
+        board = Board()
+        board.place_ship(Ship("Cruiser", 3, [], "R"), (4, 4), 'H')
+        legal = board.legal_placements(2)
+        for r in range(board.size):
+            for c in range(board.size):
+                for orientation in ('H', 'V'):
+                    trial = Board()
+                    trial.place_ship(Ship("Cruiser", 3, [], "R"), (4, 4), 'H')
+                    placed = trial.place_ship(Ship("Destroyer", 2, [], "D"), (r, c), orientation)
+                    self.assertEqual(placed, (r, c, orientation) in legal, (r, c, orientation))
+
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
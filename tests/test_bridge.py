@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+import _tkinter
+import tkinter
+import unittest
+
+from gui.bridge import AsyncioBridge, MainThreadQueue
+
+
+def _pump_until(interp, predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        interp.dooneevent(_tkinter.DONT_WAIT)
+        time.sleep(0.001)
+
+
+class TestMainThreadQueue(unittest.TestCase):
+
+    def setUp(self):
+        # a Tcl interpreter runs the same event loop as Tk without a display
+        self.interp = tkinter.Tcl()
+
+    def test_items_from_other_threads_arrive_on_the_event_loop(self):
+        received = []
+        q = MainThreadQueue(self.interp, lambda item: received.append((item, threading.get_ident())))
+        producers = [threading.Thread(target=lambda n=n: [q.put(n * 100 + i) for i in range(100)]) for n in range(4)]
+        for t in producers:
+            t.start()
+        for t in producers:
+            t.join()
+        _pump_until(self.interp, lambda: len(received) == 400)
+        q.close()
+        self.assertEqual(sorted(item for item, _ in received), [n * 100 + i for n in range(4) for i in range(100)])
+        self.assertTrue(all(tid == threading.get_ident() for _, tid in received))
+
+    def test_blocking_wait_wakes_on_put(self):
+        received = []
+        q = MainThreadQueue(self.interp, received.append)
+        timer = threading.Timer(0.05, q.put, args=("hello",))
+        timer.start()
+        # dooneevent() without DONT_WAIT sleeps until an event fires; events
+        # left over from earlier interpreters may wake it first
+        deadline = time.monotonic() + 2.0
+        while not received and time.monotonic() < deadline:
+            self.interp.dooneevent()
+        timer.join()
+        q.close()
+        self.assertEqual(received, ["hello"])
+
+
+class TestAsyncioBridge(unittest.TestCase):
+
+    def test_coroutine_results_come_back_to_tk(self):
+        interp = tkinter.Tcl()
+        bridge = AsyncioBridge(interp)
+        received = []
+
+        async def work():
+            await asyncio.sleep(0.01)
+            bridge.call_in_tk(lambda: received.append(threading.get_ident()))
+
+        bridge.submit(work())
+        _pump_until(interp, lambda: received)
+        bridge.close()
+        self.assertEqual(received, [threading.get_ident()])
+
+
+if __name__ == '__main__':
+    unittest.main()
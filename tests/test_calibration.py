@@ -0,0 +1,87 @@
+import os
+import random
+import tempfile
+import unittest
+
+from game import calibration
+from game.ai import AI
+from game.simulation import hunt, random_board
+
+
+def curve_from(histograms):
+    return {"strengths": [i / (len(histograms) - 1) for i in range(len(histograms))], "turns": histograms}
+
+
+def spike(turns, width=calibration.MAX_TURNS + 1, games=1000):
+    histogram = [0] * width
+    histogram[turns] = games
+    return histogram
+
+
+class TestAdaptiveAI(unittest.TestCase):
+
+    def test_strength_orders_shots_to_win(self):
+        def mean_shots(strength):
+            total = 0
+            for seed in range(8):
+                rng = random.Random(seed)
+                board = random_board(rng)
+                total += hunt(AI(board, "Adaptive", rng=rng, strength=strength), board)
+            return total / 8
+        self.assertGreater(mean_shots(0.0), mean_shots(1.0) + 20)
+
+
+class TestCurve(unittest.TestCase):
+
+    def test_calibrate_and_round_trip(self):
+        curve = calibration.calibrate(3, strengths=(0.0, 1.0))
+        self.assertEqual([sum(h) for h in curve["turns"]], [3, 3])
+        self.assertGreater(curve["mean_shots"][0], curve["mean_shots"][1])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = calibration.save_curve(curve, os.path.join(tmp, "strength.json"))
+            self.assertEqual(calibration.load_curve(path), curve)
+            curve["fleet"] = [["Carrier", 5]]
+            calibration.save_curve(curve, path)
+            self.assertIsNone(calibration.load_curve(path))
+
+    def test_shipped_curve_is_monotonic(self):
+        curve = calibration.load_curve()
+        self.assertIsNotNone(curve)
+        shots = curve["mean_shots"]
+        self.assertEqual(shots, sorted(shots, reverse=True))
+
+    def test_first_mover_wins_ties(self):
+        dist = [0.0] * 5
+        dist[3] = 1.0
+        self.assertEqual(calibration.win_rate(dist, dist), 1.0)
+        later = [0.0] * 5
+        later[4] = 1.0
+        self.assertEqual(calibration.win_rate(later, dist), 0.0)
+
+
+class TestChooseStrength(unittest.TestCase):
+
+    def setUp(self):
+        # strength 0, 0.5, 1 finish in 60, 40 and 20 turns
+        self.curve = curve_from([spike(60), spike(40), spike(20)])
+
+    def test_without_a_curve(self):
+        self.assertEqual(calibration.choose_strength(None), calibration.DEFAULT_STRENGTH)
+
+    def test_matches_the_players_skill(self):
+        strong = [(True, 20)] * 5
+        weak = [(False, 50)] * 5
+        self.assertGreater(calibration.choose_strength(self.curve, 0.5, strong), 0.9)
+        self.assertLess(calibration.choose_strength(self.curve, 0.5, weak), 0.5)
+        self.assertEqual(calibration.skill_posterior(self.curve, strong).index(max(
+            calibration.skill_posterior(self.curve, strong))), 2)
+
+    def test_interpolates_between_grid_points(self):
+        # an unknown player beats the three strengths about 0.83, 0.5 and 0.17 of the time
+        strength = calibration.choose_strength(self.curve, 0.4)
+        self.assertGreater(strength, 0.5)
+        self.assertLess(strength, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import random
+import tempfile
+import unittest
+
+from game.ai import AI
+from game.board import Board
+from game.habits import HabitStore
+
+CORNER_FLEET = [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (9, 9), (8, 9)]
+
+
+class TestHabitStore(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "nested", "habits.bin")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_no_prior_before_any_game(self):
+        store = HabitStore(self.path)
+        self.assertEqual(store.games, 0)
+        self.assertIsNone(store.prior())
+
+    def test_counts_survive_a_reload(self):
+        store = HabitStore(self.path)
+        for _ in range(3):
+            self.assertTrue(store.record(CORNER_FLEET))
+        again = HabitStore(self.path)
+        self.assertEqual(again.games, 3)
+        self.assertEqual(again.counts[0], 3)
+        self.assertEqual(again.counts[99], 3)
+        self.assertEqual(sum(again.counts), 3 * len(CORNER_FLEET))
+        # a fixed-size aggregate, not a growing history
+        self.assertEqual(os.path.getsize(self.path), 12 + 4 * 100)
+
+    def test_memory_only_store_touches_no_file(self):
+        store = HabitStore(path=None)
+        self.assertFalse(store.record(CORNER_FLEET))
+        self.assertEqual(store.games, 1)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_damaged_file_starts_empty(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as fh:
+            fh.write(b"BSHB\x01")
+        self.assertEqual(HabitStore(self.path).games, 0)
+        self.assertEqual(HabitStore(self.path, size=8).games, 0)
+
+    def test_prior_favours_habitual_cells_and_shrinks_early(self):
+        store = HabitStore(self.path)
+        store.record(CORNER_FLEET)
+        one_game = store.prior()
+        for _ in range(49):
+            store.record(CORNER_FLEET)
+        prior = store.prior()
+        self.assertGreater(one_game[0], 1.0)
+        self.assertGreater(prior[0], one_game[0])
+        self.assertLess(prior[55], 1.0)
+
+
+class TestPriorHunting(unittest.TestCase):
+
+    def test_hard_ai_hunts_where_ships_usually_are(self):
+        prior = [0.01] * 100
+        for r, c in CORNER_FLEET:
+            prior[r * 10 + c] = 100.0
+        board = Board()
+        ai = AI(board, "Hard", rng=random.Random(4), prior=prior)
+        r, c = ai.make_guess()
+        self.assertIn((r, c), CORNER_FLEET)
+        self.assertEqual((r + c) % 2, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from gui import i18n
+
+
+class TestCatalogs(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = tempfile.mkdtemp()
+        i18n.clear_cache()
+
+    def tearDown(self):
+        i18n.clear_cache()
+        shutil.rmtree(self.cache, ignore_errors=True)
+
+    def test_every_language_covers_english(self):
+        english = set(i18n.catalog("English", self.cache))
+        for language in i18n.LANGUAGES:
+            with open(i18n._source(language), encoding="utf-8") as fh:
+                self.assertEqual(set(json.load(fh)), english, language)
+
+    def test_missing_keys_fall_back_to_english(self):
+        locales = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, locales, ignore_errors=True)
+        with open(os.path.join(locales, "en.json"), "w", encoding="utf-8") as fh:
+            json.dump({"start": "Start", "exit": "Exit"}, fh)
+        with open(os.path.join(locales, "de.json"), "w", encoding="utf-8") as fh:
+            json.dump({"exit": "Beenden"}, fh)
+        old = i18n.LOCALES_DIR
+        i18n.LOCALES_DIR = locales
+        try:
+            self.assertEqual(i18n.catalog("German", self.cache), {"start": "Start", "exit": "Beenden"})
+        finally:
+            i18n.LOCALES_DIR = old
+
+    def test_unknown_language_is_english(self):
+        self.assertIs(i18n.catalog("Klingon", self.cache), i18n.catalog("English", self.cache))
+
+    def test_loaded_once_per_process(self):
+        self.assertIs(i18n.catalog("French", self.cache), i18n.catalog("French", self.cache))
+
+    def test_compiled_cache_is_reused(self):
+        first = i18n.catalog("Spanish", self.cache)
+        self.assertTrue(os.path.exists(os.path.join(self.cache, "es.marshal")))
+        i18n.clear_cache()
+        original = i18n._compile
+        i18n._compile = lambda language: self.fail("catalog was recompiled")
+        try:
+            self.assertEqual(i18n.catalog("Spanish", self.cache), first)
+        finally:
+            i18n._compile = original
+
+    def test_stale_cache_is_rebuilt(self):
+        i18n.catalog("Spanish", self.cache)
+        path = os.path.join(self.cache, "es.marshal")
+        with open(path, "wb") as fh:
+            fh.write(b"garbage")
+        i18n.clear_cache()
+        self.assertEqual(i18n.catalog("Spanish", self.cache)["start"], "Iniciar")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+
+from game.ai import AI
+from game.board import Board
+from utils import instrument
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_rolling_window(self):
+        hist = instrument.Histogram(window=4)
+        for ms in (1, 2, 3, 4, 100):
+            hist.add(ms)
+        self.assertEqual(len(hist), 4)
+        self.assertEqual(hist.total, 5)
+        self.assertEqual(hist.percentile(0), 2)
+        self.assertEqual(hist.summary()["max"], 100)
+
+    def test_buckets(self):
+        hist = instrument.Histogram()
+        for ms in (0.005, 0.5, 3000):
+            hist.add(ms)
+        counts = hist.buckets()
+        self.assertEqual(sum(counts), 3)
+        self.assertEqual(counts[0], 1)
+        self.assertEqual(counts[-1], 1)
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def tearDown(self):
+        instrument.disable()
+
+    def test_disabled_leaves_methods_untouched(self):
+        original = Board.__dict__["receive_shot"]
+        instrument.enable()
+        self.assertIsNot(Board.__dict__["receive_shot"], original)
+        instrument.disable()
+        self.assertIs(Board.__dict__["receive_shot"], original)
+        self.assertIsNone(instrument.active())
+        # no recorder: a no-op
+        instrument.mark_turn("player")
+
+    def test_wrapping_can_wait_until_after_startup(self):
+        original = Board.__dict__["receive_shot"]
+        instrument.enable(methods=())
+        self.assertIs(Board.__dict__["receive_shot"], original)
+        instrument.wrap()
+        instrument.wrap()
+        self.assertIs(Board.__dict__["receive_shot"].__wrapped__, original)
+        instrument.disable()
+        self.assertIs(Board.__dict__["receive_shot"], original)
+        # nothing is wrapped once recording has stopped
+        instrument.wrap()
+        self.assertIs(Board.__dict__["receive_shot"], original)
+
+    def test_records_per_turn(self):
+        recorder = instrument.enable()
+        board = Board()
+        board.place_ships_randomly()
+        ai = AI(board, difficulty="Hard")
+        for _ in range(5):
+            instrument.mark_turn("ai")
+            guess = ai.make_guess()
+            result, _ = board.receive_shot(guess)
+            ai.record_result(guess, result)
+        snap = recorder.snapshot()
+        self.assertEqual(snap["make_guess"]["count"], 5)
+        self.assertEqual(snap["receive_shot"]["count"], 5)
+        self.assertEqual(len(recorder.turns), 5)
+        self.assertIn("make_guess", recorder.turns[-1])
+
+    def test_dump(self):
+        recorder = instrument.enable()
+        recorder.record("event_loop_lag", 1.5)
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        recorder.dump(path)
+        with open(path) as fh:
+            data = json.load(fh)
+        self.assertEqual(data["metrics"]["event_loop_lag"]["p50"], 1.5)
+        self.assertEqual(len(data["buckets_ms"]) + 1, len(data["metrics"]["event_loop_lag"]["buckets"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
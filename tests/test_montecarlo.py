@@ -0,0 +1,118 @@
+import random
+import time
+import unittest
+
+from game import montecarlo
+from game.ai import AI
+from game.board import Board
+from game.probability import neighbours
+from game.simulation import hunt, random_board
+
+
+def cells_of(numbers, size=10):
+    return {divmod(n, size) for n in numbers}
+
+
+class TestSampler(unittest.TestCase):
+
+    def test_masks_match_placements(self):
+        cells, footprint, numbers = montecarlo.placement_masks(10, 2)[0]
+        self.assertEqual(numbers, (0, 1))
+        self.assertEqual(cells, 0b11)
+        self.assertEqual(footprint, montecarlo.to_mask([(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)], 10))
+
+    def test_sampled_fleets_are_consistent_with_the_shots(self):
+        misses = {(0, 0), (4, 4), (9, 9), (2, 7)}
+        hits = {(5, 5), (5, 6)}
+        sunk = {(0, 3), (0, 4)}
+        sampler = montecarlo.Sampler(10, [5, 4, 3, 3], montecarlo.to_mask(misses, 10),
+                                     montecarlo.to_mask(hits, 10), montecarlo.to_mask(sunk, 10))
+        rng = random.Random(4)
+        for _ in range(50):
+            fleet = cells_of(sampler.sample_one(rng))
+            self.assertEqual(len(fleet), 15)    # no two ships share a cell
+            self.assertTrue(hits <= fleet)
+            self.assertFalse(fleet & misses)
+            self.assertFalse(fleet & (sunk | set(neighbours(sunk, 10))))
+
+    def test_ships_never_touch(self):
+        sampler = montecarlo.Sampler(10, [5, 4, 3, 3, 2], 0, 0, 0)
+        rng = random.Random(9)
+        for _ in range(20):
+            numbers = sampler.sample_one(rng)
+            # longest ships go down first, and their cells come back last
+            ships = []
+            for length in (2, 3, 3, 4, 5):
+                ships.append(cells_of(numbers[:length]))
+                numbers = numbers[length:]
+            for i, ship in enumerate(ships):
+                halo = set(neighbours(ship, 10))
+                for other in ships[i + 1:]:
+                    self.assertFalse(other & (ship | halo))
+
+    def test_sample_limit_is_split_across_workers(self):
+        try:
+            counts, samples = montecarlo.estimate(10, [3, 2], 0, 0, 0, random.Random(1), budget_ms=None,
+                                                  limit=40, workers=2)
+        finally:
+            montecarlo.shutdown()
+        self.assertEqual(samples, 40)
+        self.assertEqual(sum(counts), 40 * 5)
+
+    def test_needs_a_budget_or_a_limit(self):
+        with self.assertRaises(ValueError):
+            montecarlo.estimate(10, [3, 2], 0, 0, 0, random.Random(1), budget_ms=None, limit=None)
+        with self.assertRaises(ValueError):
+            AI(Board(), "Expert", budget_ms=None, samples=None)
+
+    def test_cold_workers_do_not_hold_up_the_move(self):
+        # spawning takes far longer than the budget; the caller's own samples are used
+        try:
+            started = time.monotonic()
+            counts, samples = montecarlo.estimate(10, [3, 2], 0, 0, 0, random.Random(1), budget_ms=20,
+                                                  workers=2)
+            elapsed = time.monotonic() - started
+        finally:
+            montecarlo.shutdown()
+        self.assertGreater(samples, 0)
+        self.assertLess(elapsed, 0.15)
+
+
+class TestExpertAI(unittest.TestCase):
+
+    def test_guesses_are_valid_and_repeatable(self):
+        games = []
+        for _ in range(2):
+            rng = random.Random(3)
+            board = random_board(rng)
+            ai = AI(board, difficulty="Expert", rng=rng, budget_ms=None, samples=30)
+            shots = []
+            while not board.all_ships_sunk():
+                guess = ai.make_guess()
+                self.assertTrue(board.is_valid_guess(*guess))
+                shots.append(guess)
+                ai.record_result(guess, board.receive_shot(guess)[0])
+            self.assertEqual(ai.remaining, [])
+            games.append(shots)
+        self.assertEqual(games[0], games[1])
+
+    def test_sinking_removes_the_ship_length(self):
+        ai = AI(Board(), difficulty="Expert")
+        ai.record_result((2, 2), "hit")
+        ai.record_result((2, 3), "hit")
+        ai.record_result((2, 4), "sunk")
+        self.assertEqual(ai.sunk_cells, {(2, 2), (2, 3), (2, 4)})
+        self.assertEqual(sorted(ai.remaining), [2, 3, 4, 5])
+
+    def test_beats_hard_on_average(self):
+        totals = {"Hard": 0, "Expert": 0}
+        for seed in range(4):
+            for difficulty in totals:
+                rng = random.Random(seed)
+                board = random_board(rng)
+                totals[difficulty] += hunt(AI(board, difficulty=difficulty, rng=rng, budget_ms=None, samples=40), board)
+        self.assertLess(totals["Expert"], totals["Hard"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import asyncio
+import unittest
+
+from gui.netclient import NetworkClient
+from net.protocol import MAX_FRAME
+
+
+class TestNetworkClient(unittest.TestCase):
+
+    def _run_against(self, payload):
+        # a one-shot server that sends `payload` and then closes
+        received = []
+
+        async def serve(reader, writer):
+            await reader.readline()
+            writer.write(payload)
+            await writer.drain()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(serve, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                await NetworkClient("127.0.0.1", port, received.append).run({"type": "join"})
+
+        asyncio.run(main())
+        return received
+
+    def test_messages_then_clean_disconnect(self):
+        received = self._run_against(b'{"type":"joined","seat":0}\n')
+        self.assertEqual(received, [{"type": "joined", "seat": 0}, {"type": "disconnected", "reason": None}])
+
+    def test_malformed_frame_reports_its_reason(self):
+        received = self._run_against(b"not json\n")
+        self.assertEqual(received, [{"type": "error", "reason": "malformed frame"},
+                                    {"type": "disconnected", "reason": "malformed frame"}])
+
+    def test_oversized_frame_reports_its_reason(self):
+        received = self._run_against(b"x" * (MAX_FRAME * 2) + b"\n")
+        self.assertEqual(received[-1], {"type": "disconnected", "reason": "frame too large"})
+
+
+if __name__ == "__main__":
+    unittest.main()
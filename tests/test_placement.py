@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from game import placement
+from game.board import Board
+from game.probability import neighbours
+
+
+def fleet_cells(board):
+    return [set(ship.coordinates) for ship in board.ships]
+
+
+class TestLayouts(unittest.TestCase):
+
+    def test_symmetries_keep_layouts_legal(self):
+        layout = placement.load_pool()[0]
+        for k in range(8):
+            board = placement.apply(Board(), placement.transform(layout, k))
+            self.assertEqual(len(board.ships), 5)
+        self.assertEqual(placement.transform(layout, 0), layout)
+
+    def test_apply_rejects_touching_ships(self):
+        with self.assertRaises(ValueError):
+            placement.apply(Board(), ((0, 0, 'H'), (1, 0, 'H'), (3, 0, 'H'), (5, 0, 'H'), (7, 0, 'H')))
+
+    def test_annealing_beats_random_layouts(self):
+        rng = random.Random(1)
+        ranks = placement.hunters(rng, per_kind=2)
+        chosen, value = placement.anneal(rng, ranks, steps=400)
+        layout = placement.to_layout(chosen)
+        board = placement.apply(Board(), layout)
+        for i, ship in enumerate(fleet_cells(board)):
+            for other in fleet_cells(board)[i + 1:]:
+                self.assertFalse(other & (ship | set(neighbours(ship, 10))))
+        randoms = [placement.score(placement._numbers(placement.to_layout(placement._random_fleet(rng, 10))), ranks)
+                   for _ in range(20)]
+        self.assertGreater(value, max(randoms))
+
+
+class TestPool(unittest.TestCase):
+
+    def test_shipped_pool_fits_the_fleet(self):
+        pool = placement.load_pool()
+        self.assertGreaterEqual(len(pool), 50)
+        for layout in pool:
+            placement.apply(Board(), layout)
+
+    def test_pool_has_no_symmetric_duplicates(self):
+        pool = placement.load_pool()
+        self.assertEqual(len({placement.canonical(layout) for layout in pool}), len(pool))
+        small = placement.build_pool(3, seed=2, steps=50)
+        self.assertEqual(len({placement.canonical(layout) for layout, _ in small}), len(small))
+
+    def test_canonical_ignores_symmetries(self):
+        layout = placement.load_pool()[0]
+        self.assertEqual({placement.canonical(placement.transform(layout, k)) for k in range(8)},
+                         {placement.canonical(layout)})
+        # Cruiser and Submarine swapped: the same ships on the same cells
+        swapped = layout[:2] + (layout[3], layout[2]) + layout[4:]
+        self.assertEqual(placement.canonical(swapped), placement.canonical(layout))
+
+    def test_pool_does_not_crowd_the_border(self):
+        cells = [cell for layout in placement.load_pool() for ship in placement.layout_cells(layout)
+                 for cell in ship]
+        border = sum(1 for r, c in cells if r in (0, 9) or c in (0, 9))
+        self.assertLess(border / len(cells), 0.5)
+
+    def test_place_fleet_falls_back_without_a_pool(self):
+        self.assertEqual(placement.load_pool("/nonexistent/layouts.json"), [])
+        board = placement.place_fleet(Board(rng=random.Random(2)), random.Random(3))
+        self.assertEqual(len(board.ships), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from gui import playback
+
+
+class FakeWidget:
+    def __init__(self, path):
+        self.path = path
+
+    def __str__(self):
+        return self.path
+
+    def winfo_exists(self):
+        return True
+
+
+class FakeRoot:
+    def __init__(self):
+        self.bindings = {}
+
+    def bind_all(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+
+class TestRoles(unittest.TestCase):
+
+    def test_registered_widget_is_found_by_role(self):
+        widget = FakeWidget(".!frame.!canvas3")
+        playback.register(widget, "palette:2")
+        self.assertEqual(playback.role_of(widget), "palette:2")
+        self.assertIs(playback.find(None, "palette:2"), widget)
+
+    def test_unregistered_widget_falls_back_to_path(self):
+        self.assertEqual(playback.role_of(FakeWidget(".")), ".")
+        self.assertIsNone(playback.find(None, "no_such_role"))
+
+
+class TestScript(unittest.TestCase):
+
+    def test_recorded_events_round_trip(self):
+        root = FakeRoot()
+        recorder = playback.Recorder(root)
+        board = FakeWidget(".!frame.!boardcanvas.!canvas")
+        playback.register(board, "player_board")
+        root.bindings["<ButtonPress-1>"](SimpleNamespace(widget=board, x=60, y=95))
+        root.bindings["<KeyPress>"](SimpleNamespace(widget=FakeWidget("."), keysym="o"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = recorder.save(os.path.join(tmp, "game.json"))
+            events = playback.load(path)
+        self.assertEqual([e["type"] for e in events], ["click", "key"])
+        self.assertEqual(events[0]["t"], 0.0)
+        self.assertEqual((events[0]["role"], events[0]["x"], events[0]["y"]), ("player_board", 60, 95))
+        self.assertEqual((events[1]["role"], events[1]["keysym"]), (".", "o"))
+        self.assertGreaterEqual(events[1]["t"], events[0]["t"])
+
+    def test_unknown_version_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "old.json")
+            with open(path, "w") as fh:
+                json.dump({"version": 99, "events": []}, fh)
+            with self.assertRaises(ValueError):
+                playback.load(path)
+
+
+class TestSummary(unittest.TestCase):
+
+    def test_percentiles_per_target(self):
+        player = playback.Player(None)
+        player.results = [{"type": "click", "role": f"palette:{i % 5}", "latency_ms": float(i)} for i in range(1, 21)]
+        player.results.append({"type": "click", "role": "ai_board", "latency_ms": 7.0})
+        summary = player.summary()
+        self.assertEqual(sorted(summary), ["ai_board", "palette"])
+        self.assertEqual(summary["palette"]["count"], 20)
+        self.assertEqual(summary["palette"]["p50"], 11.0)
+        self.assertEqual(summary["palette"]["p95"], 20.0)
+        self.assertEqual(summary["ai_board"]["max"], 7.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from game.board import Board
+from game.probability import board_probabilities, neighbours, placement_probabilities, placements
+
+
+class TestPlacements(unittest.TestCase):
+
+    def test_counts(self):
+        # a ship of length L fits (size - L + 1) * size ways per orientation
+        self.assertEqual(len(placements(10, 5)), 2 * 6 * 10)
+        self.assertEqual(len(placements(10, 1)), 2 * 100)
+
+    def test_halo_excludes_ship(self):
+        cells, halo = placements(10, 2)[0]
+        self.assertEqual(cells, ((0, 0), (0, 1)))
+        self.assertEqual(set(halo), {(0, 2), (1, 0), (1, 1), (1, 2)})
+
+    def test_neighbours_clip_to_board(self):
+        self.assertEqual(len(neighbours([(5, 5)], 10)), 8)
+        self.assertEqual(len(neighbours([(0, 0)], 10)), 3)
+
+
+class TestPlacementProbabilities(unittest.TestCase):
+
+    def test_empty_board_peaks_in_the_middle(self):
+        grid = placement_probabilities(10, [3], set(), set())
+        self.assertGreater(grid[4][4], grid[0][0])
+        self.assertAlmostEqual(grid[4][4], grid[5][5])
+
+    def test_shot_cells_are_zero(self):
+        grid = placement_probabilities(10, [3, 2], {(0, 0)}, {(5, 5)})
+        self.assertEqual(grid[0][0], 0.0)
+        self.assertEqual(grid[5][5], 0.0)
+
+    def test_hit_pulls_mass_to_its_neighbours(self):
+        grid = placement_probabilities(10, [3], set(), {(5, 5)})
+        self.assertGreater(grid[5][6], 10 * grid[0][0])
+        # diagonal cells cannot hold the ship that was hit
+        self.assertEqual(grid[6][6], 0.0)
+
+    def test_sunk_ship_and_halo_are_blocked(self):
+        sunk = [(0, 0), (0, 1)]
+        grid = placement_probabilities(10, [3], set(), set(sunk), sunk)
+        for (r, c) in [(0, 2), (1, 0), (1, 1), (1, 2)]:
+            self.assertEqual(grid[r][c], 0.0)
+
+    def test_values_are_clipped(self):
+        grid = placement_probabilities(3, [3, 3, 3], set(), set())
+        self.assertTrue(all(0.0 <= v <= 1.0 for row in grid for v in row))
+
+
+class TestBoardProbabilities(unittest.TestCase):
+
+    def test_uses_remaining_fleet(self):
+        board = Board()
+        board.place_ships_randomly()
+        grid = board_probabilities(board)
+        self.assertEqual(len(grid), board.size)
+        self.assertGreater(sum(map(sum, grid)), 0.0)
+        for ship in board.ships:
+            for cell in ship.coordinates:
+                board.receive_shot(cell)
+        self.assertEqual(sum(map(sum, board_probabilities(board))), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from game.simulation import play_game, run_batch, summarize
+from utils.profiling import category, collapse, label
+
+
+class TestCategories(unittest.TestCase):
+
+    def test_game_modules_map_to_categories(self):
+        self.assertEqual(category(("/x/src/game/board.py", 59, "receive_shot")), "Board")
+        self.assertEqual(category(("/x/src/game/ai.py", 18, "make_guess")), "AI")
+        self.assertEqual(category(("/x/src/game/simulation.py", 50, "play_game")), "engine")
+        self.assertIsNone(category(("~", 0, "<built-in method builtins.len>")))
+
+    def test_labels_never_contain_the_separator(self):
+        self.assertEqual(label(("/x/a.py", 3, "f;g")), "f,g (a.py:3)")
+
+
+class TestProfiledBatch(unittest.TestCase):
+
+    def test_sampled_games_are_profiled_and_collapsed(self):
+        seeds = range(6)
+        results, stats = run_batch(seeds, ("Easy", "Hard"), workers=2, chunk_size=2, profile_every=3)
+        self.assertEqual([r.seed for r in results], list(seeds))
+        self.assertEqual(repr(results[4]), repr(play_game(4, ("Easy", "Hard"))))
+        self.assertEqual(summarize(results)["games"], 6)
+        # seeds 0 and 3 were traced, in different chunks and possibly different workers
+        play = [func for func in stats.stats if func[2] == "play_game"]
+        self.assertEqual(stats.stats[play[0]][1], 2)
+
+        stacks, totals = collapse(stats, by_category=True)
+        self.assertTrue({"Board", "AI", "engine"} <= set(totals))
+        self.assertTrue(all(key.split(";")[1].startswith("play_game") for key in stacks
+                            if not key.startswith("other")))
+        # rebuilt stacks account for (nearly) all of the traced self time
+        traced_us = sum(entry[2] for entry in stats.stats.values()) * 1e6
+        self.assertAlmostEqual(sum(stacks.values()) / traced_us, 1.0, delta=0.05)
+
+    def test_no_profile_unless_asked(self):
+        _, stats = run_batch(range(3), workers=1)
+        self.assertIsNone(stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from game.board import Board
+from game.ship import Ship
+from net.match import Match, MatchError
+from net.protocol import MAX_FRAME, encode, read_message
+from net.server import GameServer
+
+
+def _fixed_match():
+    boards = (Board(), Board())
+    for board in boards:
+        board.place_ship(Ship("Destroyer", 2, [], "D"), (0, 0), 'H')
+    return Match(1, boards)
+
+
+class TestMatch(unittest.TestCase):
+
+    def test_miss_passes_turn(self):
+        match = _fixed_match()
+        self.assertEqual(match.fire(0, 5, 5), ("miss", None))
+        self.assertEqual(match.turn, 1)
+        with self.assertRaises(MatchError):
+            match.fire(0, 5, 6)
+
+    def test_hit_keeps_turn_and_sinking_fleet_wins(self):
+        match = _fixed_match()
+        self.assertEqual(match.fire(0, 0, 0), ("hit", "Destroyer"))
+        self.assertEqual(match.turn, 0)
+        self.assertEqual(match.fire(0, 0, 1), ("sunk", "Destroyer"))
+        self.assertEqual(match.winner, 0)
+        with self.assertRaises(MatchError):
+            match.fire(0, 1, 1)
+
+    def test_repeat_shot_rejected(self):
+        match = _fixed_match()
+        match.fire(0, 0, 0)
+        with self.assertRaises(MatchError):
+            match.fire(0, 0, 0)
+
+
+class TestGameServer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = os.path.join(self.tmp.name, "sessions")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_two_clients_play_a_shot(self):
+        async def scenario():
+            server = await GameServer(port=0, store_path=self.store).start()
+            try:
+                a = await asyncio.open_connection("127.0.0.1", server.port, limit=MAX_FRAME)
+                b = await asyncio.open_connection("127.0.0.1", server.port, limit=MAX_FRAME)
+                a[1].write(encode({"type": "join"}))
+                joined_a = await read_message(a[0])
+                b[1].write(encode({"type": "join"}))
+                joined_b = await read_message(b[0])
+                self.assertEqual((joined_a["seat"], joined_b["seat"]), (0, 1))
+                self.assertEqual(len(joined_a["fleet"]), 5)
+                self.assertEqual((await read_message(a[0]))["type"], "start")
+                self.assertEqual((await read_message(b[0]))["type"], "start")
+
+                b[1].write(encode({"type": "fire", "row": 0, "col": 0}))
+                self.assertEqual((await read_message(b[0]))["reason"], "not your turn")
+
+                a[1].write(encode({"type": "fire", "row": 0, "col": 0}))
+                shot_a = await read_message(a[0])
+                shot_b = await read_message(b[0])
+                self.assertEqual(shot_a, shot_b)
+                self.assertEqual(shot_a["type"], "shot")
+                self.assertEqual(server.stats()["resident"], 1)
+
+                a[1].close()
+                self.assertEqual((await read_message(b[0]))["type"], "opponent_away")
+                b[1].close()
+            finally:
+                await server.close()
+
+        asyncio.run(scenario())
+
+    def test_spectator_gets_snapshot_then_events(self):
+        async def scenario():
+            server = await GameServer(port=0, store_path=self.store).start()
+            try:
+                a = await asyncio.open_connection("127.0.0.1", server.port, limit=MAX_FRAME)
+                b = await asyncio.open_connection("127.0.0.1", server.port, limit=MAX_FRAME)
+                a[1].write(encode({"type": "join"}))
+                joined_a = await read_message(a[0])
+                b[1].write(encode({"type": "join"}))
+                await read_message(b[0])
+                await read_message(a[0])
+
+                w = await asyncio.open_connection("127.0.0.1", server.port, limit=MAX_FRAME)
+                w[1].write(encode({"type": "watch", "match": joined_a["match"]}))
+                snap = await read_message(w[0])
+                self.assertEqual(snap["type"], "snapshot")
+                self.assertEqual(snap["turn"], 0)
+                self.assertEqual(server.stats()["spectators"], 1)
+
+                a[1].write(encode({"type": "fire", "row": 3, "col": 3}))
+                shot = await read_message(a[0])
+                self.assertEqual(await read_message(w[0]), shot)
+                for conn in (a, b, w):
+                    conn[1].close()
+            finally:
+                await server.close()
+
+        asyncio.run(scenario())
+
+    def test_resume_after_hibernation(self):
+        async def scenario():
+            server = await GameServer(port=0, store_path=self.store).start()
+            try:
+                a = await asyncio.open_connection("127.0.0.1", server.port, limit=MAX_FRAME)
+                b = await asyncio.open_connection("127.0.0.1", server.port, limit=MAX_FRAME)
+                a[1].write(encode({"type": "join"}))
+                joined_a = await read_message(a[0])
+                b[1].write(encode({"type": "join"}))
+                await read_message(b[0])
+                await read_message(a[0])
+                a[1].write(encode({"type": "fire", "row": 9, "col": 9}))
+                await read_message(a[0])
+
+                a[1].close()
+                b[1].close()
+                while server.connections:
+                    await asyncio.sleep(0.01)
+                self.assertEqual(server.stats()["hibernated"], 1)
+
+                c = await asyncio.open_connection("127.0.0.1", server.port, limit=MAX_FRAME)
+                c[1].write(encode({"type": "resume", "match": joined_a["match"], "token": "0" * 16}))
+                self.assertEqual((await read_message(c[0]))["reason"], "unknown session")
+                c[1].write(encode({"type": "resume", "match": joined_a["match"], "token": joined_a["token"]}))
+                resumed = await read_message(c[0])
+                self.assertEqual(resumed["seat"], 0)
+                self.assertEqual(resumed["fleet"], joined_a["fleet"])
+                self.assertEqual(len(resumed["shots"][0]), 1)
+                self.assertEqual(server.stats()["resident"], 1)
+                c[1].close()
+            finally:
+                await server.close()
+
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
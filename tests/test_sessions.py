@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+from net.sessions import SessionManager, pack_session, unpack_session
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSessionRecord(unittest.TestCase):
+
+    def test_round_trip_preserves_board_state(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        manager = SessionManager(os.path.join(tmp.name, "s"))
+        self.addCleanup(manager.close)
+        session = manager.create()
+        match = session.match
+        target = match.boards[1]
+        ship = target.ships[0]
+        match.fire(0, *ship.coordinates[0])
+        match.fire(0, *next((r, c) for r in range(10) for c in range(10) if target.grid[r][c] == ' '))
+
+        data = pack_session(session, 0.0)
+        self.assertLess(len(data), 128)
+        restored = unpack_session(match.match_id, data, 0.0)
+        self.assertEqual(restored.tokens, session.tokens)
+        self.assertEqual(restored.match.turn, match.turn)
+        for old, new in zip(match.boards, restored.match.boards):
+            self.assertEqual(old.grid, new.grid)
+            self.assertEqual(old.hits, new.hits)
+            self.assertEqual(old.misses, new.misses)
+            self.assertEqual([s.hits for s in old.ships], [s.hits for s in new.ships])
+
+
+class TestSessionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sessions")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lru_eviction_and_rehydration(self):
+        manager = SessionManager(self.path, max_resident=2, clock=self.clock)
+        ids = [manager.create().match.match_id for _ in range(3)]
+        self.assertEqual(manager.metrics()["resident"], 2)
+        self.assertEqual(manager.metrics()["hibernated"], 1)
+        self.assertFalse(manager.is_resident(ids[0]))
+        self.assertIsNotNone(manager.get(ids[0]))
+        self.assertTrue(manager.is_resident(ids[0]))
+        self.assertFalse(manager.is_resident(ids[1]))
+        self.assertEqual(manager.metrics()["rehydrations"], 1)
+        manager.close()
+
+    def test_idle_sweep_and_ttl(self):
+        manager = SessionManager(self.path, idle_seconds=10, ttl_seconds=3600, clock=self.clock)
+        first = manager.create().match.match_id
+        self.clock.now = 5
+        second = manager.create().match.match_id
+        self.clock.now = 12
+        self.assertEqual(manager.sweep()[0], 1)
+        self.assertTrue(manager.is_resident(second))
+        self.assertIn(first, manager)
+        manager.ttl_seconds = -1
+        manager.sweep()
+        self.assertNotIn(first, manager)
+        self.assertEqual(manager.metrics()["expired"], 1)
+        manager.close()
+
+    def test_store_survives_restart(self):
+        manager = SessionManager(self.path, clock=self.clock)
+        match_id = manager.create().match.match_id
+        manager.close()
+        reopened = SessionManager(self.path, clock=self.clock)
+        self.assertIn(match_id, reopened)
+        self.assertGreater(reopened.create().match.match_id, match_id)
+        reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
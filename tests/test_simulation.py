@@ -0,0 +1,28 @@
+import random
+import unittest
+
+from game.ai import AI
+from game.simulation import hunt, play_game, random_board
+
+
+class TestSimulation(unittest.TestCase):
+
+    def test_game_is_reproducible(self):
+        self.assertEqual(repr(play_game(42)), repr(play_game(42)))
+
+    def test_game_finishes_with_a_winner(self):
+        for seed in range(20):
+            result = play_game(seed, ("Easy", "Hard"))
+            self.assertIn(result.winner, (0, 1))
+            self.assertGreaterEqual(result.shots[result.winner], 17)
+
+    def test_hunt_sinks_the_fleet(self):
+        rng = random.Random(5)
+        board = random_board(rng)
+        shots = hunt(AI(board, difficulty="Hard", rng=rng), board)
+        self.assertTrue(board.all_ships_sunk())
+        self.assertEqual(shots, len(board.hits) + len(board.misses))
+
+
+if __name__ == '__main__':
+    unittest.main()
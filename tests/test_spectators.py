@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+
+from game.board import Board
+from game.ship import Ship
+from net.match import Match
+from net.sessions import bits_to_cells
+from net.spectators import SpectatorChannel, snapshot
+
+
+class StuckWriter:
+    """Writer whose drain never completes, like a watcher on a dead link."""
+
+    def __init__(self):
+        self.frames = []
+        self.closed = False
+        self._never = asyncio.Event()
+
+    def write(self, data):
+        self.frames.append(data)
+
+    async def drain(self):
+        await self._never.wait()
+
+    def close(self):
+        self.closed = True
+
+
+def _match():
+    boards = (Board(), Board())
+    for board in boards:
+        board.place_ship(Ship("Destroyer", 2, [], "D"), (0, 0), 'H')
+    return Match(7, boards)
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_snapshot_hides_unsunk_ships(self):
+        match = _match()
+        match.fire(0, 0, 0)
+        match.fire(0, 4, 4)
+        snap = snapshot(match)
+        target = snap["boards"][1]
+        self.assertEqual(bits_to_cells(bytes.fromhex(target["hits"]), 10), {(0, 0)})
+        self.assertEqual(bits_to_cells(bytes.fromhex(target["misses"]), 10), {(4, 4)})
+        self.assertEqual(target["sunk"], [])
+        match.fire(1, 0, 0)
+        match.fire(1, 0, 1)
+        self.assertEqual(snapshot(match)["boards"][0]["sunk"], [["Destroyer", [[0, 0], [0, 1]]]])
+
+
+class TestSpectatorChannel(unittest.TestCase):
+
+    def test_slow_watcher_is_resynced_then_dropped(self):
+        async def scenario():
+            match = _match()
+            channel = SpectatorChannel(lambda: match, queue_size=4, max_resyncs=2)
+            slow = channel.subscribe(StuckWriter())
+            await asyncio.sleep(0)
+            for i in range(20):
+                channel.publish({"type": "shot", "n": i})
+            self.assertEqual(channel.resynced, 2)
+            self.assertEqual(channel.dropped, 1)
+            self.assertTrue(slow.closed)
+            self.assertNotIn(slow, channel.subscribers)
+
+        asyncio.run(scenario())
+
+    def test_publish_reaches_every_watcher_without_waiting(self):
+        async def scenario():
+            match = _match()
+            channel = SpectatorChannel(lambda: match, queue_size=64)
+            subs = [channel.subscribe(StuckWriter()) for _ in range(50)]
+            for i in range(10):
+                channel.publish({"type": "shot", "n": i})
+            # snapshot plus ten events, nothing has been drained yet
+            self.assertTrue(all(sub.queue.qsize() == 11 for sub in subs))
+            channel.close()
+            self.assertEqual(channel.subscribers, set())
+
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
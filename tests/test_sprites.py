@@ -0,0 +1,78 @@
+import unittest
+
+from gui.sprites import SHIP_OUTLINE, SUNK, SpriteCache, peg_pixels, ship_pixels, transpose
+
+
+class TestSpritePixels(unittest.TestCase):
+
+    def test_ship_size_includes_shadow(self):
+        rows = ship_pixels(56, 22, 11, "#8c6a43")
+        self.assertEqual((len(rows[0]), len(rows)), (63, 33))
+        flat = ship_pixels(56, 22, 11, "#8c6a43", shadow=False)
+        self.assertEqual((len(flat[0]), len(flat)), (57, 23))
+
+    def test_hull_is_outlined_and_corners_transparent(self):
+        rows = ship_pixels(56, 22, 11, "#8c6a43", shadow=False)
+        self.assertIsNone(rows[0][0])
+        self.assertEqual(rows[0][28], SHIP_OUTLINE)
+        self.assertEqual(rows[4][10], "#8c6a43")
+
+    def test_sunk_state_repaints_the_hull(self):
+        rows = ship_pixels(56, 22, 11, "#8c6a43", state="sunk")
+        colours = {p for row in rows for p in row if p is not None}
+        self.assertEqual(colours, {SUNK, SHIP_OUTLINE})
+
+    def test_vertical_sprite_is_the_transpose(self):
+        rows = ship_pixels(56, 22, 11, "#8c6a43")
+        vertical = transpose(rows)
+        self.assertEqual((len(vertical[0]), len(vertical)), (len(rows), len(rows[0])))
+        self.assertEqual(vertical[5][3], rows[3][5])
+
+    def test_pegs(self):
+        hit = peg_pixels("hit", 6.8)
+        self.assertIn("white", {p for row in hit for p in row})
+        miss = peg_pixels("miss", 4.76)
+        self.assertNotIn("white", {p for row in miss for p in row})
+        self.assertEqual(len(hit), len(hit[0]))
+
+
+class _Board:
+    pass
+
+
+class TestSpriteCacheSizes(unittest.TestCase):
+
+    def test_unused_sizes_are_dropped(self):
+        cache = SpriteCache(None)
+        a, b = _Board(), _Board()
+        cache.use_cell(a, 34)
+        cache.use_cell(b, 34)
+        cache._images.update({
+            ("ship", 3, 'H', "#fff", 34, "normal"): object(),
+            ("peg", "hit", 34, 1.0): object(),
+            ("preview", 3, "#fff", 28): object(),
+        })
+        cache.use_cell(a, 40)
+        # b still draws at 34
+        self.assertEqual(len(cache), 3)
+        cache.use_cell(b, 40)
+        # 34 is one of the last two sizes used, so it is kept for a while
+        self.assertEqual(len(cache), 3)
+        cache.use_cell(a, 50)
+        cache.use_cell(b, 50)
+        self.assertEqual(list(cache._images), [("preview", 3, "#fff", 28)])
+
+    def test_forgotten_boards_release_their_size(self):
+        cache = SpriteCache(None)
+        a, b = _Board(), _Board()
+        cache.use_cell(a, 34)
+        cache.use_cell(b, 20)
+        cache._images[("peg", "miss", 20, 1.0)] = object()
+        del b
+        cache.use_cell(a, 40)
+        cache.use_cell(a, 34)
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
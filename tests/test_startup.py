@@ -0,0 +1,19 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+class TestLazyStartup(unittest.TestCase):
+
+    def test_game_modules_load_on_start_only(self):
+        code = "import sys, main; print(sorted(m for m in ('gui.app', 'game.ai', 'gui.widgets') if m in sys.modules))"
+        env = dict(os.environ, PYTHONPATH=SRC)
+        out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from game.simulation import play_games, tally
+from net.protocol import MAX_FRAME, encode, read_message
+from net.sweep import Coordinator, run_worker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCoordinator(unittest.TestCase):
+
+    def test_ranges_cover_the_seeds(self):
+        c = Coordinator(100, 25, 10)
+        msgs = [c.assign(object()) for _ in range(3)]
+        self.assertEqual([(m["start"], m["stop"]) for m in msgs], [(100, 110), (110, 120), (120, 125)])
+        self.assertEqual(c.assign(object())["type"], "wait")
+
+    def test_lost_and_late_ranges_are_reassigned_and_counted_once(self):
+        clock = FakeClock()
+        c = Coordinator(0, 20, 10, lease_seconds=30.0, clock=clock)
+        lost, slow = object(), object()
+        self.assertEqual(c.assign(lost)["id"], 0)
+        self.assertEqual(c.assign(slow)["id"], 1)
+        self.assertEqual(c.release(lost), [0])
+        clock.now = 31.0
+        self.assertEqual(c.assign(object())["id"], 1)    # the slow worker's lease ran out
+        self.assertEqual(c.assign(object())["id"], 0)
+        counters = {"games": 10, "wins": [6, 4], "unfinished": 0, "winner_shots": 500, "turns": 90}
+        self.assertTrue(c.record(1, counters))
+        self.assertFalse(c.record(1, counters))          # the slow worker reports too
+        c.record(0, counters)
+        self.assertEqual(c.reassigned, 2)
+        self.assertEqual(c.totals["games"], 20)
+        self.assertEqual(c.totals["wins"], [12, 8])
+        self.assertEqual(c.assign(object())["type"], "done")
+
+    def test_progress_renews_only_the_owners_lease(self):
+        clock = FakeClock()
+        c = Coordinator(0, 10, 10, lease_seconds=30.0, clock=clock)
+        owner = object()
+        self.assertEqual(c.assign(owner)["id"], 0)
+        clock.now = 20.0
+        self.assertTrue(c.renew(0, owner))
+        self.assertFalse(c.renew(0, object()))
+        self.assertFalse(c.renew(5, owner))
+        clock.now = 45.0
+        self.assertEqual(c.expire(), [])
+        clock.now = 51.0
+        self.assertEqual(c.expire(), [0])
+
+    def test_bad_results_are_ignored(self):
+        c = Coordinator(0, 20, 10)
+        counters = {"games": 10, "wins": [6, 4], "unfinished": 0, "winner_shots": 500, "turns": 90}
+        self.assertEqual(c.assign(object())["id"], 0)
+        self.assertFalse(c.record(1, counters))          # never handed out
+        self.assertFalse(c.record(7, counters))          # out of range
+        self.assertFalse(c.record(None, counters))
+        self.assertFalse(c.record(0, None))
+        self.assertFalse(c.record(0, dict(counters, wins=[6])))
+        self.assertFalse(c.record(0, dict(counters, games=-1)))
+        self.assertEqual(c.totals["games"], 0)
+        self.assertEqual(c.progress(), (0, 2))
+        self.assertTrue(c.record(0, counters))
+
+    def test_checkpoint_resumes_remaining_ranges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sweep.json")
+            first = Coordinator(0, 40, 10, checkpoint=path)
+            for _ in range(2):
+                msg = first.assign(object())
+                first.record(msg["id"], tally(play_games(range(msg["start"], msg["stop"]))))
+            first.assign(object())                        # in flight when the coordinator dies
+
+            again = Coordinator(0, 40, 10, checkpoint=path)
+            self.assertEqual(again.progress(), (2, 4))
+            self.assertEqual(sorted(again.pending), [2, 3])
+            self.assertEqual(again.totals["games"], 20)
+            with self.assertRaises(ValueError):
+                Coordinator(0, 40, 20, checkpoint=path)
+
+
+class TestSweep(unittest.TestCase):
+
+    def test_end_to_end_with_a_lost_worker(self):
+        async def flaky(port):
+            # takes a range and disappears without reporting it
+            reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=MAX_FRAME)
+            writer.write(encode({"type": "next"}))
+            msg = await read_message(reader)
+            writer.close()
+            return msg["id"]
+
+        async def run():
+            coordinator = Coordinator(0, 60, 10, difficulties=("Easy", "Hard"))
+            ready = asyncio.get_running_loop().create_future()
+            serving = asyncio.ensure_future(coordinator.serve("127.0.0.1", 0, started=ready.set_result))
+            port = await ready
+            lost = await flaky(port)
+            played = await asyncio.gather(run_worker("127.0.0.1", port), run_worker("127.0.0.1", port))
+            return coordinator, lost, played, await serving
+
+        coordinator, lost, played, totals = asyncio.run(run())
+        self.assertEqual(lost, 0)
+        self.assertEqual(sum(played), 6)
+        self.assertEqual(coordinator.reassigned, 1)
+        self.assertEqual(totals, tally(play_games(range(60), ("Easy", "Hard"))))
+
+
+    def test_heartbeats_keep_a_long_range(self):
+        async def run():
+            # three Expert games outlast the lease and the coordinator's one-second
+            # expiry check; progress messages keep the range assigned
+            coordinator = Coordinator(0, 3, 3, difficulties=("Expert", "Hard"), lease_seconds=0.3)
+            ready = asyncio.get_running_loop().create_future()
+            serving = asyncio.ensure_future(coordinator.serve("127.0.0.1", 0, started=ready.set_result))
+            port = await ready
+            played = await run_worker("127.0.0.1", port, heartbeat=0.05)
+            return coordinator, played, await serving
+
+        coordinator, played, totals = asyncio.run(run())
+        self.assertEqual(played, 1)
+        self.assertEqual(coordinator.reassigned, 0)
+        self.assertEqual(totals["games"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import multiprocessing
+import unittest
+
+from game import montecarlo, tables
+from game.simulation import play_game
+
+
+def _attached_tables(name):
+    montecarlo._tables.clear()
+    tables.attach(name)
+    installed = {key: (type(montecarlo._tables[key]).__name__, tuple(montecarlo._tables[key]) == montecarlo.build_masks(*key))
+                 for key in montecarlo._tables}
+    tables.detach()
+    return installed
+
+
+class TestTables(unittest.TestCase):
+
+    def test_round_trip(self):
+        decoded = tables.decode(memoryview(tables.encode(10, (2, 5))))
+        self.assertEqual(sorted(decoded), [(10, 2), (10, 5)])
+        self.assertEqual(tuple(decoded[(10, 5)]), montecarlo.build_masks(10, 5))
+        self.assertEqual(decoded[(10, 2)][-1], montecarlo.build_masks(10, 2)[-1])
+        self.assertEqual(len(decoded[(10, 2)]), len(montecarlo.build_masks(10, 2)))
+
+    def test_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            tables.decode(b"\0" * 64)
+
+    def test_workers_attach_to_published_block(self):
+        with tables.publish() as shared:
+            with multiprocessing.get_context("fork").Pool(1) as pool:
+                installed = pool.apply(_attached_tables, (shared.name,))
+        self.assertEqual(sorted(installed), [(10, length) for length in tables.LENGTHS])
+        # the worker reads the shared block in place rather than holding a copy
+        self.assertEqual(set(installed.values()), {("PlacementView", True)})
+        self.assertIsNone(shared.shm)
+
+    def test_expert_games_are_reproducible(self):
+        self.assertEqual(repr(play_game(5, ("Expert", "Hard"))), repr(play_game(5, ("Expert", "Hard"))))
+
+
+if __name__ == '__main__':
+    unittest.main()
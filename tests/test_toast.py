@@ -0,0 +1,44 @@
+import unittest
+
+from gui.toast import Notification, NotificationQueue
+
+
+class TestNotification(unittest.TestCase):
+
+    def test_repeats_are_counted(self):
+        n = Notification("invalid_move", "warning")
+        for _ in range(3):
+            n.add("You already shot there")
+        self.assertEqual(n.render(), "You already shot there (x3)")
+
+    def test_overflow_is_summarized(self):
+        n = Notification("ai_sunk", "warning")
+        for name in ("Destroyer", "Submarine", "Cruiser", "Battleship", "Carrier"):
+            n.add(f"AI sunk your {name}!")
+        lines = n.render(max_lines=3).split("\n")
+        self.assertEqual(lines[0], "AI sunk your Destroyer!")
+        self.assertEqual(lines[-1], "+2 more")
+
+
+class TestNotificationQueue(unittest.TestCase):
+
+    def test_same_key_joins_queued_entry(self):
+        q = NotificationQueue()
+        q.push("You sunk my Destroyer!", key="player_sunk")
+        q.push("Finish placing your ships first.", "warning", key="placement")
+        q.push("You sunk my Cruiser!", key="player_sunk")
+        self.assertEqual(len(q), 2)
+        first = q.pop()
+        self.assertEqual(first.render(), "You sunk my Destroyer!\nYou sunk my Cruiser!")
+        self.assertEqual(q.pop().kind, "warning")
+        self.assertIsNone(q.pop())
+
+    def test_messages_without_key_stay_separate(self):
+        q = NotificationQueue()
+        q.push("one")
+        q.push("one")
+        self.assertEqual(len(q), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()